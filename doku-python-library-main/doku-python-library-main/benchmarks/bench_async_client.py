@@ -0,0 +1,53 @@
+import support
+
+import asyncio
+import time
+
+from doku_python_library.src.async_snap import AsyncDokuSNAP
+from doku_python_library.src.model.va.check_status_va_request import CheckStatusRequest
+from doku_python_library.src.snap import DokuSNAP
+
+CALLS = 200
+WORKERS = 20
+LATENCY = 0.02
+
+
+def check_status_request(index: int) -> CheckStatusRequest:
+    customer_no: str = str(index).zfill(20)
+    return CheckStatusRequest(partner_service_id="  888994", customer_no=customer_no, virtual_acc_no="  888994" + customer_no)
+
+
+def run_sync(private_key: str, public_key: str) -> float:
+    snap = DokuSNAP(private_key, "client-id", False, public_key, "issuer", "secret", public_key, lazy_token=True)
+    snap.warm_up()
+    started: float = time.perf_counter()
+    for index in range(CALLS):
+        assert snap.check_status_va(check_status_request(index)).response_code == "2002600"
+    elapsed: float = time.perf_counter() - started
+    snap.close()
+    return elapsed
+
+
+async def run_async(private_key: str, public_key: str) -> float:
+    snap = AsyncDokuSNAP(private_key, "client-id", False, public_key, "issuer", "secret", public_key, max_workers=WORKERS)
+    await snap.warm_up()
+    started: float = time.perf_counter()
+    responses: list = await asyncio.gather(*(snap.check_status_va(check_status_request(index)) for index in range(CALLS)))
+    elapsed: float = time.perf_counter() - started
+    assert all(response.response_code == "2002600" for response in responses)
+    await snap.close()
+    return elapsed
+
+
+def main() -> None:
+    private_key, public_key = support.key_pair()
+    with support.MockSnapServer(delay=LATENCY):
+        sync_elapsed: float = run_sync(private_key, public_key)
+        async_elapsed: float = asyncio.run(run_async(private_key, public_key))
+    print("{calls} check_status_va calls, {latency:.0f} ms server latency".format(calls=CALLS, latency=LATENCY * 1e3))
+    print("DokuSNAP sequential          {rate:7.0f} req/s".format(rate=CALLS / sync_elapsed))
+    print("AsyncDokuSNAP gather, {workers} workers {rate:7.0f} req/s".format(workers=WORKERS, rate=CALLS / async_elapsed))
+
+
+if __name__ == "__main__":
+    main()
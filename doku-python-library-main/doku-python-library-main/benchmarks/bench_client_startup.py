@@ -0,0 +1,34 @@
+import support
+
+import time
+
+from doku_python_library.src.snap import DokuSNAP
+
+CLIENTS = 50
+
+
+def construct(private_key: str, public_key: str, lazy_token: bool) -> float:
+    started: float = time.perf_counter()
+    clients: list = [
+        DokuSNAP(private_key, "client-id", False, public_key, "issuer", "secret", public_key, lazy_token=lazy_token)
+        for _ in range(CLIENTS)
+    ]
+    elapsed: float = (time.perf_counter() - started) / CLIENTS
+    for client in clients:
+        client.close()
+    return elapsed
+
+
+def main() -> None:
+    private_key, public_key = support.key_pair()
+    with support.MockSnapServer():
+        construct(private_key, public_key, True)
+        eager: float = construct(private_key, public_key, False)
+        lazy: float = construct(private_key, public_key, True)
+    print("DokuSNAP construction, {clients} clients against a local mock".format(clients=CLIENTS))
+    print("eager token fetch  {cost:7.3f} ms per client".format(cost=eager * 1e3))
+    print("lazy_token=True    {cost:7.3f} ms per client".format(cost=lazy * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import support
+
+import base64
+import hashlib
+import hmac
+import json
+
+from doku_python_library.src.services.hmac_signer import HmacSigner
+
+SECRET = "a" * 32
+ENDPOINT = "/direct-debit/core/v1/debit/payment-host-to-host"
+TOKEN = "eyJhbGciOiJSUzI1NiJ9." + "x" * 300
+TIMESTAMP = "2026-10-18T10:00:00+07:00"
+
+
+def sign_with_new_hmac(body: bytes) -> str:
+    string_to_sign: str = "{method}:{url}:{token}:{request_body}:{timestamp}".format(
+        method="POST", url=ENDPOINT, token=TOKEN, request_body=hashlib.sha256(body).hexdigest().lower(), timestamp=TIMESTAMP)
+    return base64.b64encode(hmac.new(SECRET.encode("utf-8"), msg=string_to_sign.encode("utf-8"), digestmod=hashlib.sha512).digest()).decode()
+
+
+def main() -> None:
+    signer: HmacSigner = HmacSigner.for_endpoint(SECRET, "POST", ENDPOINT)
+    print("HMAC-SHA512 request signature, best of 20")
+    for size in (10, 108, 1008, 10008):
+        body: bytes = json.dumps({"k": "v" * (size - 8)}, separators=(',', ':')).encode("utf-8")
+        assert sign_with_new_hmac(body) == signer.sign(TOKEN, body, TIMESTAMP)
+        number: int = 20000 if size < 5000 else 5000
+        before: float = support.best_of(lambda: sign_with_new_hmac(body), number, repeat=20)
+        after: float = support.best_of(lambda: signer.sign(TOKEN, body, TIMESTAMP), number, repeat=20)
+        print("{size:6d} B body: hmac.new {before}   HmacSigner {after}   ({ratio:.2f}x)".format(
+            size=len(body), before=support.format_us(before), after=support.format_us(after), ratio=before / after))
+
+
+if __name__ == "__main__":
+    main()
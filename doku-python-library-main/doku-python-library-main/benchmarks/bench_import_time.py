@@ -0,0 +1,29 @@
+import support
+
+import statistics
+import subprocess
+import sys
+
+RUNS = 7
+STATEMENTS = [
+    "import doku_python_library",
+    "from doku_python_library import DokuSNAP",
+    "from doku_python_library import CreateVARequest"
+]
+
+
+def cold_import(statement: str) -> float:
+    code: str = "import time; started = time.perf_counter(); {statement}; print(time.perf_counter() - started)".format(statement=statement)
+    output: str = subprocess.check_output([sys.executable, "-c", code], cwd=support.ROOT)
+    return float(output)
+
+
+def main() -> None:
+    print("cold import, median of {runs} interpreters".format(runs=RUNS))
+    for statement in STATEMENTS:
+        median: float = statistics.median(cold_import(statement) for _ in range(RUNS))
+        print("{statement:50s} {cost:8.1f} ms".format(statement=statement, cost=median * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import support
+
+import base64
+import hashlib
+import hmac
+import json
+
+from doku_python_library.src.commons.json_codec import JsonCodec
+from doku_python_library.src.model.direct_debit.payment_additional_info_request import PaymentAdditionalInfoRequest
+from doku_python_library.src.model.direct_debit.payment_request import PaymentRequest
+from doku_python_library.src.model.va.total_amount import TotalAmount
+from doku_python_library.src.services.token_service import TokenService
+
+ENDPOINT = "/direct-debit/core/v1/debit/payment-host-to-host"
+
+
+def payment_request(line_items: int) -> PaymentRequest:
+    items: list = [
+        {"name": "Item {index} kaos polos".format(index=index), "price": "{price}.00".format(price=1000 + index), "quantity": str(index % 5 + 1)}
+        for index in range(line_items)
+    ]
+    return PaymentRequest(
+        partner_reference_no="ref" + "1" * 20,
+        amount=TotalAmount("150000.00", "IDR"),
+        additional_info=PaymentAdditionalInfoRequest(
+            channel="DIRECT_DEBIT_BRI_SNAP", remarks="remarks", success_payment_url="https://www.doku.com/s",
+            failed_payment_url="https://www.doku.com/f", line_items=items, payment_type="SALE"
+        )
+    )
+
+
+def serialize_twice(request: PaymentRequest) -> tuple:
+    body_hash: str = hashlib.sha256(json.dumps(request.create_request_body(), separators=(',', ':')).encode("utf-8")).hexdigest().lower()
+    string_to_sign: str = "POST:{endpoint}:token:{body_hash}:timestamp".format(endpoint=ENDPOINT, body_hash=body_hash)
+    signature: str = base64.b64encode(hmac.new(b"secret", msg=string_to_sign.encode("utf-8"), digestmod=hashlib.sha512).digest()).decode()
+    return signature, json.dumps(request.create_request_body(), allow_nan=False).encode("utf-8")
+
+
+def serialize_once(request: PaymentRequest) -> tuple:
+    body: bytes = JsonCodec.dumps(request.create_request_body())
+    return TokenService.generate_body_signature("POST", ENDPOINT, "token", body, "timestamp", "secret"), body
+
+
+def main() -> None:
+    backends: list = ["json"]
+    try:
+        import orjson
+        backends.append("orjson")
+    except ImportError:
+        pass
+    print("sign + serialize a direct debit payment body, requests/s, best of 5")
+    for line_items in (10, 100, 1000):
+        request: PaymentRequest = payment_request(line_items)
+        number: int = max(20000 // (line_items * 5), 20)
+        JsonCodec.set_backend("json")
+        size: int = len(serialize_once(request)[1])
+        results: list = ["twice {rate:7.0f}".format(rate=1 / support.best_of(lambda: serialize_twice(request), number))]
+        for backend in backends:
+            JsonCodec.set_backend(backend)
+            assert serialize_once(request)[0] == serialize_twice(request)[0]
+            results.append("once/{backend} {rate:7.0f}".format(backend=backend, rate=1 / support.best_of(lambda: serialize_once(request), number)))
+        print("{items:5d} line items ({size:3.0f} KiB): {results}".format(items=line_items, size=size / 1024, results="   ".join(results)))
+    JsonCodec.set_backend("json")
+
+
+if __name__ == "__main__":
+    main()
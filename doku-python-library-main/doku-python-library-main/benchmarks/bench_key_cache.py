@@ -0,0 +1,44 @@
+import support
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+
+from doku_python_library.src.services.signature_verifier import SignatureVerifier
+from doku_python_library.src.services.token_service import TokenService
+
+
+def main() -> None:
+    private_key, public_key = support.key_pair()
+    string_to_sign: str = "client-id|2026-10-18T10:00:00Z"
+    signature: str = TokenService.create_signature(private_key, string_to_sign)
+    token: str = TokenService.generate_token(900, "issuer", private_key, "client-id")
+
+    def sign_reparsing_pem() -> str:
+        return TokenService.sign_with_key(serialization.load_pem_private_key(private_key.encode("utf-8"), password=None), string_to_sign)
+
+    def verify_reparsing_pem() -> None:
+        SignatureVerifier(public_key).verify_signature(string_to_sign, signature)
+
+    def decode_reparsing_pem() -> dict:
+        return jwt.decode(token, SignatureVerifier.parse_public_key(public_key), algorithms=["RS256"])
+
+    assert sign_reparsing_pem() == TokenService.create_signature(private_key, string_to_sign)
+    assert TokenService.compare_signatures(string_to_sign, signature, public_key)
+    assert decode_reparsing_pem() == TokenService.validate_token_b2b(token, public_key)
+
+    cases: list = [
+        ("create_signature", sign_reparsing_pem, lambda: TokenService.create_signature(private_key, string_to_sign), 20),
+        ("compare_signatures", verify_reparsing_pem, lambda: TokenService.compare_signatures(string_to_sign, signature, public_key), 2000),
+        ("validate_token_b2b", decode_reparsing_pem, lambda: TokenService.validate_token_b2b(token, public_key), 2000)
+    ]
+    print("RSA-2048, best of 5")
+    for name, before, after, number in cases:
+        before_cost: float = support.best_of(before, number)
+        after_cost: float = support.best_of(after, number)
+        print("{name:20s} re-parse {before} ({before_rate:8.0f}/s)   cached {after} ({after_rate:8.0f}/s)".format(
+            name=name, before=support.format_us(before_cost), before_rate=1 / before_cost,
+            after=support.format_us(after_cost), after_rate=1 / after_cost))
+
+
+if __name__ == "__main__":
+    main()
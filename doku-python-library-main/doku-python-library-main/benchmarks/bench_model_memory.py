@@ -0,0 +1,30 @@
+import support
+
+import tracemalloc
+
+from doku_python_library.src.model.va.check_status_va_response import CheckStatusVAResponse
+
+OBJECTS = 100000
+
+
+def bytes_per_object(factory) -> float:
+    tracemalloc.start()
+    objects: list = [factory(index) for index in range(OBJECTS)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / OBJECTS
+
+
+def main() -> None:
+    print("tracemalloc, {objects} live objects".format(objects=OBJECTS))
+    cases: list = [
+        ("CheckStatusVAResponse", lambda index: CheckStatusVAResponse(responseCode="2002600", responseMessage="Successful")),
+        ("CreateVARequest graph with row strings", support.create_va_request)
+    ]
+    for name, factory in cases:
+        print("{name:40s} {size:6.0f} bytes/object".format(name=name, size=bytes_per_object(factory)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import support
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from doku_python_library.src.model.general.request_header import RequestHeader
+from doku_python_library.src.model.notification.notification_payment_request import PaymentNotificationRequest
+from doku_python_library.src.services.notification_asgi_app import NotificationAsgiApp
+from doku_python_library.src.services.notification_processor import NotificationProcessor
+from doku_python_library.src.services.token_service import TokenService
+from doku_python_library.src.snap import DokuSNAP
+
+PAYMENT_PATH = "/v1.1/transfer-va/payment"
+CALLS = 5000
+BODY = json.dumps({
+    "partnerServiceId": "  888994",
+    "customerNo": "00000000000000000001",
+    "virtualAccountNo": "  88899400000000000000000001",
+    "virtualAccountName": "Toru Yamashita",
+    "trxId": "23219829713",
+    "paymentRequestId": "12839218738127830",
+    "paidAmount": {"value": "10000.00", "currency": "IDR"},
+    "trxDateTime": "2026-10-18T10:00:00+07:00",
+    "additionalInfo": {"channel": "VIRTUAL_ACCOUNT_BCA"}
+}).encode("utf-8")
+
+
+def build_app(private_key: str, public_key: str) -> tuple:
+    snap = DokuSNAP(private_key, "client-id", False, public_key, "issuer", "secret", public_key, lazy_token=True)
+    return snap, NotificationAsgiApp(NotificationProcessor(snap))
+
+
+def per_call(fn) -> float:
+    fn()
+    started: float = time.perf_counter()
+    for _ in range(CALLS):
+        fn()
+    return (time.perf_counter() - started) / CALLS
+
+
+def run_in_process(private_key: str, public_key: str, token: str) -> None:
+    snap, app = build_app(private_key, public_key)
+    headers: dict = {"Authorization": "Bearer " + token, "Content-Type": "application/json"}
+    scope: dict = {"type": "http", "method": "POST", "path": PAYMENT_PATH,
+                   "headers": [(b"authorization", ("Bearer " + token).encode("latin-1")), (b"content-type", b"application/json")]}
+
+    def snap_path() -> None:
+        header: RequestHeader = RequestHeader(x_timestamp=None, x_signature=None, x_partner_id=None,
+                                              authorization=headers["Authorization"].replace("Bearer ", ""),
+                                              x_external_id=None, channel_id=None)
+        response = snap.validate_token_and_generate_notification_response(header=header, request=PaymentNotificationRequest(**json.loads(BODY)))
+        json.dumps(response.json())
+
+    def processor_path() -> None:
+        assert app.processor.handle_payment_notification(headers, BODY)[0] == 200
+
+    async def asgi_calls() -> float:
+        messages: list = []
+
+        async def receive() -> dict:
+            return {"type": "http.request", "body": BODY, "more_body": False}
+
+        async def send(message: dict) -> None:
+            messages.append(message)
+
+        await app(scope, receive, send)
+        started: float = time.perf_counter()
+        for _ in range(CALLS):
+            await app(scope, receive, send)
+        assert messages[-2]["status"] == 200
+        return (time.perf_counter() - started) / CALLS
+
+    print("VA payment notification, in process, {calls} calls".format(calls=CALLS))
+    print("validate_token_and_generate_notification_response  {cost}".format(cost=support.format_us(per_call(snap_path))))
+    print("NotificationProcessor.handle_payment_notification  {cost}".format(cost=support.format_us(per_call(processor_path))))
+    print("NotificationAsgiApp (run_in_executor)               {cost}".format(cost=support.format_us(asyncio.run(asgi_calls()))))
+    snap.close()
+
+
+async def load(port: int, concurrency: int, duration: float, token: str) -> str:
+    request: bytes = (
+        "POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+        "Authorization: Bearer {token}\r\nContent-Length: {length}\r\n\r\n"
+    ).format(path=PAYMENT_PATH, token=token, length=len(BODY)).encode("latin-1") + BODY
+    latencies: list = []
+    deadline: float = time.perf_counter() + duration
+
+    async def worker() -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        while time.perf_counter() < deadline:
+            started: float = time.perf_counter()
+            writer.write(request)
+            head: bytes = await reader.readuntil(b"\r\n\r\n")
+            length: int = int([line for line in head.split(b"\r\n") if line.lower().startswith(b"content-length")][0].split(b":")[1])
+            await reader.readexactly(length)
+            assert head[9:12] == b"200"
+            latencies.append(time.perf_counter() - started)
+        writer.close()
+
+    started: float = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed: float = time.perf_counter() - started
+    latencies.sort()
+    return "c={concurrency:<3d} {rate:7.0f} req/s  p50 {p50:6.2f} ms  p99 {p99:6.2f} ms".format(
+        concurrency=concurrency, rate=len(latencies) / elapsed,
+        p50=latencies[len(latencies) // 2] * 1e3, p99=latencies[int(len(latencies) * 0.99)] * 1e3)
+
+
+def run_over_http(private_key: str, token: str) -> None:
+    port: int = 18765
+    env: dict = dict(os.environ, DOKU_BENCH_PRIVATE_KEY=private_key)
+    server = subprocess.Popen([sys.executable, os.path.abspath(__file__), "serve", str(port)], env=env)
+    try:
+        time.sleep(3)
+        print("VA payment notification over HTTP, uvicorn + NotificationAsgiApp, keep-alive")
+        for concurrency in (1, 16, 64):
+            print(asyncio.run(load(port, concurrency, 4.0, token)))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def serve(port: int) -> None:
+    import uvicorn
+    from cryptography.hazmat.primitives import serialization
+    private_key: str = os.environ["DOKU_BENCH_PRIVATE_KEY"]
+    public_key: str = serialization.load_pem_private_key(private_key.encode("utf-8"), password=None).public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo).decode()
+    snap, app = build_app(private_key, public_key)
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="error", access_log=False)
+
+
+def main() -> None:
+    if sys.argv[1:2] == ["serve"]:
+        serve(int(sys.argv[2]))
+        return
+    private_key, public_key = support.key_pair()
+    token: str = TokenService.generate_token(900, "issuer", private_key, "client-id")
+    run_in_process(private_key, public_key, token)
+    if "--http" in sys.argv:
+        run_over_http(private_key, token)
+
+
+if __name__ == "__main__":
+    main()
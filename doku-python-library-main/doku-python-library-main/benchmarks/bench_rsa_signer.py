@@ -0,0 +1,35 @@
+import support
+
+import time
+
+from doku_python_library.src.services.rsa_signer import RsaSigner
+from doku_python_library.src.services.token_service import TokenService
+
+SIGNATURES = 2000
+
+
+def main() -> None:
+    private_key, _ = support.key_pair()
+    texts: list = ["client-id|2026-10-18T10:00:{second:02d}Z-{index}".format(second=index % 60, index=index) for index in range(SIGNATURES)]
+    started: float = time.perf_counter()
+    expected: list = [TokenService.create_signature(private_key, text) for text in texts]
+    print("RSA-2048 PKCS1v15, {signatures} signatures".format(signatures=SIGNATURES))
+    print("inline create_signature       {rate:6.0f} sig/s".format(rate=SIGNATURES / (time.perf_counter() - started)))
+    for use_processes in (True, False):
+        for max_workers in (1, 2, 4):
+            signer: RsaSigner = RsaSigner(private_key, max_workers=max_workers, use_processes=use_processes)
+            signer.sign_many(texts[:max_workers * 4])
+            started = time.perf_counter()
+            assert signer.sign_many(texts) == expected
+            rate: float = SIGNATURES / (time.perf_counter() - started)
+            started = time.perf_counter()
+            for text in texts[:200]:
+                signer.sign(text)
+            latency: float = (time.perf_counter() - started) / 200
+            signer.close()
+            print("{pool} pool w={workers}  sign_many {rate:6.0f} sig/s   sign() {latency:.2f} ms".format(
+                pool="process" if use_processes else "thread ", workers=max_workers, rate=rate, latency=latency * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+import support
+
+from doku_python_library.src.services.token_service import TokenService
+
+CALLS = 100000
+
+
+def main() -> None:
+    generated_timestamp: str = TokenService.get_timestamp()
+    deadline: float = TokenService.get_token_deadline(900)
+    timestamp_cost: float = support.best_of(lambda: TokenService.is_token_expired(900, generated_timestamp), CALLS // 10)
+    deadline_cost: float = support.best_of(lambda: TokenService.is_deadline_passed(deadline), CALLS)
+    print("token validity check, best of 5")
+    print("strptime timestamp  {cost}".format(cost=support.format_us(timestamp_cost)))
+    print("monotonic deadline  {cost}".format(cost=support.format_us(deadline_cost)))
+
+
+if __name__ == "__main__":
+    main()
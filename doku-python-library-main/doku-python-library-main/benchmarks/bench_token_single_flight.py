@@ -0,0 +1,58 @@
+import support
+
+import threading
+import time
+
+from doku_python_library.src.commons.config import Config
+from doku_python_library.src.snap import DokuSNAP
+from doku_python_library.src.services.token_store import InMemoryTokenStore
+
+THREADS = 64
+WINDOWS = 3
+TOKEN_EXPIRES_IN = 12
+CLIENTS = 4
+
+
+def stress(clients: list) -> list:
+    barrier = threading.Barrier(THREADS)
+    tokens: list = []
+    lock = threading.Lock()
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        token: str = clients[index % len(clients)].token_manager.get_token()
+        with lock:
+            tokens.append(token)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return tokens
+
+
+def main() -> None:
+    private_key, public_key = support.key_pair()
+    token_path: str = Config.ACCESS_TOKEN
+    with support.MockSnapServer(delay=0.05, token_expires_in=TOKEN_EXPIRES_IN) as server:
+        for label, token_store in (("one client", None), ("{clients} clients, shared store".format(clients=CLIENTS), InMemoryTokenStore())):
+            clients: list = [
+                DokuSNAP(private_key, "client-id", False, public_key, "issuer", "secret", public_key,
+                         token_store=token_store, lazy_token=True)
+                for _ in range(1 if token_store is None else CLIENTS)
+            ]
+            server.calls.clear()
+            for window in range(WINDOWS):
+                before: int = server.calls.get(token_path, 0)
+                tokens: list = stress(clients)
+                print("{label:28s} window {window}: {threads} threads, {fetches} token fetch(es), {distinct} distinct token(s)".format(
+                    label=label, window=window, threads=THREADS, fetches=server.calls.get(token_path, 0) - before,
+                    distinct=len(set(tokens))))
+                time.sleep(TOKEN_EXPIRES_IN - 10 + 0.1)
+            for client in clients:
+                client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import support
+
+import time
+
+from doku_python_library.src.model.va.create_va_request import CreateVARequest
+from doku_python_library.src.model.va.total_amount import TotalAmount
+from doku_python_library.src.model.va.update_va_additional_info import UpdateVAAdditionalInfo
+from doku_python_library.src.model.va.update_va_config import UpdateVAConfig
+from doku_python_library.src.model.va.update_va_request import UpdateVaRequest
+
+REQUESTS = 100000
+
+
+def update_va_request(index: int) -> UpdateVaRequest:
+    customer_no: str = str(index).zfill(20)
+    return UpdateVaRequest(
+        partnerServiceId="  888994",
+        customerNo=customer_no,
+        virtualAccountNo="  888994" + customer_no,
+        virtualAccountName="Toru Yamashita",
+        virtualAccountEmail="toru@example.com",
+        virtualAccountPhone="628123456789",
+        trxId="trx" + str(index),
+        totalAmount=TotalAmount("10000.00", "IDR"),
+        virtualAccountTrxType="V",
+        expiredDate="2030-01-01T10:55:00+07:00",
+        additionalInfo=UpdateVAAdditionalInfo("VIRTUAL_ACCOUNT_BCA", UpdateVAConfig("ACTIVE", "100.00", "20000.00"))
+    )
+
+
+def timed(fn) -> float:
+    started: float = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    creates: list = [support.create_va_request(index) for index in range(REQUESTS)]
+    updates: list = [update_va_request(index) for index in range(REQUESTS)]
+    create_cost: float = timed(lambda: [request.validate_va_request() for request in creates])
+    update_cost: float = timed(lambda: [request.validate_update_va_request() for request in updates])
+    for request in creates[::2]:
+        request.trx_id = ""
+        request.total_amount = TotalAmount("1.0", "USD")
+    many_cost: float = timed(lambda: CreateVARequest.validate_many(creates))
+    print("{requests} valid requests".format(requests=REQUESTS))
+    print("validate_va_request          {cost:6.2f} us/request".format(cost=create_cost / REQUESTS * 1e6))
+    print("validate_update_va_request   {cost:6.2f} us/request".format(cost=update_cost / REQUESTS * 1e6))
+    print("validate_many, half invalid  {cost:6.2f} s".format(cost=many_cost))
+
+
+if __name__ == "__main__":
+    main()
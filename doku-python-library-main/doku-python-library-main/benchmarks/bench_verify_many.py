@@ -0,0 +1,58 @@
+import support
+
+import contextlib
+import io
+import random
+import time
+
+from doku_python_library.src.controller.token_controller import TokenController
+from doku_python_library.src.services.token_service import TokenService
+
+CLIENT_ID = "BRN-0001"
+
+
+def best_rate(fn, items: list) -> str:
+    best: float = min((lambda started: (fn(items), time.perf_counter() - started)[1])(time.perf_counter()) for _ in range(3))
+    return "{rate:9.0f} notif/s  {cost:6.1f} us each".format(rate=len(items) / best, cost=best * 1e6 / len(items))
+
+
+def main() -> None:
+    private_key, public_key = support.key_pair()
+    unique: list = []
+    for index in range(500):
+        timestamp: str = "2026-10-18T10:{minute:02d}:{second:02d}+07:00".format(minute=index // 60, second=index % 60)
+        unique.append({"X-TIMESTAMP": timestamp, "X-SIGNATURE": TokenService.create_signature(private_key, CLIENT_ID + "|" + timestamp)})
+    rnd = random.Random(1)
+    replay: list = [rnd.choice(unique) for _ in range(2000)]
+
+    def headers_loop(items: list) -> list:
+        return [TokenController.validate_signature_headers(headers, CLIENT_ID, public_key) for headers in items]
+
+    def verify_many(items: list) -> list:
+        return TokenController.verify_many(items, CLIENT_ID, public_key)
+
+    assert all(verify_many(replay)) and headers_loop(replay) == verify_many(replay)
+    cases: list = []
+    try:
+        from flask import Flask
+        app = Flask("bench")
+
+        def flask_context(items: list) -> list:
+            results: list = []
+            with contextlib.redirect_stdout(io.StringIO()):
+                for headers in items:
+                    with app.test_request_context(headers=headers):
+                        results.append(TokenController.validate_signature(CLIENT_ID, public_key))
+            return results
+        cases.append(("flask request context", flask_context))
+    except ImportError:
+        pass
+    cases += [("headers loop", headers_loop), ("verify_many", verify_many)]
+    print("{replay} notifications, {unique} unique signatures, RSA-2048".format(replay=len(replay), unique=len(unique)))
+    for name, fn in cases:
+        print("{name:22s} {rate}".format(name=name, rate=best_rate(fn, replay)))
+    print("{name:22s} {rate}".format(name="verify_many, unique", rate=best_rate(verify_many, unique)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+_key_pair: tuple = None
+
+
+def key_pair() -> tuple:
+    global _key_pair
+    if _key_pair is None:
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        private_key: str = key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode()
+        public_key: str = key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode()
+        _key_pair = (private_key, public_key)
+    return _key_pair
+
+
+def best_of(fn, number: int, repeat: int = 5) -> float:
+    best: float = None
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed: float = (time.perf_counter() - started) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def format_us(seconds: float) -> str:
+    return "{value:8.2f} us".format(value=seconds * 1e6)
+
+
+class MockSnapServer:
+
+    def __init__(self, delay: float = 0.0, token_expires_in: int = 900) -> None:
+        self.delay = delay
+        self.token_expires_in = token_expires_in
+        self.calls: dict = {}
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer = None
+
+    def count(self, path: str) -> int:
+        with self._lock:
+            self.calls[path] = self.calls.get(path, 0) + 1
+            return self.calls[path]
+
+    def response_for(self, path: str, call: int) -> dict:
+        if path.endswith("/access-token/b2b"):
+            return {"responseCode": "2007300", "responseMessage": "Successful", "accessToken": "token-{call}".format(call=call),
+                    "tokenType": "Bearer", "expiresIn": self.token_expires_in}
+        if path.endswith("/access-token/b2b2c"):
+            return {"responseCode": "2007400", "responseMessage": "Successful", "accessToken": "token-b2b2c-{call}".format(call=call),
+                    "tokenType": "Bearer", "accessTokenExpiryTime": "2099-01-01T00:00:00+07:00"}
+        if path.endswith("/transfer-va/create-va"):
+            return {"responseCode": "2002700", "responseMessage": "Successful"}
+        return {"responseCode": "2002600", "responseMessage": "Successful"}
+
+    def start(self) -> 'MockSnapServer':
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def handle_request(self) -> None:
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                call: int = mock.count(self.path)
+                if mock.delay:
+                    time.sleep(mock.delay)
+                body: bytes = json.dumps(mock.response_for(self.path, call)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_PUT = do_DELETE = handle_request
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        ThreadingHTTPServer.request_queue_size = 1024
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        from doku_python_library.src.commons.config import _config_by_name
+        _config_by_name["dev"].BASE_URL = "http://127.0.0.1:{port}".format(port=self._server.server_port)
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'MockSnapServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+def create_va_request(index: int):
+    from doku_python_library.src.model.va.additional_info import AdditionalInfo
+    from doku_python_library.src.model.va.create_va_request import CreateVARequest
+    from doku_python_library.src.model.va.total_amount import TotalAmount
+    from doku_python_library.src.model.va.virtual_account_config import VirtualAccountConfig
+    customer_no: str = str(index).zfill(20)
+    return CreateVARequest(
+        partner_service_id="  888994",
+        customer_no=customer_no,
+        virtual_account_no="  888994" + customer_no,
+        virtual_acc_name="Toru Yamashita",
+        virtual_acc_email="toru@example.com",
+        virtual_acc_phone="628123456789",
+        trx_id="trx" + str(index),
+        total_amount=TotalAmount("10000.00", "IDR"),
+        virtual_acc_trx_type="V",
+        expired_date="2030-01-01T10:55:00+07:00",
+        additional_info=AdditionalInfo("VIRTUAL_ACCOUNT_BCA", VirtualAccountConfig(True, "100.00", "20000.00"))
+    )
@@ -1,5 +1,11 @@
-from doku_python_library.src.commons import *
-from doku_python_library.src.controller import *
-from doku_python_library.src.model import *
-from doku_python_library.src.services import *
-from doku_python_library.src.snap import DokuSNAP
+from doku_python_library.src import _exports as _src_exports
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = dict(_src_exports)
+_exports.update({
+    "DokuSNAP": "doku_python_library.src.snap",
+    "AsyncDokuSNAP": "doku_python_library.src.async_snap"
+})
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -1,4 +1,131 @@
-from doku_python_library.src.commons import *
-from doku_python_library.src.controller import *
-from doku_python_library.src.model import *
-from doku_python_library.src.services import *
\ No newline at end of file
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = {
+    "Config": "doku_python_library.src.commons.config",
+    "VaChannelEnum": "doku_python_library.src.commons.va_channel_enum",
+    "SnapUtils": "doku_python_library.src.commons.snap_utils",
+    "DirectDebitEnum": "doku_python_library.src.commons.direct_debit_enum",
+    "HttpClient": "doku_python_library.src.commons.http_client",
+    "TokenBucket": "doku_python_library.src.commons.rate_limiter",
+    "RateLimiter": "doku_python_library.src.commons.rate_limiter",
+    "AdaptiveConcurrencyLimiter": "doku_python_library.src.commons.concurrency_limiter",
+    "RetryPolicy": "doku_python_library.src.commons.retry",
+    "RetryEngine": "doku_python_library.src.commons.retry",
+    "CircuitBreaker": "doku_python_library.src.commons.circuit_breaker",
+    "CircuitOpenError": "doku_python_library.src.commons.circuit_breaker",
+    "Instrumentation": "doku_python_library.src.commons.instrumentation",
+    "Span": "doku_python_library.src.commons.instrumentation",
+    "SpanObserver": "doku_python_library.src.commons.instrumentation",
+    "HistogramCollector": "doku_python_library.src.commons.instrumentation",
+    "OpenTelemetryObserver": "doku_python_library.src.commons.opentelemetry_observer",
+    "MetricsRegistry": "doku_python_library.src.commons.metrics",
+    "render_metrics": "doku_python_library.src.commons.metrics",
+    "JsonCodec": "doku_python_library.src.commons.json_codec",
+    "HeaderAdapter": "doku_python_library.src.commons.header_adapter",
+    "RequestValidator": "doku_python_library.src.commons.request_validator",
+    "FieldRule": "doku_python_library.src.commons.request_validator",
+    "Rule": "doku_python_library.src.commons.request_validator",
+    "TokenController": "doku_python_library.src.controller.token_controller",
+    "VaController": "doku_python_library.src.controller.va_controller",
+    "NotificationController": "doku_python_library.src.controller.notification_controler",
+    "DirectDebitController": "doku_python_library.src.controller.direct_debit_controller",
+    "TokenB2BRequest": "doku_python_library.src.model.token.token_b2b_request",
+    "TokenB2BResponse": "doku_python_library.src.model.token.token_b2b_response",
+    "TokenB2B2CRequest": "doku_python_library.src.model.token.token_b2b2c_request",
+    "TokenB2B2CResponse": "doku_python_library.src.model.token.token_b2b2c_response",
+    "AdditionalInfoResponse": "doku_python_library.src.model.va.additional_info_response",
+    "AdditionalInfo": "doku_python_library.src.model.va.additional_info",
+    "CreateVARequest": "doku_python_library.src.model.va.create_va_request",
+    "CreateVAResponse": "doku_python_library.src.model.va.create_va_response",
+    "Origin": "doku_python_library.src.model.va.origin",
+    "TotalAmount": "doku_python_library.src.model.va.total_amount",
+    "VirtualAccountData": "doku_python_library.src.model.va.virtual_account_data",
+    "VirtualAccountConfig": "doku_python_library.src.model.va.virtual_account_config",
+    "UpdateVaRequest": "doku_python_library.src.model.va.update_va_request",
+    "UpdateVAAdditionalInfo": "doku_python_library.src.model.va.update_va_additional_info",
+    "UpdateVAConfig": "doku_python_library.src.model.va.update_va_config",
+    "UpdateVAResponse": "doku_python_library.src.model.va.update_va_response",
+    "CheckStatusPaymentFlagResponse": "doku_python_library.src.model.va.check_status_payment_flag_response",
+    "CheckStatusVAData": "doku_python_library.src.model.va.check_status_va_data",
+    "CheckStatusVAResponse": "doku_python_library.src.model.va.check_status_va_response",
+    "DeleteVARequest": "doku_python_library.src.model.va.delete_va_request",
+    "DeleteVAAdditionalInfo": "doku_python_library.src.model.va.delete_va_additional_info",
+    "DeleteVAResponse": "doku_python_library.src.model.va.delete_va_response",
+    "DeleteVaResponseAdditionalInfo": "doku_python_library.src.model.va.delete_va_additional_info_response",
+    "DeleteVAResponseVirtualAccountData": "doku_python_library.src.model.va.delete_va_virtual_acc_data",
+    "BillAmount": "doku_python_library.src.model.va.bill_amount",
+    "RequestHeader": "doku_python_library.src.model.general.request_header",
+    "NotificationToken": "doku_python_library.src.model.notification.notification_token",
+    "NotificationTokenHeader": "doku_python_library.src.model.notification.notification_token_header",
+    "NotificationTokenBody": "doku_python_library.src.model.notification.notification_token_body",
+    "PaymentNotificationAdditionalInfo": "doku_python_library.src.model.notification.notification_payment_request",
+    "PaymentNotificationRequest": "doku_python_library.src.model.notification.notification_payment_request",
+    "PaymentNotificationResponse": "doku_python_library.src.model.notification.notification_payment_response",
+    "PaymentNotificationResponseHeader": "doku_python_library.src.model.notification.notification_payment_header_response",
+    "PaymentNotificationResponseBody": "doku_python_library.src.model.notification.notification_payment_body_response",
+    "NotificationVirtualAccountData": "doku_python_library.src.model.notification.notification_virtual_account_data",
+    "NotificationPaymentDirectDebitRequest": "doku_python_library.src.model.notification.notification_payment_direct_debit_request",
+    "NotificationPaymentDirectDebitAdditionalInfo": "doku_python_library.src.model.notification.notification_payment_direct_debit_additional_info",
+    "NotificationPaymentDirectDebitResponse": "doku_python_library.src.model.notification.notification_payment_direct_debit_response",
+    "InquiryRequestAdditionalInfo": "doku_python_library.src.model.inquiry.inquiry_request_additional_info",
+    "InquiryRequestBody": "doku_python_library.src.model.inquiry.inquiry_request_body",
+    "InquiryReason": "doku_python_library.src.model.inquiry.inquiry_reason",
+    "InquiryRequestVirtualAccountData": "doku_python_library.src.model.inquiry.inquiry_request_virtual_account_data",
+    "InquiryResponseBody": "doku_python_library.src.model.inquiry.inquiry_response_body",
+    "AccountBindingRequest": "doku_python_library.src.model.direct_debit.account_binding_request",
+    "AccountBindingAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.account_binding_additional_info_request",
+    "AccountBindingAdditionalInfoResponse": "doku_python_library.src.model.direct_debit.account_binding_additional_info_response",
+    "PaymentRequest": "doku_python_library.src.model.direct_debit.payment_request",
+    "PayOptionDetail": "doku_python_library.src.model.direct_debit.pay_option_detail",
+    "LineItems": "doku_python_library.src.model.direct_debit.line_items",
+    "PaymentAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.payment_additional_info_request",
+    "PaymentResponse": "doku_python_library.src.model.direct_debit.payment_response",
+    "AccountInfo": "doku_python_library.src.model.direct_debit.account_info",
+    "BalanceInquiryAdditionalInfo": "doku_python_library.src.model.direct_debit.balance_inquiry_additional_info",
+    "BalanceInquiryRequest": "doku_python_library.src.model.direct_debit.balance_inquiry_request",
+    "BalanceInquiryResponse": "doku_python_library.src.model.direct_debit.balance_inquiry_response",
+    "AccountUnbindingRequest": "doku_python_library.src.model.direct_debit.account_unbinding_request",
+    "AccountUnbindingAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.account_unbinding_additional_info_request",
+    "AccountUnbindingResponse": "doku_python_library.src.model.direct_debit.account_unbinding_response",
+    "AccountBindingResponse": "doku_python_library.src.model.direct_debit.account_binding_response",
+    "PaymentJumpAppRequest": "doku_python_library.src.model.direct_debit.payment_jump_app_request",
+    "PaymentJumpAppAdditionalInfo": "doku_python_library.src.model.direct_debit.payment_jump_app_additional_info",
+    "UrlParam": "doku_python_library.src.model.direct_debit.url_param",
+    "PaymentJumpAppResponse": "doku_python_library.src.model.direct_debit.paymet_jump_app_response",
+    "PaymentJumpAppAdditionalInfoResponse": "doku_python_library.src.model.direct_debit.payment_jump_app_additional_info_response",
+    "CardRegistrationRequest": "doku_python_library.src.model.direct_debit.card_registration_request",
+    "CardRegistrationAdditionalInfo": "doku_python_library.src.model.direct_debit.card_registration_additional_info",
+    "CardRegistrationResponse": "doku_python_library.src.model.direct_debit.card_registration_response",
+    "RefundRequest": "doku_python_library.src.model.direct_debit.refund_request",
+    "RefundAdditionalInfo": "doku_python_library.src.model.direct_debit.refund_additional_info",
+    "RefundResponse": "doku_python_library.src.model.direct_debit.refund_response",
+    "CheckStatusAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.check_status_additional_info_request",
+    "CheckStatusRequest": "doku_python_library.src.model.direct_debit.check_status_request",
+    "CheckStatusAdditionalInfoResponse": "doku_python_library.src.model.direct_debit.check_status_additional_info_response",
+    "CheckStatusResponse": "doku_python_library.src.model.direct_debit.check_status_response",
+    "RefundHistory": "doku_python_library.src.model.direct_debit.refund_history",
+    "CardUnbindingRequest": "doku_python_library.src.model.direct_debit.card_unbinding_request",
+    "CardUnbindingResponse": "doku_python_library.src.model.direct_debit.card_unbinding_response",
+    "BankCardData": "doku_python_library.src.model.direct_debit.bank_card_data",
+    "SignatureVerifier": "doku_python_library.src.services.signature_verifier",
+    "HmacSigner": "doku_python_library.src.services.hmac_signer",
+    "RsaSigner": "doku_python_library.src.services.rsa_signer",
+    "TokenService": "doku_python_library.src.services.token_service",
+    "TokenStore": "doku_python_library.src.services.token_store",
+    "InMemoryTokenStore": "doku_python_library.src.services.token_store",
+    "FileTokenStore": "doku_python_library.src.services.token_store",
+    "RedisTokenStore": "doku_python_library.src.services.token_store",
+    "TokenManager": "doku_python_library.src.services.token_manager",
+    "TokenRefresher": "doku_python_library.src.services.token_refresher",
+    "TokenB2B2CCache": "doku_python_library.src.services.token_b2b2c_cache",
+    "BulkExecutor": "doku_python_library.src.services.bulk_executor",
+    "VaReconciler": "doku_python_library.src.services.va_reconciler",
+    "VaService": "doku_python_library.src.services.va_service",
+    "NotificationService": "doku_python_library.src.services.notification_service",
+    "NotificationProcessor": "doku_python_library.src.services.notification_processor",
+    "NotificationAsgiApp": "doku_python_library.src.services.notification_asgi_app",
+    "DirectDebitService": "doku_python_library.src.services.direct_debit_service"
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
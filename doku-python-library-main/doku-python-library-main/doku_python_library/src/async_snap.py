@@ -0,0 +1,163 @@
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+import asyncio
+import contextvars
+import functools
+from doku_python_library.src.snap import *
+from doku_python_library.src.commons.http_client import HttpClient
+
+class AsyncDokuSNAP:
+
+    def __init__(self, private_key: str, client_id: str, is_production: bool, public_key: str, issuer: str, secret_key: str,
+                 merchant_public_key: str, http_client: HttpClient = None, max_workers: int = 10,
+                 token_b2b2c_cache_size: int = 10000, token_store: TokenStore = None, lazy_token: bool = True,
+                 rsa_signer: RsaSigner = None) -> None:
+        self.http_client = http_client if http_client is not None else HttpClient(pool_maxsize=max_workers)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="doku-snap")
+        self.snap = DokuSNAP(
+            private_key=private_key,
+            client_id=client_id,
+            is_production=is_production,
+            public_key=public_key,
+            issuer=issuer,
+            secret_key=secret_key,
+            merchant_public_key=merchant_public_key,
+            http_client=self.http_client,
+            token_b2b2c_cache_size=token_b2b2c_cache_size,
+            token_store=token_store,
+            lazy_token=lazy_token,
+            rsa_signer=rsa_signer
+        )
+
+    def _submit(self, func, *args, **kwargs) -> Future:
+        context = contextvars.copy_context()
+        return self.executor.submit(functools.partial(context.run, func, *args, **kwargs))
+
+    async def _run(self, func, *args, **kwargs):
+        return await asyncio.wrap_future(self._submit(func, *args, **kwargs))
+
+    async def get_token(self) -> TokenB2BResponse:
+        return await self._run(self.snap.get_token)
+
+    async def warm_up(self) -> TokenB2BResponse:
+        return await self._run(self.snap.warm_up)
+
+    async def create_va(self, create_va_request: CreateVARequest) -> CreateVAResponse:
+        return await self._run(self.snap.create_va, create_va_request)
+
+    async def create_va_bulk(self, create_va_requests, concurrency: int = 10, rate_limit: float = None):
+        results = await self._run(self.snap.create_va_bulk, create_va_requests, concurrency=concurrency, rate_limit=rate_limit)
+        pending: Future = None
+        try:
+            while True:
+                pending = self._submit(next, results, None)
+                result = await asyncio.wrap_future(pending)
+                if result is None:
+                    return
+                yield result
+        finally:
+            await self._run(AsyncDokuSNAP._close_results, results, pending)
+
+    @staticmethod
+    def _close_results(results, pending: Future) -> None:
+        if pending is not None:
+            wait([pending])
+        results.close()
+
+    async def update_va(self, update_request: UpdateVaRequest) -> UpdateVAResponse:
+        return await self._run(self.snap.update_va, update_request)
+
+    async def check_status_va(self, check_status_request: va_status) -> CheckStatusVAResponse:
+        return await self._run(self.snap.check_status_va, check_status_request)
+
+    async def reconcile_va_status(self, input_path: str, output_path: str, concurrency: int = 10, rate_limit: float = None,
+                                  checkpoint_path: str = None, input_format: str = None) -> dict:
+        return await self._run(self.snap.reconcile_va_status, input_path, output_path, concurrency=concurrency,
+                               rate_limit=rate_limit, checkpoint_path=checkpoint_path, input_format=input_format)
+
+    async def delete_payment_code(self, delete_va_request: DeleteVARequest) -> DeleteVAResponse:
+        return await self._run(self.snap.delete_payment_code, delete_va_request)
+
+    async def validate_signature(self, headers = None) -> bool:
+        return await self._run(self.snap.validate_signature, headers)
+
+    async def verify_many(self, headers_list) -> list:
+        return await self._run(self.snap.verify_many, headers_list)
+
+    async def generate_token_b2b(self, is_signature_valid: bool) -> NotificationToken:
+        return await self._run(self.snap.generate_token_b2b, is_signature_valid)
+
+    async def validate_token_b2b(self, request_token: str) -> bool:
+        return await self._run(self.snap.validate_token_b2b, request_token)
+
+    async def validate_signature_and_generate_token(self, headers = None) -> NotificationToken:
+        return await self._run(self.snap.validate_signature_and_generate_token, headers)
+
+    async def generate_notification_response(self, is_token_valid: bool, request: PaymentNotificationRequest) -> PaymentNotificationResponseBody:
+        return await self._run(self.snap.generate_notification_response, is_token_valid, request)
+
+    async def validate_token_and_generate_notification_response(self, header: RequestHeader, request: PaymentNotificationRequest) -> PaymentNotificationResponseBody:
+        return await self._run(self.snap.validate_token_and_generate_notification_response, header, request)
+
+    async def generate_request_header(self) -> RequestHeader:
+        return await self._run(self.snap.generate_request_header)
+
+    async def generate_request_headers(self, count: int) -> list:
+        return await self._run(self.snap.generate_request_headers, count)
+
+    async def direct_inquiry_request_mapping(self, header: dict, snap_format: dict) -> dict:
+        return await self._run(self.snap.direct_inquiry_request_mapping, header=header, snap_format=snap_format)
+
+    async def direct_inquiry_response_mapping(self, v1_data: str) -> dict:
+        return await self._run(self.snap.direct_inquiry_response_mapping, v1_data)
+
+    async def do_account_binding(self, request: AccountBindingRequest, device_id: str = None, ip_address: str = None) -> AccountBindingResponse:
+        return await self._run(self.snap.do_account_binding, request, device_id=device_id, ip_address=ip_address)
+
+    async def get_token_b2b2c(self, auth_code: str) -> TokenB2B2CResponse:
+        return await self._run(self.snap.get_token_b2b2c, auth_code)
+
+    async def do_payment(self, request: PaymentRequest, ip_address: str, auth_code: str) -> PaymentResponse:
+        return await self._run(self.snap.do_payment, request, ip_address=ip_address, auth_code=auth_code)
+
+    async def do_balance_inquiry(self, request: BalanceInquiryRequest, ip_address: str, auth_code: str) -> BalanceInquiryResponse:
+        return await self._run(self.snap.do_balance_inquiry, request, ip_address=ip_address, auth_code=auth_code)
+
+    async def do_account_unbinding(self, request: AccountUnbindingRequest, ip_address: str) -> AccountUnbindingResponse:
+        return await self._run(self.snap.do_account_unbinding, request, ip_address=ip_address)
+
+    async def do_payment_jump_app(self, request: PaymentJumpAppRequest, device_id: str, ip_address: str) -> PaymentJumpAppResponse:
+        return await self._run(self.snap.do_payment_jump_app, request, device_id=device_id, ip_address=ip_address)
+
+    async def do_card_registration(self, request: CardRegistrationRequest, channel_id: str) -> CardRegistrationResponse:
+        return await self._run(self.snap.do_card_registration, request, channel_id=channel_id)
+
+    async def do_card_unbinding(self, request: CardUnbindingRequest, ip_address: str) -> CardUnbindingResponse:
+        return await self._run(self.snap.do_card_unbinding, request, ip_address=ip_address)
+
+    async def do_refund(self, request: RefundRequest, ip_address: str, auth_code: str, device_id: str) -> RefundResponse:
+        return await self._run(self.snap.do_refund, request, ip_address=ip_address, auth_code=auth_code, device_id=device_id)
+
+    async def do_check_status(self, request: CheckStatusRequest) -> CheckStatusResponse:
+        return await self._run(self.snap.do_check_status, request)
+
+    async def direct_debit_payment_notification(self, request_token_b2b2c: str) -> NotificationPaymentDirectDebitResponse:
+        return await self._run(self.snap.direct_debit_payment_notification, request_token_b2b2c)
+
+    async def generate_direct_debit_notification(self, is_token_b2b2c_valid: bool) -> NotificationPaymentDirectDebitResponse:
+        return await self._run(self.snap.generate_direct_debit_notification, is_token_b2b2c_valid=is_token_b2b2c_valid)
+
+    async def encrypt_card(self, input_str: str, secret_key: str) -> str:
+        return await self._run(DokuSNAP.encrypt_card, input_str, secret_key)
+
+    async def close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._close)
+
+    def _close(self) -> None:
+        self.executor.shutdown(wait=True)
+        self.snap.close()
+
+    async def __aenter__(self) -> 'AsyncDokuSNAP':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
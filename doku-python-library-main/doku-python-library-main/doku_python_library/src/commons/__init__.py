@@ -1,4 +1,31 @@
-from doku_python_library.src.commons.config import *
-from doku_python_library.src.commons.va_channel_enum import *
-from doku_python_library.src.commons.snap_utils import *
-from doku_python_library.src.commons.direct_debit_enum import *
\ No newline at end of file
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = {
+    "Config": "doku_python_library.src.commons.config",
+    "VaChannelEnum": "doku_python_library.src.commons.va_channel_enum",
+    "SnapUtils": "doku_python_library.src.commons.snap_utils",
+    "DirectDebitEnum": "doku_python_library.src.commons.direct_debit_enum",
+    "HttpClient": "doku_python_library.src.commons.http_client",
+    "TokenBucket": "doku_python_library.src.commons.rate_limiter",
+    "RateLimiter": "doku_python_library.src.commons.rate_limiter",
+    "AdaptiveConcurrencyLimiter": "doku_python_library.src.commons.concurrency_limiter",
+    "RetryPolicy": "doku_python_library.src.commons.retry",
+    "RetryEngine": "doku_python_library.src.commons.retry",
+    "CircuitBreaker": "doku_python_library.src.commons.circuit_breaker",
+    "CircuitOpenError": "doku_python_library.src.commons.circuit_breaker",
+    "Instrumentation": "doku_python_library.src.commons.instrumentation",
+    "Span": "doku_python_library.src.commons.instrumentation",
+    "SpanObserver": "doku_python_library.src.commons.instrumentation",
+    "HistogramCollector": "doku_python_library.src.commons.instrumentation",
+    "OpenTelemetryObserver": "doku_python_library.src.commons.opentelemetry_observer",
+    "MetricsRegistry": "doku_python_library.src.commons.metrics",
+    "render_metrics": "doku_python_library.src.commons.metrics",
+    "JsonCodec": "doku_python_library.src.commons.json_codec",
+    "HeaderAdapter": "doku_python_library.src.commons.header_adapter",
+    "RequestValidator": "doku_python_library.src.commons.request_validator",
+    "FieldRule": "doku_python_library.src.commons.request_validator",
+    "Rule": "doku_python_library.src.commons.request_validator"
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -0,0 +1,146 @@
+from doku_python_library.src.commons.config import Config
+import json
+import threading
+import time
+import requests
+
+class CircuitOpenError(Exception):
+
+    def __init__(self, endpoint: str) -> None:
+        super().__init__("Circuit breaker is open for " + endpoint)
+        self.endpoint = endpoint
+
+class _EndpointCircuit:
+
+    def __init__(self) -> None:
+        self.state: str = CircuitBreaker.CLOSED
+        self.consecutive_failures: int = 0
+        self.half_open_calls: int = 0
+        self.half_open_successes: int = 0
+        self.opened_at: float = None
+        self.open_count: int = 0
+        self.rejected_count: int = 0
+        self.failure_count: int = 0
+        self.success_count: int = 0
+
+class CircuitBreaker:
+
+    CLOSED: str = "closed"
+    OPEN: str = "open"
+    HALF_OPEN: str = "half_open"
+
+    SERVICE_CODES: dict = {
+        Config.ACCESS_TOKEN: "73",
+        Config.ACCESS_TOKEN_B2B2C: "74",
+        Config.CREATE_VA: "27",
+        Config.UPDATE_VA: "28",
+        Config.CHECK_STATUS_VA: "26",
+        Config.DELETE_VA: "31",
+        Config.DIRECT_DEBIT_ACCOUNT_BINDING_URL: "07",
+        Config.DIRECT_DEBIT_ACCOUNT_UNBINDING_URL: "09",
+        Config.DIRECT_DEBIT_PAYMENT_URL: "54",
+        Config.DIRECT_DEBIT_BALANCE_INQUIRY_URL: "11",
+        Config.DIRECT_DEBIT_CARD_REGISTRATION: "01",
+        Config.DIRECT_DEBIT_CARD_UNBINDING_URL: "05",
+        Config.DIRECT_DEBIT_REFUND: "58",
+        Config.DIRECT_DEBIT_CHECK_STATUS: "55"
+    }
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, half_open_max_calls: int = 1,
+                 success_threshold: int = 1, failure_status_codes: tuple = (500, 502, 503, 504)) -> None:
+        if failure_threshold < 1 or half_open_max_calls < 1 or success_threshold < 1:
+            raise Exception("failure_threshold, half_open_max_calls and success_threshold must be at least 1.")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.failure_status_codes = frozenset(failure_status_codes)
+        self._circuits: dict = {}
+        self._lock = threading.Lock()
+
+    def _get_circuit(self, endpoint: str) -> _EndpointCircuit:
+        circuit: _EndpointCircuit = self._circuits.get(endpoint)
+        if circuit is None:
+            with self._lock:
+                circuit = self._circuits.setdefault(endpoint, _EndpointCircuit())
+        return circuit
+
+    def allow(self, endpoint: str) -> None:
+        circuit: _EndpointCircuit = self._get_circuit(endpoint)
+        with self._lock:
+            if circuit.state == CircuitBreaker.OPEN:
+                if time.monotonic() - circuit.opened_at < self.reset_timeout:
+                    circuit.rejected_count += 1
+                    raise CircuitOpenError(endpoint)
+                circuit.state = CircuitBreaker.HALF_OPEN
+                circuit.half_open_calls = 0
+                circuit.half_open_successes = 0
+            if circuit.state == CircuitBreaker.HALF_OPEN:
+                if circuit.half_open_calls >= self.half_open_max_calls:
+                    circuit.rejected_count += 1
+                    raise CircuitOpenError(endpoint)
+                circuit.half_open_calls += 1
+
+    def record(self, endpoint: str, status_code: int) -> None:
+        circuit: _EndpointCircuit = self._get_circuit(endpoint)
+        failed: bool = status_code is None or status_code in self.failure_status_codes
+        with self._lock:
+            if failed:
+                circuit.failure_count += 1
+                circuit.consecutive_failures += 1
+                if circuit.state == CircuitBreaker.HALF_OPEN or circuit.consecutive_failures >= self.failure_threshold:
+                    self._open(circuit)
+            else:
+                circuit.success_count += 1
+                circuit.consecutive_failures = 0
+                if circuit.state == CircuitBreaker.HALF_OPEN:
+                    circuit.half_open_successes += 1
+                    if circuit.half_open_successes >= self.success_threshold:
+                        circuit.state = CircuitBreaker.CLOSED
+                    else:
+                        circuit.half_open_calls -= 1
+
+    def _open(self, circuit: _EndpointCircuit) -> None:
+        if circuit.state != CircuitBreaker.OPEN:
+            circuit.open_count += 1
+        circuit.state = CircuitBreaker.OPEN
+        circuit.opened_at = time.monotonic()
+
+    def get_state(self, endpoint: str) -> str:
+        return self._get_circuit(endpoint).state
+
+    def reset(self, endpoint: str = None) -> None:
+        with self._lock:
+            if endpoint is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(endpoint, None)
+
+    @staticmethod
+    def open_circuit_response(url: str, endpoint: str) -> requests.Response:
+        response: requests.Response = requests.Response()
+        response.status_code = 503
+        response.reason = "Service Unavailable"
+        response.url = url
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps({
+            "responseCode": "503" + CircuitBreaker.SERVICE_CODES.get(endpoint, "00") + "00",
+            "responseMessage": "Service Unavailable. Circuit breaker is open for " + endpoint
+        }).encode("utf-8")
+        return response
+
+    def metrics(self) -> dict:
+        with self._lock:
+            now: float = time.monotonic()
+            return {
+                endpoint: {
+                    "state": circuit.state,
+                    "consecutiveFailures": circuit.consecutive_failures,
+                    "failureCount": circuit.failure_count,
+                    "successCount": circuit.success_count,
+                    "openCount": circuit.open_count,
+                    "rejectedCount": circuit.rejected_count,
+                    "retryIn": max(self.reset_timeout - (now - circuit.opened_at), 0.0) if circuit.state == CircuitBreaker.OPEN else 0.0
+                }
+                for endpoint, circuit in self._circuits.items()
+            }
@@ -0,0 +1,71 @@
+import threading
+import time
+
+class _EndpointLimit:
+
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.in_flight: int = 0
+        self.last_decrease_at: float = 0.0
+        self.decrease_count: int = 0
+        self.condition = threading.Condition()
+
+    def json(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "inFlight": self.in_flight,
+            "decreaseCount": self.decrease_count
+        }
+
+class AdaptiveConcurrencyLimiter:
+
+    def __init__(self, initial_limit: int = 10, min_limit: int = 1, max_limit: int = 100, latency_threshold: float = None,
+                 backoff_ratio: float = 0.5, drop_status_codes: tuple = (429, 500, 502, 503, 504)) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise Exception("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit.")
+        if not 0 < backoff_ratio < 1:
+            raise Exception("backoff_ratio must be between 0 and 1.")
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.backoff_ratio = backoff_ratio
+        self.drop_status_codes = frozenset(drop_status_codes)
+        self._limits: dict = {}
+        self._lock = threading.Lock()
+
+    def _get_limit(self, endpoint: str) -> _EndpointLimit:
+        endpoint_limit: _EndpointLimit = self._limits.get(endpoint)
+        if endpoint_limit is None:
+            with self._lock:
+                endpoint_limit = self._limits.setdefault(endpoint, _EndpointLimit(float(self.initial_limit)))
+        return endpoint_limit
+
+    def acquire(self, endpoint: str) -> None:
+        endpoint_limit: _EndpointLimit = self._get_limit(endpoint)
+        with endpoint_limit.condition:
+            while endpoint_limit.in_flight >= int(endpoint_limit.limit):
+                endpoint_limit.condition.wait()
+            endpoint_limit.in_flight += 1
+
+    def release(self, endpoint: str, status_code: int, latency: float) -> None:
+        endpoint_limit: _EndpointLimit = self._get_limit(endpoint)
+        dropped: bool = status_code is None or status_code in self.drop_status_codes or (
+            self.latency_threshold is not None and latency > self.latency_threshold
+        )
+        with endpoint_limit.condition:
+            endpoint_limit.in_flight -= 1
+            now: float = time.monotonic()
+            if dropped:
+                if now - latency >= endpoint_limit.last_decrease_at:
+                    endpoint_limit.limit = max(float(self.min_limit), endpoint_limit.limit * self.backoff_ratio)
+                    endpoint_limit.last_decrease_at = now
+                    endpoint_limit.decrease_count += 1
+            else:
+                endpoint_limit.limit = min(float(self.max_limit), endpoint_limit.limit + 1.0 / endpoint_limit.limit)
+            endpoint_limit.condition.notify_all()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            limits: dict = dict(self._limits)
+        return {endpoint: endpoint_limit.json() for endpoint, endpoint_limit in limits.items()}
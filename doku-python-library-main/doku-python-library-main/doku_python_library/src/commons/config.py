@@ -20,6 +20,7 @@ class Config:
     DIRECT_DEBIT_CARD_UNBINDING_URL= "/direct-debit/core/v1/registration-card-unbind"
     DIRECT_DEBIT_REFUND = "/direct-debit/core/v1/debit/refund"
     DIRECT_DEBIT_CHECK_STATUS = "/orders/v1.0/debit/status"
+    NOTIFICATION_TOKEN_EXPIRES_IN: int = 900
 
     @staticmethod
     def get_base_url(is_production: bool) -> str:
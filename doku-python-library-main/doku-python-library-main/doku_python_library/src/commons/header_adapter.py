@@ -0,0 +1,39 @@
+class HeaderAdapter:
+
+    @staticmethod
+    def normalize(headers) -> dict:
+        if headers is None:
+            return {}
+        items = headers.items() if hasattr(headers, "items") else headers
+        normalized: dict = {}
+        for name, value in items:
+            if isinstance(name, bytes):
+                name = name.decode("latin-1")
+            if isinstance(value, bytes):
+                value = value.decode("latin-1")
+            normalized[name.lower()] = value
+        return normalized
+
+    @staticmethod
+    def from_flask(request = None) -> dict:
+        if request is None:
+            from flask import request
+        return HeaderAdapter.normalize(request.headers)
+
+    @staticmethod
+    def from_starlette(request) -> dict:
+        return HeaderAdapter.normalize(request.headers.raw)
+
+    @staticmethod
+    def from_asgi_scope(scope: dict) -> dict:
+        return HeaderAdapter.normalize(scope.get("headers"))
+
+    @staticmethod
+    def from_wsgi_environ(environ: dict) -> dict:
+        normalized: dict = {}
+        for key, value in environ.items():
+            if key.startswith("HTTP_"):
+                normalized[key[5:].replace("_", "-").lower()] = value
+            elif key in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+                normalized[key.replace("_", "-").lower()] = value
+        return normalized
@@ -0,0 +1,95 @@
+from requests.adapters import HTTPAdapter
+from doku_python_library.src.commons.rate_limiter import RateLimiter
+from doku_python_library.src.commons.concurrency_limiter import AdaptiveConcurrencyLimiter
+from doku_python_library.src.commons.retry import RetryEngine
+from doku_python_library.src.commons.circuit_breaker import CircuitBreaker, CircuitOpenError
+from doku_python_library.src.commons.instrumentation import Instrumentation
+from doku_python_library.src.commons.json_codec import JsonCodec
+import requests
+import threading
+import time
+
+class HttpClient:
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 connect_timeout: float = 10, read_timeout: float = 30, rate_limiter: RateLimiter = None,
+                 concurrency_limiter: AdaptiveConcurrencyLimiter = None, retry_engine: RetryEngine = None,
+                 circuit_breaker: CircuitBreaker = None) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = (connect_timeout, read_timeout)
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.retry_engine = retry_engine if retry_engine is not None else RetryEngine()
+        self.circuit_breaker = circuit_breaker
+        self.session = requests.Session()
+        adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @staticmethod
+    def get_default() -> 'HttpClient':
+        if HttpClient._default is None:
+            with HttpClient._default_lock:
+                if HttpClient._default is None:
+                    HttpClient._default = HttpClient()
+        return HttpClient._default
+
+    @staticmethod
+    def resolve(http_client: 'HttpClient' = None) -> 'HttpClient':
+        return http_client if http_client is not None else HttpClient.get_default()
+
+    def request(self, method: str, url: str, json: dict = None, headers: dict = None, data: bytes = None) -> requests.Response:
+        endpoint: str = RateLimiter.get_endpoint(url)
+        if json is not None and data is None:
+            data = JsonCodec.dumps(json)
+        if data is not None:
+            headers = dict(headers) if headers is not None else {}
+            if not any(key.lower() == "content-type" for key in headers):
+                headers["Content-Type"] = "application/json"
+        try:
+            return self.retry_engine.execute(endpoint, lambda: self._send(method, url, data, headers, endpoint))
+        except CircuitOpenError:
+            return CircuitBreaker.open_circuit_response(url, endpoint)
+
+    def _send(self, method: str, url: str, data: bytes, headers: dict, endpoint: str) -> requests.Response:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.allow(endpoint)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(endpoint)
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.acquire(endpoint)
+        started_at: float = time.monotonic()
+        status_code: int = None
+        try:
+            with Instrumentation.span("http.request", method=method, endpoint=endpoint) as span:
+                response: requests.Response = self.session.request(method=method, url=url, data=data, headers=headers, timeout=self.timeout)
+                status_code = response.status_code
+                if span is not None:
+                    span.set_attribute("status_code", status_code)
+            return response
+        finally:
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.release(endpoint, status_code, time.monotonic() - started_at)
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record(endpoint, status_code)
+
+    def post(self, url: str, json: dict = None, headers: dict = None, data: bytes = None) -> requests.Response:
+        return self.request("POST", url=url, json=json, headers=headers, data=data)
+
+    def put(self, url: str, json: dict = None, headers: dict = None, data: bytes = None) -> requests.Response:
+        return self.request("PUT", url=url, json=json, headers=headers, data=data)
+
+    def delete(self, url: str, json: dict = None, headers: dict = None, data: bytes = None) -> requests.Response:
+        return self.request("DELETE", url=url, json=json, headers=headers, data=data)
+
+    def close(self) -> None:
+        self.session.close()
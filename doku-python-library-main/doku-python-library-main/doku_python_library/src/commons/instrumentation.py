@@ -0,0 +1,203 @@
+from bisect import bisect_left
+import contextvars
+import functools
+import threading
+import time
+
+_current_span = contextvars.ContextVar("doku_current_span", default=None)
+
+class Span:
+
+    __slots__ = ("name", "attributes", "parent", "start_time", "start_time_ns", "duration", "error", "observer_data")
+
+    def __init__(self, name: str, attributes: dict, parent: 'Span') -> None:
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.start_time: float = None
+        self.start_time_ns: int = None
+        self.duration: float = None
+        self.error: Exception = None
+        self.observer_data: dict = {}
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def get_root(self) -> 'Span':
+        span: Span = self
+        while span.parent is not None:
+            span = span.parent
+        return span
+
+class SpanObserver:
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        pass
+
+class _NoopScope:
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+_NOOP_SCOPE = _NoopScope()
+
+class _SpanScope:
+
+    __slots__ = ("span", "observers", "token")
+
+    def __init__(self, name: str, attributes: dict, observers: tuple) -> None:
+        self.span = Span(name, attributes, _current_span.get())
+        self.observers = observers
+        self.token = None
+
+    def __enter__(self) -> Span:
+        span: Span = self.span
+        for observer in self.observers:
+            observer.on_start(span)
+        self.token = _current_span.set(span)
+        span.start_time_ns = time.time_ns()
+        span.start_time = time.perf_counter()
+        return span
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        span: Span = self.span
+        span.duration = time.perf_counter() - span.start_time
+        span.error = exc
+        _current_span.reset(self.token)
+        for observer in self.observers:
+            try:
+                observer.on_end(span)
+            except Exception as e:
+                print("Failed Observe Span "+str(e))
+        return False
+
+class Instrumentation:
+
+    _observers: tuple = ()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def add_observer(observer: SpanObserver) -> SpanObserver:
+        with Instrumentation._lock:
+            if observer not in Instrumentation._observers:
+                Instrumentation._observers = Instrumentation._observers + (observer,)
+        return observer
+
+    @staticmethod
+    def remove_observer(observer: SpanObserver) -> None:
+        with Instrumentation._lock:
+            Instrumentation._observers = tuple(o for o in Instrumentation._observers if o is not observer)
+
+    @staticmethod
+    def clear_observers() -> None:
+        with Instrumentation._lock:
+            Instrumentation._observers = ()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return bool(Instrumentation._observers)
+
+    @staticmethod
+    def current_span() -> Span:
+        return _current_span.get()
+
+    @staticmethod
+    def span(name: str, **attributes):
+        observers: tuple = Instrumentation._observers
+        if not observers:
+            return _NOOP_SCOPE
+        return _SpanScope(name, attributes, observers)
+
+    @staticmethod
+    def traced(name: str):
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                observers: tuple = Instrumentation._observers
+                if not observers:
+                    return func(*args, **kwargs)
+                attributes: dict = {}
+                request = args[1] if len(args) > 1 else kwargs.get("request")
+                channel = getattr(getattr(request, "additional_info", None), "channel", None)
+                if isinstance(channel, str):
+                    attributes["channel"] = channel
+                with _SpanScope(name, attributes, observers) as span:
+                    result = func(*args, **kwargs)
+                    response_code = getattr(result, "response_code", None)
+                    if response_code is not None:
+                        span.set_attribute("responseCode", response_code)
+                    return result
+            return wrapper
+        return decorator
+
+class HistogramCollector(SpanObserver):
+
+    DEFAULT_BUCKETS: tuple = tuple(1e-6 * 2 ** (index / 2) for index in range(52))
+
+    def __init__(self, buckets: tuple = None) -> None:
+        self.buckets: tuple = tuple(sorted(buckets)) if buckets is not None else HistogramCollector.DEFAULT_BUCKETS
+        self._histograms: dict = {}
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        index: int = bisect_left(self.buckets, span.duration)
+        with self._lock:
+            histogram: dict = self._histograms.get(span.name)
+            if histogram is None:
+                histogram = {"counts": [0] * (len(self.buckets) + 1), "count": 0, "sum": 0.0, "min": span.duration, "max": span.duration, "errors": 0}
+                self._histograms[span.name] = histogram
+            histogram["counts"][index] += 1
+            histogram["count"] += 1
+            histogram["sum"] += span.duration
+            histogram["min"] = min(histogram["min"], span.duration)
+            histogram["max"] = max(histogram["max"], span.duration)
+            if span.error is not None:
+                histogram["errors"] += 1
+
+    def percentile(self, name: str, quantile: float) -> float:
+        with self._lock:
+            histogram: dict = self._histograms.get(name)
+            if histogram is None or histogram["count"] == 0:
+                return None
+            rank: float = quantile * histogram["count"]
+            cumulative: int = 0
+            for index, count in enumerate(histogram["counts"]):
+                if count and cumulative + count >= rank:
+                    lower: float = self.buckets[index - 1] if index > 0 else 0.0
+                    upper: float = self.buckets[index] if index < len(self.buckets) else histogram["max"]
+                    value: float = lower + (upper - lower) * (rank - cumulative) / count
+                    return min(max(value, histogram["min"]), histogram["max"])
+                cumulative += count
+            return histogram["max"]
+
+    def summary(self) -> dict:
+        with self._lock:
+            names: list = list(self._histograms)
+        result: dict = {}
+        for name in names:
+            with self._lock:
+                histogram: dict = self._histograms[name]
+                count, total, minimum, maximum, errors = histogram["count"], histogram["sum"], histogram["min"], histogram["max"], histogram["errors"]
+            result[name] = {
+                "count": count,
+                "errors": errors,
+                "mean": total / count,
+                "min": minimum,
+                "max": maximum,
+                "p50": self.percentile(name, 0.5),
+                "p90": self.percentile(name, 0.9),
+                "p99": self.percentile(name, 0.99)
+            }
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
@@ -0,0 +1,53 @@
+from doku_python_library.src.commons.instrumentation import Instrumentation
+import hashlib
+import json
+import re
+
+_EXPONENT_PATTERN = re.compile(rb'[:,\[]-?\d+(?:\.\d+)?[eE]')
+
+class JsonCodec:
+
+    _backend: str = "json"
+    _orjson = None
+    _orjson_options: int = 0
+
+    @staticmethod
+    def set_backend(backend: str) -> None:
+        if backend not in ("json", "orjson", "auto"):
+            raise Exception("backend must be one of 'json', 'orjson' or 'auto'.")
+        if backend != "json":
+            try:
+                import orjson
+            except ImportError:
+                if backend == "orjson":
+                    raise Exception("orjson backend requires the orjson package to be installed.")
+                orjson = None
+            if orjson is not None:
+                JsonCodec._orjson = orjson
+                JsonCodec._orjson_options = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_SUBCLASS
+            backend = "json" if orjson is None else "orjson"
+        JsonCodec._backend = backend
+
+    @staticmethod
+    def get_backend() -> str:
+        return JsonCodec._backend
+
+    @staticmethod
+    def dumps(value) -> bytes:
+        with Instrumentation.span("serialize.body"):
+            if JsonCodec._backend == "orjson":
+                try:
+                    body: bytes = JsonCodec._orjson.dumps(value, default=JsonCodec._reject, option=JsonCodec._orjson_options)
+                    if body.isascii() and b"null" not in body and _EXPONENT_PATTERN.search(body) is None and not (body[:1] in b"-0123456789" and b"e" in body.lower()):
+                        return body
+                except TypeError:
+                    pass
+            return json.dumps(value, separators=(',', ':'), allow_nan=False).encode("utf-8")
+
+    @staticmethod
+    def _reject(value):
+        raise TypeError
+
+    @staticmethod
+    def sha256_hex(body: bytes) -> str:
+        return hashlib.sha256(body).hexdigest()
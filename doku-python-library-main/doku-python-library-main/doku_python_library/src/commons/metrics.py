@@ -0,0 +1,139 @@
+from bisect import bisect_left
+from doku_python_library.src.commons.instrumentation import Instrumentation, Span, SpanObserver
+import math
+import threading
+
+class MetricsRegistry(SpanObserver):
+
+    DEFAULT_BUCKETS: tuple = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, buckets: tuple = None, prefix: str = "doku_sdk") -> None:
+        self.buckets: tuple = tuple(sorted(buckets)) if buckets is not None else MetricsRegistry.DEFAULT_BUCKETS
+        self.prefix = prefix
+        self._operations: dict = {}
+        self._errors: dict = {}
+        self._durations: dict = {}
+        self._in_flight: dict = {}
+        self._token_refreshes: dict = {}
+        self._cache_requests: dict = {}
+        self._retries: dict = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_default() -> 'MetricsRegistry':
+        if MetricsRegistry._default is None:
+            with MetricsRegistry._default_lock:
+                if MetricsRegistry._default is None:
+                    MetricsRegistry._default = Instrumentation.add_observer(MetricsRegistry())
+        return MetricsRegistry._default
+
+    def on_start(self, span: Span) -> None:
+        if span.name == "http.request":
+            with self._lock:
+                MetricsRegistry._add(self._in_flight, (span.attributes.get("endpoint", ""),), 1)
+
+    def on_end(self, span: Span) -> None:
+        name: str = span.name
+        attributes: dict = span.attributes
+        with self._lock:
+            if name.startswith("snap."):
+                operation: str = name[5:]
+                labels: tuple = (operation, attributes.get("channel", ""))
+                MetricsRegistry._add(self._operations, labels, 1)
+                self._observe(labels, span.duration)
+                response_code: str = "exception" if span.error is not None else str(attributes.get("responseCode", "unknown"))
+                if not response_code.startswith("2"):
+                    MetricsRegistry._add(self._errors, (operation, response_code), 1)
+            elif name == "http.request":
+                MetricsRegistry._add(self._in_flight, (attributes.get("endpoint", ""),), -1)
+            elif name == "retry.backoff":
+                MetricsRegistry._add(self._retries, (attributes.get("endpoint", ""),), 1)
+            elif name == "token.refresh":
+                MetricsRegistry._add(self._token_refreshes, (attributes.get("token_type", "b2b"),), 1)
+            elif name == "token.check" or name == "token_b2b2c.lookup":
+                if "hit" in attributes:
+                    cache: str = "token_b2b" if name == "token.check" else "token_b2b2c"
+                    MetricsRegistry._add(self._cache_requests, (cache, "hit" if attributes["hit"] else "miss"), 1)
+
+    @staticmethod
+    def _add(values: dict, labels: tuple, amount: int) -> None:
+        values[labels] = values.get(labels, 0) + amount
+
+    def _observe(self, labels: tuple, duration: float) -> None:
+        histogram: list = self._durations.get(labels)
+        if histogram is None:
+            histogram = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            self._durations[labels] = histogram
+        histogram[0][bisect_left(self.buckets, duration)] += 1
+        histogram[1] += duration
+        histogram[2] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            for values in (self._operations, self._errors, self._durations, self._in_flight,
+                           self._token_refreshes, self._cache_requests, self._retries):
+                values.clear()
+
+    @staticmethod
+    def _escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace("\"", "\\\"")
+
+    @staticmethod
+    def _format_labels(names: tuple, values: tuple) -> str:
+        if not names:
+            return ""
+        return "{" + ",".join("{name}=\"{value}\"".format(name=name, value=MetricsRegistry._escape(value)) for name, value in zip(names, values)) + "}"
+
+    @staticmethod
+    def _format_value(value) -> str:
+        if isinstance(value, float):
+            if math.isinf(value):
+                return "+Inf" if value > 0 else "-Inf"
+            return repr(value)
+        return str(value)
+
+    def _render_family(self, lines: list, name: str, metric_type: str, description: str, label_names: tuple, values: dict) -> None:
+        metric_name: str = "{prefix}_{name}".format(prefix=self.prefix, name=name)
+        lines.append("# HELP {name} {description}".format(name=metric_name, description=description))
+        lines.append("# TYPE {name} {type}".format(name=metric_name, type=metric_type))
+        for labels in sorted(values):
+            lines.append(metric_name + MetricsRegistry._format_labels(label_names, labels) + " " + MetricsRegistry._format_value(values[labels]))
+
+    def _render_histogram(self, lines: list, name: str, description: str, label_names: tuple, values: dict) -> None:
+        metric_name: str = "{prefix}_{name}".format(prefix=self.prefix, name=name)
+        lines.append("# HELP {name} {description}".format(name=metric_name, description=description))
+        lines.append("# TYPE {name} histogram".format(name=metric_name))
+        bucket_names: tuple = label_names + ("le",)
+        for labels in sorted(values):
+            counts, total, count = values[labels]
+            cumulative: int = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                lines.append(metric_name + "_bucket" + MetricsRegistry._format_labels(bucket_names, labels + (MetricsRegistry._format_value(float(bound)),)) + " " + str(cumulative))
+            lines.append(metric_name + "_sum" + MetricsRegistry._format_labels(label_names, labels) + " " + MetricsRegistry._format_value(total))
+            lines.append(metric_name + "_count" + MetricsRegistry._format_labels(label_names, labels) + " " + str(count))
+
+    def render(self) -> str:
+        with self._lock:
+            operations: dict = dict(self._operations)
+            errors: dict = dict(self._errors)
+            durations: dict = {labels: (list(value[0]), value[1], value[2]) for labels, value in self._durations.items()}
+            in_flight: dict = dict(self._in_flight)
+            token_refreshes: dict = dict(self._token_refreshes)
+            cache_requests: dict = dict(self._cache_requests)
+            retries: dict = dict(self._retries)
+        lines: list = []
+        self._render_family(lines, "operations_total", "counter", "Total SDK operations by operation and channel.", ("operation", "channel"), operations)
+        self._render_family(lines, "operation_errors_total", "counter", "Failed SDK operations by operation and SNAP responseCode.", ("operation", "response_code"), errors)
+        self._render_histogram(lines, "operation_duration_seconds", "SDK operation latency in seconds.", ("operation", "channel"), durations)
+        self._render_family(lines, "http_requests_in_flight", "gauge", "HTTP requests currently in flight by endpoint.", ("endpoint",), in_flight)
+        self._render_family(lines, "token_refreshes_total", "counter", "Access token refreshes.", ("token_type",), token_refreshes)
+        self._render_family(lines, "cache_requests_total", "counter", "Token cache lookups by cache and result.", ("cache", "result"), cache_requests)
+        self._render_family(lines, "retries_total", "counter", "HTTP retries by endpoint.", ("endpoint",), retries)
+        return "\n".join(lines) + "\n"
+
+def render_metrics(registry: MetricsRegistry = None) -> str:
+    return (registry if registry is not None else MetricsRegistry.get_default()).render()
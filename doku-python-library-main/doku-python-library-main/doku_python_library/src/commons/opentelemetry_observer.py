@@ -0,0 +1,28 @@
+from doku_python_library.src.commons.instrumentation import Span, SpanObserver
+
+class OpenTelemetryObserver(SpanObserver):
+
+    def __init__(self, tracer = None, tracer_name: str = "doku_python_library") -> None:
+        from opentelemetry import trace
+        self._trace = trace
+        self.tracer = tracer if tracer is not None else trace.get_tracer(tracer_name)
+
+    def on_start(self, span: Span) -> None:
+        context = None
+        if span.parent is not None:
+            parent_span = span.parent.observer_data.get(self)
+            if parent_span is not None:
+                context = self._trace.set_span_in_context(parent_span)
+        span.observer_data[self] = self.tracer.start_span(span.name, context=context, attributes=dict(span.attributes))
+
+    def on_end(self, span: Span) -> None:
+        otel_span = span.observer_data.pop(self, None)
+        if otel_span is None:
+            return
+        for key, value in span.attributes.items():
+            if value is not None:
+                otel_span.set_attribute(key, value)
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(span.error)))
+        otel_span.end(end_time=span.start_time_ns + int(span.duration * 1e9))
@@ -0,0 +1,75 @@
+from urllib.parse import urlsplit
+import threading
+import time
+
+class TokenBucket:
+
+    def __init__(self, rate: float, capacity: float = None) -> None:
+        if rate <= 0:
+            raise Exception("rate must be greater than 0.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens: float = self.capacity
+        self.updated_at: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now: float = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self) -> float:
+        wait: float = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+class RateLimiter:
+
+    def __init__(self, rates: dict = None, default_rate: float = None, burst: float = None) -> None:
+        self.rates = dict(rates or {})
+        self.default_rate = default_rate
+        self.burst = burst
+        self.throttled_count: int = 0
+        self.throttled_seconds: float = 0.0
+        self._buckets: dict = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_endpoint(url: str) -> str:
+        return urlsplit(url).path
+
+    def _get_bucket(self, endpoint: str) -> TokenBucket:
+        bucket: TokenBucket = self._buckets.get(endpoint)
+        if bucket is None:
+            rate: float = self.rates.get(endpoint, self.default_rate)
+            if rate is None:
+                return None
+            with self._lock:
+                bucket = self._buckets.get(endpoint)
+                if bucket is None:
+                    bucket = TokenBucket(rate, self.burst)
+                    self._buckets[endpoint] = bucket
+        return bucket
+
+    def acquire(self, endpoint: str) -> float:
+        bucket: TokenBucket = self._get_bucket(endpoint)
+        if bucket is None:
+            return 0.0
+        wait: float = bucket.acquire()
+        if wait > 0:
+            with self._lock:
+                self.throttled_count += 1
+                self.throttled_seconds += wait
+        return wait
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "throttledCount": self.throttled_count,
+                "throttledSeconds": self.throttled_seconds,
+                "rates": {endpoint: bucket.rate for endpoint, bucket in self._buckets.items()}
+            }
@@ -0,0 +1,148 @@
+import datetime
+import re
+
+_ISO_DATETIME_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:[0-5]\d')
+
+class Rule:
+
+    __slots__ = ("expression", "message", "constant")
+
+    def __init__(self, expression: str, message: str, constant = None) -> None:
+        self.expression = expression
+        self.message = message
+        self.constant = constant
+
+    @staticmethod
+    def not_null(message: str) -> 'Rule':
+        return Rule("value is not None", message)
+
+    @staticmethod
+    def string(message: str) -> 'Rule':
+        return Rule("isinstance(value, str)", message)
+
+    @staticmethod
+    def ascii(message: str) -> 'Rule':
+        return Rule("value.isascii()", message)
+
+    @staticmethod
+    def boolean(message: str) -> 'Rule':
+        return Rule("isinstance(value, bool)", message)
+
+    @staticmethod
+    def length(length: int, message: str) -> 'Rule':
+        return Rule("len(value) == {constant}", message, length)
+
+    @staticmethod
+    def min_length(length: int, message: str) -> 'Rule':
+        return Rule("len(value) >= {constant}", message, length)
+
+    @staticmethod
+    def max_length(length: int, message: str) -> 'Rule':
+        return Rule("len(value) <= {constant}", message, length)
+
+    @staticmethod
+    def pattern(pattern: str, message: str) -> 'Rule':
+        return Rule("{constant}(value) is not None", message, re.compile(pattern).match)
+
+    @staticmethod
+    def one_of(values, message: str) -> 'Rule':
+        return Rule("value in {constant}", message, frozenset(values))
+
+    @staticmethod
+    def equals(expected, message: str) -> 'Rule':
+        return Rule("value == {constant}", message, expected)
+
+    @staticmethod
+    def datetime_format(date_format: str, message: str) -> 'Rule':
+        def check(value, request) -> bool:
+            if date_format == "%Y-%m-%dT%H:%M:%S%z" and _ISO_DATETIME_PATTERN.fullmatch(value):
+                try:
+                    datetime.datetime.fromisoformat(value)
+                    return True
+                except ValueError:
+                    pass
+            datetime.datetime.strptime(value, date_format)
+            return True
+        return Rule.custom(check, message)
+
+    @staticmethod
+    def custom(check, message: str) -> 'Rule':
+        return Rule("{constant}(value, request)", message, check)
+
+class FieldRule:
+
+    __slots__ = ("path", "rules", "optional", "when")
+
+    def __init__(self, path: str, rules: list, optional: bool = False, when = None) -> None:
+        self.path = path
+        self.rules = rules
+        self.optional = optional
+        self.when = when
+
+class RequestValidator:
+
+    def __init__(self, fields: list) -> None:
+        self.fields = fields
+        self._check = RequestValidator._compile(fields)
+
+    @staticmethod
+    def _compile(fields: list):
+        namespace: dict = {}
+        lines: list = ["def check(request, errors):"]
+        for field_index, field in enumerate(fields):
+            indent: str = "    "
+            if field.when is not None:
+                namespace["when_{index}".format(index=field_index)] = field.when
+                lines += [
+                    indent + "try:",
+                    indent + "    skip = not when_{index}(request)".format(index=field_index),
+                    indent + "except AttributeError:",
+                    indent + "    skip = True",
+                    indent + "if not skip:"
+                ]
+                indent += "    "
+            if field.path is None:
+                lines.append(indent + "value = request")
+            else:
+                lines += [
+                    indent + "try:",
+                    indent + "    value = request.{path}".format(path=field.path),
+                    indent + "except AttributeError:",
+                    indent + "    value = None"
+                ]
+            if field.optional:
+                lines.append(indent + "if value is not None:")
+                indent += "    "
+            lines.append(indent + "try:")
+            rule_indent: str = indent + "    "
+            for rule_index, rule in enumerate(field.rules):
+                name: str = "{field}_{rule}".format(field=field_index, rule=rule_index)
+                namespace["message_" + name] = rule.message
+                namespace["constant_" + name] = rule.constant
+                lines += [
+                    rule_indent + "message = message_" + name,
+                    rule_indent + "if " + rule.expression.format(constant="constant_" + name) + ":"
+                ]
+                rule_indent += "    "
+            lines += [
+                rule_indent + "message = None",
+                indent + "except (TypeError, AttributeError, ValueError):",
+                indent + "    pass",
+                indent + "if message is not None:",
+                indent + "    if errors is None:",
+                indent + "        raise Exception(message)",
+                indent + "    errors.append(message)"
+            ]
+        lines.append("    return errors")
+        exec(compile("\n".join(lines), "<RequestValidator>", "exec"), namespace)
+        return namespace["check"]
+
+    def validate(self, request) -> None:
+        self._check(request, None)
+
+    def errors(self, request) -> list:
+        return self._check(request, [])
+
+    def validate_many(self, requests) -> list:
+        check = self._check
+        return [check(request, []) for request in requests]
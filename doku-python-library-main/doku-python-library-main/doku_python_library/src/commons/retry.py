@@ -0,0 +1,134 @@
+from doku_python_library.src.commons.config import Config
+from doku_python_library.src.commons.instrumentation import Instrumentation
+import random
+import threading
+import time
+import requests
+import urllib3
+
+class RetryPolicy:
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.2, max_delay: float = 2.0,
+                 retry_status_codes: tuple = (429, 502, 503, 504), retry_on_timeout: bool = True,
+                 retry_on_connection_error: bool = True, respect_retry_after: bool = True,
+                 connect_errors_only: bool = False) -> None:
+        if max_attempts < 1:
+            raise Exception("max_attempts must be at least 1.")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_on_timeout = retry_on_timeout
+        self.retry_on_connection_error = retry_on_connection_error
+        self.respect_retry_after = respect_retry_after
+        self.connect_errors_only = connect_errors_only
+
+    @staticmethod
+    def read() -> 'RetryPolicy':
+        return RetryPolicy(max_attempts=4, base_delay=0.1, retry_status_codes=(429, 500, 502, 503, 504))
+
+    @staticmethod
+    def write() -> 'RetryPolicy':
+        return RetryPolicy(max_attempts=3, base_delay=0.2, retry_status_codes=(429, 503), retry_on_timeout=False,
+                           connect_errors_only=True)
+
+    @staticmethod
+    def no_retry() -> 'RetryPolicy':
+        return RetryPolicy(max_attempts=1)
+
+    def should_retry_response(self, response: requests.Response) -> bool:
+        return response.status_code in self.retry_status_codes
+
+    def should_retry_exception(self, e: Exception) -> bool:
+        if isinstance(e, requests.exceptions.ConnectionError):
+            if self.connect_errors_only and not RetryPolicy.is_connect_failure(e):
+                return False
+            return self.retry_on_connection_error
+        if isinstance(e, requests.exceptions.Timeout):
+            return self.retry_on_timeout
+        return False
+
+    @staticmethod
+    def is_connect_failure(e: Exception) -> bool:
+        if isinstance(e, requests.exceptions.ConnectTimeout):
+            return True
+        reason = e.args[0] if e.args else None
+        reason = getattr(reason, "reason", reason)
+        return isinstance(reason, (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ConnectTimeoutError))
+
+    def get_delay(self, attempt: int, response: requests.Response = None) -> float:
+        if self.respect_retry_after and response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    return min(max(float(retry_after), 0.0), self.max_delay)
+                except ValueError:
+                    pass
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+class RetryEngine:
+
+    def __init__(self, policies: dict = None, default_policy: RetryPolicy = None, use_default_policies: bool = True) -> None:
+        self.policies: dict = RetryEngine.default_policies() if use_default_policies else {}
+        self.policies.update(policies or {})
+        self.default_policy = default_policy if default_policy is not None else RetryPolicy.write()
+        self._retry_counts: dict = {}
+        self._exhausted_counts: dict = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_policies() -> dict:
+        return {
+            Config.ACCESS_TOKEN: RetryPolicy.read(),
+            Config.ACCESS_TOKEN_B2B2C: RetryPolicy.read(),
+            Config.CHECK_STATUS_VA: RetryPolicy.read(),
+            Config.DIRECT_DEBIT_BALANCE_INQUIRY_URL: RetryPolicy.read(),
+            Config.DIRECT_DEBIT_CHECK_STATUS: RetryPolicy.read()
+        }
+
+    @staticmethod
+    def disabled() -> 'RetryEngine':
+        return RetryEngine(default_policy=RetryPolicy.no_retry(), use_default_policies=False)
+
+    def get_policy(self, endpoint: str) -> RetryPolicy:
+        return self.policies.get(endpoint, self.default_policy)
+
+    def _count(self, counts: dict, endpoint: str) -> None:
+        with self._lock:
+            counts[endpoint] = counts.get(endpoint, 0) + 1
+
+    def execute(self, endpoint: str, send) -> requests.Response:
+        policy: RetryPolicy = self.get_policy(endpoint)
+        attempt: int = 0
+        while True:
+            try:
+                response: requests.Response = send()
+            except Exception as e:
+                retryable: bool = policy.should_retry_exception(e)
+                if not retryable or attempt + 1 >= policy.max_attempts:
+                    if retryable:
+                        self._count(self._exhausted_counts, endpoint)
+                    raise
+                delay: float = policy.get_delay(attempt)
+            else:
+                if not policy.should_retry_response(response):
+                    return response
+                if attempt + 1 >= policy.max_attempts:
+                    self._count(self._exhausted_counts, endpoint)
+                    return response
+                delay = policy.get_delay(attempt, response)
+                response.close()
+            self._count(self._retry_counts, endpoint)
+            attempt += 1
+            with Instrumentation.span("retry.backoff", endpoint=endpoint, attempt=attempt):
+                time.sleep(delay)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                endpoint: {
+                    "retries": self._retry_counts.get(endpoint, 0),
+                    "exhausted": self._exhausted_counts.get(endpoint, 0)
+                }
+                for endpoint in set(self._retry_counts) | set(self._exhausted_counts)
+            }
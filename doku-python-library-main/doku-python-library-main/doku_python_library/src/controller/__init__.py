@@ -1,4 +1,11 @@
-from doku_python_library.src.controller.token_controller import *
-from doku_python_library.src.controller.va_controller import *
-from doku_python_library.src.controller.notification_controler import *
-from doku_python_library.src.controller.direct_debit_controller import *
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = {
+    "TokenController": "doku_python_library.src.controller.token_controller",
+    "VaController": "doku_python_library.src.controller.va_controller",
+    "NotificationController": "doku_python_library.src.controller.notification_controler",
+    "DirectDebitController": "doku_python_library.src.controller.direct_debit_controller"
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -2,6 +2,8 @@ from doku_python_library.src.model.direct_debit.account_binding_request import A
 from doku_python_library.src.model.direct_debit.account_binding_response import AccountBindingResponse
 from doku_python_library.src.services.token_service import TokenService
 from doku_python_library.src.commons.config import Config
+from doku_python_library.src.commons.http_client import HttpClient
+from doku_python_library.src.commons.json_codec import JsonCodec
 from doku_python_library.src.commons.snap_utils import SnapUtils
 from doku_python_library.src.model.general.request_header import RequestHeader
 from doku_python_library.src.services.direct_debit_service import DirectDebitService
@@ -29,16 +31,17 @@ class DirectDebitController:
     @staticmethod
     def do_account_binding(request: AccountBindingRequest, secret_key: str,
                            client_id: str, device_id: str, ip_address: str, token_b2b: str,
-                           is_production: bool) -> AccountBindingResponse:
+                           is_production: bool, http_client: HttpClient = None) -> AccountBindingResponse:
         try:
             timestamp: str = TokenService.get_timestamp()
             endpoint: str = Config.DIRECT_DEBIT_ACCOUNT_BINDING_URL
             method: str = "POST"
-            signature: str = TokenService.generate_symmetric_signature(
+            body: bytes = JsonCodec.dumps(request.json())
+            signature: str = TokenService.generate_body_signature(
                 http_method=method,
                 endpoint=endpoint,
                 token_b2b=token_b2b,
-                request=request.json(),
+                body=body,
                 timestamp=timestamp,
                 secret_key=secret_key
             )
@@ -54,22 +57,23 @@ class DirectDebitController:
                 ip_address=ip_address
             )
 
-            return DirectDebitService.do_account_binding_process(request_header=request_header, request=request, is_production=is_production)
+            return DirectDebitService.do_account_binding_process(request_header=request_header, request=request, is_production=is_production, http_client=http_client, body=body)
         except Exception as e:
             raise Exception(e)
 
     @staticmethod
     def do_payment_process(request: PaymentRequest, secret_key: str, client_id: str, 
-                           ip_address: str, token_b2b: str, token_b2b2c: str, is_production: bool) -> PaymentResponse:
+                           ip_address: str, token_b2b: str, token_b2b2c: str, is_production: bool, http_client: HttpClient = None) -> PaymentResponse:
         try:
             timestamp: str = TokenService.get_timestamp()
             endpoint: str = Config.DIRECT_DEBIT_PAYMENT_URL
             method: str = "POST"
-            signature: str = TokenService.generate_symmetric_signature(
+            body: bytes = JsonCodec.dumps(request.create_request_body())
+            signature: str = TokenService.generate_body_signature(
                 http_method=method,
                 endpoint=endpoint,
                 token_b2b=token_b2b,
-                request=request.create_request_body(),
+                body=body,
                 timestamp=timestamp,
                 secret_key=secret_key
             )
@@ -84,21 +88,22 @@ class DirectDebitController:
                 ip_address=ip_address,
                 token_b2b2c=token_b2b2c
             )
-            return DirectDebitService.do_payment_process(request_header=request_header, request=request, is_production=is_production)
+            return DirectDebitService.do_payment_process(request_header=request_header, request=request, is_production=is_production, http_client=http_client, body=body)
         except Exception as e:
             raise Exception(e)
         
     @staticmethod
-    def do_balance_inquiry(request: BalanceInquiryRequest, ip_address: str, token: str, token_b2b2c: str, secret_key: str, client_id: str, is_production: bool) -> BalanceInquiryResponse:
+    def do_balance_inquiry(request: BalanceInquiryRequest, ip_address: str, token: str, token_b2b2c: str, secret_key: str, client_id: str, is_production: bool, http_client: HttpClient = None) -> BalanceInquiryResponse:
         try:
             timestamp: str = TokenService.get_timestamp()
             endpoint: str = Config.DIRECT_DEBIT_BALANCE_INQUIRY_URL
             method: str = "POST"
-            signature: str = TokenService.generate_symmetric_signature(
+            body: bytes = JsonCodec.dumps(request.create_request_body())
+            signature: str = TokenService.generate_body_signature(
                 http_method=method,
                 endpoint=endpoint,
                 token_b2b=token,
-                request=request.create_request_body(),
+                body=body,
                 timestamp=timestamp,
                 secret_key=secret_key
             )
@@ -114,22 +119,23 @@ class DirectDebitController:
                 token_b2b2c=token_b2b2c
             )
             
-            return DirectDebitService.do_balance_inquiry(request_header=request_header, request=request, is_production=is_production)
+            return DirectDebitService.do_balance_inquiry(request_header=request_header, request=request, is_production=is_production, http_client=http_client, body=body)
         except Exception as e:
             raise Exception(e)
 
     @staticmethod
     def do_account_unbinding(request: AccountUnbindingRequest, secret_key: str, client_id: str,
-                             ip_address: str, token: str, is_production: bool) -> AccountUnbindingResponse:
+                             ip_address: str, token: str, is_production: bool, http_client: HttpClient = None) -> AccountUnbindingResponse:
         try:
             timestamp: str = TokenService.get_timestamp()
             endpoint: str = Config.DIRECT_DEBIT_ACCOUNT_UNBINDING_URL
             method: str = "POST"
-            signature: str = TokenService.generate_symmetric_signature(
+            body: bytes = JsonCodec.dumps(request.create_request_body())
+            signature: str = TokenService.generate_body_signature(
                 http_method=method,
                 endpoint=endpoint,
                 token_b2b=token,
-                request=request.create_request_body(),
+                body=body,
                 timestamp=timestamp,
                 secret_key=secret_key
             )
@@ -143,22 +149,23 @@ class DirectDebitController:
                 signature=signature,
                 ip_address=ip_address
             )
-            return DirectDebitService.do_account_unbinding_process(request_header=request_header, request=request, is_production=is_production)
+            return DirectDebitService.do_account_unbinding_process(request_header=request_header, request=request, is_production=is_production, http_client=http_client, body=body)
         except Exception as e:
             raise Exception(e)
 
     @staticmethod
     def do_payment_jump_app(request: PaymentJumpAppRequest, client_id: str, token_b2b: str, secret_key: str, device_id: str,
-                            ip_address: str, is_production: bool) -> PaymentJumpAppResponse:
+                            ip_address: str, is_production: bool, http_client: HttpClient = None) -> PaymentJumpAppResponse:
         try:
             timestamp: str = TokenService.get_timestamp()
             endpoint: str = Config.DIRECT_DEBIT_PAYMENT_URL
             method: str = "POST"
-            signature: str = TokenService.generate_symmetric_signature(
+            body: bytes = JsonCodec.dumps(request.create_request_body())
+            signature: str = TokenService.generate_body_signature(
                 http_method=method,
                 endpoint=endpoint,
                 token_b2b=token_b2b,
-                request=request.create_request_body(),
+                body=body,
                 timestamp=timestamp,
                 secret_key=secret_key
             )
@@ -173,13 +180,13 @@ class DirectDebitController:
                 ip_address=ip_address,
                 device_id=device_id
             )
-            return DirectDebitService.do_payment_jump_app_process(request_header=request_header, request=request, is_production=is_production)
+            return DirectDebitService.do_payment_jump_app_process(request_header=request_header, request=request, is_production=is_production, http_client=http_client, body=body)
         except Exception as e:
             raise Exception(e)
 
     @staticmethod
     def do_card_registration(request: CardRegistrationRequest, secret_key: str, client_id: str, 
-                             channel_id: str, token_b2b: str, is_production: bool) -> CardRegistrationResponse:
+                             channel_id: str, token_b2b: str, is_production: bool, http_client: HttpClient = None) -> CardRegistrationResponse:
         try:
             if isinstance(request.card_data, BankCardData):
                 encrypted_card_data = DirectDebitController.encrypt_card(request.card_data, secret_key)
@@ -187,11 +194,12 @@ class DirectDebitController:
             timestamp: str = TokenService.get_timestamp()
             endpoint: str = Config.DIRECT_DEBIT_CARD_REGISTRATION
             method: str = "POST"
-            signature: str = TokenService.generate_symmetric_signature(
+            body: bytes = JsonCodec.dumps(request.create_request_body())
+            signature: str = TokenService.generate_body_signature(
                 http_method=method,
                 endpoint=endpoint,
                 token_b2b=token_b2b,
-                request=request.create_request_body(),
+                body=body,
                 timestamp=timestamp,
                 secret_key=secret_key
             )
@@ -205,22 +213,23 @@ class DirectDebitController:
                 signature=signature,
             )
 
-            return DirectDebitService.do_card_registration_process(request_header=request_header, request=request, is_production=is_production)
+            return DirectDebitService.do_card_registration_process(request_header=request_header, request=request, is_production=is_production, http_client=http_client, body=body)
         except Exception as e:
             raise Exception(e)
 
     @staticmethod
     def do_refund(request: RefundRequest, secret_key: str, client_id: str, ip_address: str, token_b2b: str, 
-                  token_b2b2c: str, is_production: bool, device_id: str) -> RefundResponse:
+                  token_b2b2c: str, is_production: bool, device_id: str, http_client: HttpClient = None) -> RefundResponse:
         try:
             timestamp: str = TokenService.get_timestamp()
             endpoint: str = Config.DIRECT_DEBIT_REFUND
             method: str = "POST"
-            signature: str = TokenService.generate_symmetric_signature(
+            body: bytes = JsonCodec.dumps(request.create_request_body())
+            signature: str = TokenService.generate_body_signature(
                 http_method=method,
                 endpoint=endpoint,
                 token_b2b=token_b2b,
-                request=request.create_request_body(),
+                body=body,
                 timestamp=timestamp,
                 secret_key=secret_key
             )
@@ -240,23 +249,26 @@ class DirectDebitController:
             return DirectDebitService.do_refund_process(
                 request_header=request_header,
                 request=request,
-                is_production=is_production
+                is_production=is_production,
+                http_client=http_client,
+                body=body
             )
         except Exception as e:
             raise Exception(e)
 
     @staticmethod
     def do_check_status(request: CheckStatusRequest, secret_key: str, client_id: str, 
-                        token_b2b: str, is_production: bool) -> CheckStatusResponse:
+                        token_b2b: str, is_production: bool, http_client: HttpClient = None) -> CheckStatusResponse:
         try:
             timestamp: str = TokenService.get_timestamp()
             endpoint: str = Config.DIRECT_DEBIT_CHECK_STATUS
             method: str = "POST"
-            signature: str = TokenService.generate_symmetric_signature(
+            body: bytes = JsonCodec.dumps(request.create_request_body())
+            signature: str = TokenService.generate_body_signature(
                 http_method=method,
                 endpoint=endpoint,
                 token_b2b=token_b2b,
-                request=request.create_request_body(),
+                body=body,
                 timestamp=timestamp,
                 secret_key=secret_key
             )
@@ -269,22 +281,23 @@ class DirectDebitController:
                 timestamp=timestamp,
                 signature=signature,
             )
-            return DirectDebitService.do_check_status(request_header=request_header, request=request, is_production=is_production)
+            return DirectDebitService.do_check_status(request_header=request_header, request=request, is_production=is_production, http_client=http_client, body=body)
         except Exception as e:
             raise Exception(e)
 
     @staticmethod
     def do_card_unbinding(request: CardUnbindingRequest, secret_key: str, client_id: str,
-                             ip_address: str, token: str, is_production: bool) -> CardUnbindingResponse:
+                             ip_address: str, token: str, is_production: bool, http_client: HttpClient = None) -> CardUnbindingResponse:
         try:
             timestamp: str = TokenService.get_timestamp()
             endpoint: str = Config.DIRECT_DEBIT_CARD_UNBINDING_URL
             method: str = "POST"
-            signature: str = TokenService.generate_symmetric_signature(
+            body: bytes = JsonCodec.dumps(request.create_request_body())
+            signature: str = TokenService.generate_body_signature(
                 http_method=method,
                 endpoint=endpoint,
                 token_b2b=token,
-                request=request.create_request_body(),
+                body=body,
                 timestamp=timestamp,
                 secret_key=secret_key
             )
@@ -298,7 +311,7 @@ class DirectDebitController:
                 signature=signature,
                 ip_address=ip_address
             )
-            return DirectDebitService.do_card_unbinding_process(request_header=request_header, request=request, is_production=is_production)
+            return DirectDebitService.do_card_unbinding_process(request_header=request_header, request=request, is_production=is_production, http_client=http_client, body=body)
         except Exception as e:
             raise Exception(e)
         
@@ -1,10 +1,13 @@
 from doku_python_library.src.model.token.token_b2b_response import TokenB2BResponse
 from doku_python_library.src.commons.config import Config
+from doku_python_library.src.commons.http_client import HttpClient
 from doku_python_library.src.model.token.token_b2b_request import TokenB2BRequest
 from doku_python_library.src.services.token_service import TokenService
-from flask import request
+from doku_python_library.src.services.signature_verifier import SignatureVerifier
+from doku_python_library.src.services.rsa_signer import RsaSigner
 from doku_python_library.src.model.notification import NotificationToken
 from doku_python_library.src.commons.snap_utils import SnapUtils
+from doku_python_library.src.commons.header_adapter import HeaderAdapter
 from doku_python_library.src.model.general.request_header import RequestHeader
 from doku_python_library.src.services.va_service import VaService
 from doku_python_library.src.model.token.token_b2b2c_request import TokenB2B2CRequest
@@ -13,7 +16,7 @@ from doku_python_library.src.model.token.token_b2b2c_response import TokenB2B2CR
 class TokenController:
 
     @staticmethod
-    def get_token_b2b(private_key: str, client_id: str, is_production: bool) -> TokenB2BResponse:
+    def get_token_b2b(private_key: str, client_id: str, is_production: bool, http_client: HttpClient = None) -> TokenB2BResponse:
         timestamp = TokenService.get_timestamp()
         signature = TokenService.create_signature(private_key=private_key, text="{client_id}|{date}".format(client_id=client_id, date=timestamp))
         headers: dict = {
@@ -28,7 +31,7 @@ class TokenController:
             timestamp=timestamp,
             client_id=client_id
         )
-        return TokenService.create_token_b2b(token_b2b_request=token_b2b_request, is_production=is_production, headers=headers)
+        return TokenService.create_token_b2b(token_b2b_request=token_b2b_request, is_production=is_production, headers=headers, http_client=http_client)
     
     @staticmethod
     def is_token_invalid(token: str, token_expires_in: int, token_generated_timestamp: str) -> bool:
@@ -56,13 +59,19 @@ class TokenController:
     
     @staticmethod
     def validate_signature(client_id: str, public_key: str) -> bool:
-        timestamp: str = request.headers.get("X-TIMESTAMP")
-        request_signature: str = request.headers.get("X-SIGNATURE")
-        return TokenService.compare_signatures(
-            string_to_sign="{client_id}|{timestamp}".format(client_id=client_id, timestamp=timestamp),
-            signature=request_signature,
-            string_public_key=public_key
+        return TokenController.validate_signature_headers(
+            headers=HeaderAdapter.from_flask(),
+            client_id=client_id,
+            public_key=public_key
         )
+
+    @staticmethod
+    def validate_signature_headers(headers, client_id: str, public_key: str) -> bool:
+        return TokenService.verify_notification_signature(headers=headers, client_id=client_id, public_key=public_key)
+
+    @staticmethod
+    def verify_many(headers_list, client_id: str, public_key: str) -> list:
+        return TokenService.verify_notification_signatures(headers_list=headers_list, client_id=client_id, public_key=public_key)
     
     @staticmethod
     def generate_invalid_signature_response() -> NotificationToken:
@@ -70,13 +79,17 @@ class TokenController:
         return TokenService.generate_invalid_signature(timestamp= timestamp)
     
     @staticmethod
-    def do_generate_request_header(private_key: str, client_id: str, token_b2b: str) -> RequestHeader:
+    def do_generate_request_header(private_key: str, client_id: str, token_b2b: str, rsa_signer: RsaSigner = None) -> RequestHeader:
         external_id: str = SnapUtils.generate_external_id()
         timestamp: str = TokenService.get_timestamp()
-        signature: str = TokenService.create_signature(
-            private_key= private_key,
-            text= "{client_id}|{date}".format(client_id=client_id, date=timestamp)
-        )
+        text: str = "{client_id}|{date}".format(client_id=client_id, date=timestamp)
+        if rsa_signer is not None:
+            signature: str = rsa_signer.sign(text)
+        else:
+            signature: str = TokenService.create_signature(
+                private_key= private_key,
+                text= text
+            )
         return VaService.generate_request_header(
             channel_id="SDK",
             client_id= client_id,
@@ -85,10 +98,38 @@ class TokenController:
             external_id=external_id,
             signature=signature
         )
+
+    @staticmethod
+    def do_generate_request_headers(private_key: str, client_id: str, token_b2b: str, count: int, rsa_signer: RsaSigner = None) -> list:
+        timestamps: list = [TokenService.get_timestamp() for _ in range(count)]
+        texts: list = ["{client_id}|{date}".format(client_id=client_id, date=timestamp) for timestamp in timestamps]
+        if rsa_signer is not None:
+            signatures: list = rsa_signer.sign_many(texts)
+        else:
+            signatures: list = [TokenService.create_signature(private_key=private_key, text=text) for text in texts]
+        return [
+            VaService.generate_request_header(
+                channel_id="SDK",
+                client_id=client_id,
+                token_b2b=token_b2b,
+                timestamp=timestamp,
+                external_id=SnapUtils.generate_external_id(),
+                signature=signature
+            )
+            for timestamp, signature in zip(timestamps, signatures)
+        ]
     
+    @staticmethod
+    def invalidate_private_key(private_key: str = None) -> None:
+        TokenService.invalidate_private_key(private_key=private_key)
+
+    @staticmethod
+    def invalidate_public_key(public_key: str = None) -> None:
+        SignatureVerifier.invalidate(public_key=public_key)
+
     @staticmethod
     def get_token_b2b2c(auth_code: str, private_key: str, 
-                        client_id: str, is_production: bool) -> TokenB2B2CResponse:
+                        client_id: str, is_production: bool, http_client: HttpClient = None) -> TokenB2B2CResponse:
         timestamp: str = TokenService.get_timestamp()
         signature: str = TokenService.create_signature(
             private_key=private_key,
@@ -102,5 +143,6 @@ class TokenController:
             timestamp=timestamp,
             signature=signature,
             client_id=client_id,
-            is_production=is_production
+            is_production=is_production,
+            http_client=http_client
         )
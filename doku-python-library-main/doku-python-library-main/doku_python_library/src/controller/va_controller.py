@@ -4,6 +4,8 @@ from doku_python_library.src.services.va_service import VaService
 from doku_python_library.src.model.general.request_header import RequestHeader
 from doku_python_library.src.services.token_service import TokenService
 from doku_python_library.src.commons.config import Config
+from doku_python_library.src.commons.http_client import HttpClient
+from doku_python_library.src.commons.json_codec import JsonCodec
 from doku_python_library.src.model.va.update_va_request import UpdateVaRequest
 from doku_python_library.src.model.va.update_va_response import UpdateVAResponse
 from doku_python_library.src.model.va.check_status_va_request import CheckStatusRequest
@@ -16,14 +18,15 @@ from doku_python_library.src.model.inquiry.inquiry_response_body import InquiryR
 class VaController:
     
     @staticmethod
-    def create_va(is_production: bool, client_id: str, token_b2b: str, create_va_request: CreateVARequest, secret_key: str) -> CreateVAResponse:
+    def create_va(is_production: bool, client_id: str, token_b2b: str, create_va_request: CreateVARequest, secret_key: str, http_client: HttpClient = None) -> CreateVAResponse:
         external_id: str = SnapUtils.generate_external_id()
         timestamp: str = TokenService.get_timestamp()
-        signature: str = TokenService.generate_symmetric_signature(
+        body: bytes = JsonCodec.dumps(create_va_request.create_request_body())
+        signature: str = TokenService.generate_body_signature(
             http_method= "POST",
             endpoint= Config.CREATE_VA,
             token_b2b= token_b2b,
-            request= create_va_request.create_request_body(),
+            body= body,
             timestamp= timestamp,
             secret_key= secret_key
         )
@@ -35,18 +38,19 @@ class VaController:
             external_id=external_id,
             signature= signature
         )
-        return VaService.creat_va(create_va_request=create_va_request, request_header= request_header, is_production= is_production)
+        return VaService.creat_va(create_va_request=create_va_request, request_header= request_header, is_production= is_production, http_client=http_client, body=body)
 
     @staticmethod
-    def do_update_va(update_va_request: UpdateVaRequest, secret_key: str, client_id: str, token_b2b: str, is_production: bool) -> UpdateVAResponse:
+    def do_update_va(update_va_request: UpdateVaRequest, secret_key: str, client_id: str, token_b2b: str, is_production: bool, http_client: HttpClient = None) -> UpdateVAResponse:
         timestamp: str = TokenService.get_timestamp()
         endpoint: str = Config.UPDATE_VA
         method: str = "PUT"
-        signature: str = TokenService.generate_symmetric_signature(
+        body: bytes = JsonCodec.dumps(update_va_request.create_request_body())
+        signature: str = TokenService.generate_body_signature(
             http_method= method,
             endpoint= endpoint,
             token_b2b= token_b2b,
-            request= update_va_request.create_request_body(),
+            body= body,
             timestamp= timestamp,
             secret_key= secret_key
         )
@@ -59,18 +63,19 @@ class VaController:
             external_id= external_id,
             signature= signature
         )
-        return VaService.do_update_va(request_header= request_header, update_va_request= update_va_request, is_production=is_production)
+        return VaService.do_update_va(request_header= request_header, update_va_request= update_va_request, is_production=is_production, http_client=http_client, body=body)
     
     @staticmethod
-    def do_check_status_va(check_status_request: CheckStatusRequest, secret_key: str, client_id: str, token_b2b: str, is_production: bool) -> CheckStatusVAResponse:
+    def do_check_status_va(check_status_request: CheckStatusRequest, secret_key: str, client_id: str, token_b2b: str, is_production: bool, http_client: HttpClient = None) -> CheckStatusVAResponse:
         timestamp: str = TokenService.get_timestamp()
         endpoint: str = Config.CHECK_STATUS_VA
         method: str = "POST"
-        signature: str = TokenService.generate_symmetric_signature(
+        body: bytes = JsonCodec.dumps(check_status_request.create_request_body())
+        signature: str = TokenService.generate_body_signature(
             http_method= method,
             endpoint= endpoint,
             token_b2b= token_b2b,
-            request= check_status_request.create_request_body(),
+            body= body,
             timestamp= timestamp,
             secret_key= secret_key
         )
@@ -83,18 +88,19 @@ class VaController:
             external_id= external_id,
             signature= signature
         )
-        return VaService.do_check_status_va(request_header= request_header, check_status_request= check_status_request, is_production= is_production)
+        return VaService.do_check_status_va(request_header= request_header, check_status_request= check_status_request, is_production= is_production, http_client=http_client, body=body)
     
     @staticmethod
-    def do_delete_payment_code(delete_va_request: DeleteVARequest, secret_key: str, client_id: str, token_b2b: str, is_production: bool) -> DeleteVAResponse:
+    def do_delete_payment_code(delete_va_request: DeleteVARequest, secret_key: str, client_id: str, token_b2b: str, is_production: bool, http_client: HttpClient = None) -> DeleteVAResponse:
         timestamp: str = TokenService.get_timestamp()
         endpoint: str = Config.DELETE_VA
         method: str = "DELETE"
-        signature: str = TokenService.generate_symmetric_signature(
+        body: bytes = JsonCodec.dumps(delete_va_request.create_request_body())
+        signature: str = TokenService.generate_body_signature(
             http_method= method,
             endpoint= endpoint,
             token_b2b= token_b2b,
-            request= delete_va_request.create_request_body(),
+            body= body,
             timestamp= timestamp,
             secret_key= secret_key
         )
@@ -107,7 +113,7 @@ class VaController:
             external_id= external_id,
             signature= signature
         )
-        return VaService.do_delete_payment_code(request_header= request_header, delete_va_request= delete_va_request, is_production= is_production)
+        return VaService.do_delete_payment_code(request_header= request_header, delete_va_request= delete_va_request, is_production= is_production, http_client=http_client, body=body)
     
     @staticmethod
     def direct_inquiry_request_mapping(header: dict, snap_format: dict) -> dict:
@@ -0,0 +1,17 @@
+import importlib
+import sys
+
+def lazy_exports(module_name: str, exports: dict):
+
+    def __getattr__(name: str):
+        export_module = exports.get(name)
+        if export_module is None:
+            raise AttributeError("module {module} has no attribute {name}".format(module=module_name, name=name))
+        value = getattr(importlib.import_module(export_module), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(vars(sys.modules[module_name])) | set(exports))
+
+    return __getattr__, __dir__
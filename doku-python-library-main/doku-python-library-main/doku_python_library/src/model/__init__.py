@@ -1,6 +1,85 @@
-from doku_python_library.src.model.token import *
-from doku_python_library.src.model.va import *
-from doku_python_library.src.model.general import *
-from doku_python_library.src.model.notification import *
-from doku_python_library.src.model.inquiry import *
-from doku_python_library.src.model.direct_debit import *
\ No newline at end of file
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = {
+    "TokenB2BRequest": "doku_python_library.src.model.token.token_b2b_request",
+    "TokenB2BResponse": "doku_python_library.src.model.token.token_b2b_response",
+    "TokenB2B2CRequest": "doku_python_library.src.model.token.token_b2b2c_request",
+    "TokenB2B2CResponse": "doku_python_library.src.model.token.token_b2b2c_response",
+    "AdditionalInfoResponse": "doku_python_library.src.model.va.additional_info_response",
+    "AdditionalInfo": "doku_python_library.src.model.va.additional_info",
+    "CreateVARequest": "doku_python_library.src.model.va.create_va_request",
+    "CreateVAResponse": "doku_python_library.src.model.va.create_va_response",
+    "Origin": "doku_python_library.src.model.va.origin",
+    "TotalAmount": "doku_python_library.src.model.va.total_amount",
+    "VirtualAccountData": "doku_python_library.src.model.va.virtual_account_data",
+    "VirtualAccountConfig": "doku_python_library.src.model.va.virtual_account_config",
+    "UpdateVaRequest": "doku_python_library.src.model.va.update_va_request",
+    "UpdateVAAdditionalInfo": "doku_python_library.src.model.va.update_va_additional_info",
+    "UpdateVAConfig": "doku_python_library.src.model.va.update_va_config",
+    "UpdateVAResponse": "doku_python_library.src.model.va.update_va_response",
+    "CheckStatusPaymentFlagResponse": "doku_python_library.src.model.va.check_status_payment_flag_response",
+    "CheckStatusVAData": "doku_python_library.src.model.va.check_status_va_data",
+    "CheckStatusVAResponse": "doku_python_library.src.model.va.check_status_va_response",
+    "DeleteVARequest": "doku_python_library.src.model.va.delete_va_request",
+    "DeleteVAAdditionalInfo": "doku_python_library.src.model.va.delete_va_additional_info",
+    "DeleteVAResponse": "doku_python_library.src.model.va.delete_va_response",
+    "DeleteVaResponseAdditionalInfo": "doku_python_library.src.model.va.delete_va_additional_info_response",
+    "DeleteVAResponseVirtualAccountData": "doku_python_library.src.model.va.delete_va_virtual_acc_data",
+    "BillAmount": "doku_python_library.src.model.va.bill_amount",
+    "RequestHeader": "doku_python_library.src.model.general.request_header",
+    "NotificationToken": "doku_python_library.src.model.notification.notification_token",
+    "NotificationTokenHeader": "doku_python_library.src.model.notification.notification_token_header",
+    "NotificationTokenBody": "doku_python_library.src.model.notification.notification_token_body",
+    "PaymentNotificationAdditionalInfo": "doku_python_library.src.model.notification.notification_payment_request",
+    "PaymentNotificationRequest": "doku_python_library.src.model.notification.notification_payment_request",
+    "PaymentNotificationResponse": "doku_python_library.src.model.notification.notification_payment_response",
+    "PaymentNotificationResponseHeader": "doku_python_library.src.model.notification.notification_payment_header_response",
+    "PaymentNotificationResponseBody": "doku_python_library.src.model.notification.notification_payment_body_response",
+    "NotificationVirtualAccountData": "doku_python_library.src.model.notification.notification_virtual_account_data",
+    "NotificationPaymentDirectDebitRequest": "doku_python_library.src.model.notification.notification_payment_direct_debit_request",
+    "NotificationPaymentDirectDebitAdditionalInfo": "doku_python_library.src.model.notification.notification_payment_direct_debit_additional_info",
+    "NotificationPaymentDirectDebitResponse": "doku_python_library.src.model.notification.notification_payment_direct_debit_response",
+    "InquiryRequestAdditionalInfo": "doku_python_library.src.model.inquiry.inquiry_request_additional_info",
+    "InquiryRequestBody": "doku_python_library.src.model.inquiry.inquiry_request_body",
+    "InquiryReason": "doku_python_library.src.model.inquiry.inquiry_reason",
+    "InquiryRequestVirtualAccountData": "doku_python_library.src.model.inquiry.inquiry_request_virtual_account_data",
+    "InquiryResponseBody": "doku_python_library.src.model.inquiry.inquiry_response_body",
+    "AccountBindingRequest": "doku_python_library.src.model.direct_debit.account_binding_request",
+    "AccountBindingAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.account_binding_additional_info_request",
+    "AccountBindingAdditionalInfoResponse": "doku_python_library.src.model.direct_debit.account_binding_additional_info_response",
+    "PaymentRequest": "doku_python_library.src.model.direct_debit.payment_request",
+    "PayOptionDetail": "doku_python_library.src.model.direct_debit.pay_option_detail",
+    "LineItems": "doku_python_library.src.model.direct_debit.line_items",
+    "PaymentAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.payment_additional_info_request",
+    "PaymentResponse": "doku_python_library.src.model.direct_debit.payment_response",
+    "AccountInfo": "doku_python_library.src.model.direct_debit.account_info",
+    "BalanceInquiryAdditionalInfo": "doku_python_library.src.model.direct_debit.balance_inquiry_additional_info",
+    "BalanceInquiryRequest": "doku_python_library.src.model.direct_debit.balance_inquiry_request",
+    "BalanceInquiryResponse": "doku_python_library.src.model.direct_debit.balance_inquiry_response",
+    "AccountUnbindingRequest": "doku_python_library.src.model.direct_debit.account_unbinding_request",
+    "AccountUnbindingAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.account_unbinding_additional_info_request",
+    "AccountUnbindingResponse": "doku_python_library.src.model.direct_debit.account_unbinding_response",
+    "AccountBindingResponse": "doku_python_library.src.model.direct_debit.account_binding_response",
+    "PaymentJumpAppRequest": "doku_python_library.src.model.direct_debit.payment_jump_app_request",
+    "PaymentJumpAppAdditionalInfo": "doku_python_library.src.model.direct_debit.payment_jump_app_additional_info",
+    "UrlParam": "doku_python_library.src.model.direct_debit.url_param",
+    "PaymentJumpAppResponse": "doku_python_library.src.model.direct_debit.paymet_jump_app_response",
+    "PaymentJumpAppAdditionalInfoResponse": "doku_python_library.src.model.direct_debit.payment_jump_app_additional_info_response",
+    "CardRegistrationRequest": "doku_python_library.src.model.direct_debit.card_registration_request",
+    "CardRegistrationAdditionalInfo": "doku_python_library.src.model.direct_debit.card_registration_additional_info",
+    "CardRegistrationResponse": "doku_python_library.src.model.direct_debit.card_registration_response",
+    "RefundRequest": "doku_python_library.src.model.direct_debit.refund_request",
+    "RefundAdditionalInfo": "doku_python_library.src.model.direct_debit.refund_additional_info",
+    "RefundResponse": "doku_python_library.src.model.direct_debit.refund_response",
+    "CheckStatusAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.check_status_additional_info_request",
+    "CheckStatusRequest": "doku_python_library.src.model.direct_debit.check_status_request",
+    "CheckStatusAdditionalInfoResponse": "doku_python_library.src.model.direct_debit.check_status_additional_info_response",
+    "CheckStatusResponse": "doku_python_library.src.model.direct_debit.check_status_response",
+    "RefundHistory": "doku_python_library.src.model.direct_debit.refund_history",
+    "CardUnbindingRequest": "doku_python_library.src.model.direct_debit.card_unbinding_request",
+    "CardUnbindingResponse": "doku_python_library.src.model.direct_debit.card_unbinding_response",
+    "BankCardData": "doku_python_library.src.model.direct_debit.bank_card_data"
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -1,35 +1,42 @@
-from doku_python_library.src.model.direct_debit.account_binding_request import *
-from doku_python_library.src.model.direct_debit.account_binding_additional_info_request import *
-from doku_python_library.src.model.direct_debit.account_binding_additional_info_response import *
-from doku_python_library.src.model.direct_debit.account_binding_response import *
-from doku_python_library.src.model.direct_debit.payment_request import *
-from doku_python_library.src.model.direct_debit.pay_option_detail import *
-from doku_python_library.src.model.direct_debit.line_items import *
-from doku_python_library.src.model.direct_debit.payment_additional_info_request import *
-from doku_python_library.src.model.direct_debit.payment_response import *
-from doku_python_library.src.model.direct_debit.account_info import *
-from doku_python_library.src.model.direct_debit.balance_inquiry_additional_info import *
-from doku_python_library.src.model.direct_debit.balance_inquiry_request import *
-from doku_python_library.src.model.direct_debit.balance_inquiry_response import *
-from doku_python_library.src.model.direct_debit.account_unbinding_request import *
-from doku_python_library.src.model.direct_debit.account_unbinding_additional_info_request import *
-from doku_python_library.src.model.direct_debit.account_binding_response import *
-from doku_python_library.src.model.direct_debit.payment_jump_app_request import *
-from doku_python_library.src.model.direct_debit.payment_jump_app_additional_info import *
-from doku_python_library.src.model.direct_debit.url_param import *
-from doku_python_library.src.model.direct_debit.paymet_jump_app_response import *
-from doku_python_library.src.model.direct_debit.payment_jump_app_additional_info_response import *
-from doku_python_library.src.model.direct_debit.card_registration_request import *
-from doku_python_library.src.model.direct_debit.card_registration_additional_info import *
-from doku_python_library.src.model.direct_debit.card_registration_response import *
-from doku_python_library.src.model.direct_debit.refund_request import *
-from doku_python_library.src.model.direct_debit.refund_additional_info import *
-from doku_python_library.src.model.direct_debit.refund_response import *
-from doku_python_library.src.model.direct_debit.check_status_additional_info_request import *
-from doku_python_library.src.model.direct_debit.check_status_request import *
-from doku_python_library.src.model.direct_debit.check_status_additional_info_response import *
-from doku_python_library.src.model.direct_debit.check_status_response import *
-from doku_python_library.src.model.direct_debit.refund_history import *
-from doku_python_library.src.model.direct_debit.card_unbinding_request import *
-from doku_python_library.src.model.direct_debit.card_unbinding_response import *
-from doku_python_library.src.model.direct_debit.bank_card_data import *
\ No newline at end of file
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = {
+    "AccountBindingRequest": "doku_python_library.src.model.direct_debit.account_binding_request",
+    "AccountBindingAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.account_binding_additional_info_request",
+    "AccountBindingAdditionalInfoResponse": "doku_python_library.src.model.direct_debit.account_binding_additional_info_response",
+    "PaymentRequest": "doku_python_library.src.model.direct_debit.payment_request",
+    "PayOptionDetail": "doku_python_library.src.model.direct_debit.pay_option_detail",
+    "LineItems": "doku_python_library.src.model.direct_debit.line_items",
+    "PaymentAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.payment_additional_info_request",
+    "PaymentResponse": "doku_python_library.src.model.direct_debit.payment_response",
+    "AccountInfo": "doku_python_library.src.model.direct_debit.account_info",
+    "BalanceInquiryAdditionalInfo": "doku_python_library.src.model.direct_debit.balance_inquiry_additional_info",
+    "BalanceInquiryRequest": "doku_python_library.src.model.direct_debit.balance_inquiry_request",
+    "BalanceInquiryResponse": "doku_python_library.src.model.direct_debit.balance_inquiry_response",
+    "AccountUnbindingRequest": "doku_python_library.src.model.direct_debit.account_unbinding_request",
+    "AccountUnbindingAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.account_unbinding_additional_info_request",
+    "AccountUnbindingResponse": "doku_python_library.src.model.direct_debit.account_unbinding_response",
+    "AccountBindingResponse": "doku_python_library.src.model.direct_debit.account_binding_response",
+    "PaymentJumpAppRequest": "doku_python_library.src.model.direct_debit.payment_jump_app_request",
+    "PaymentJumpAppAdditionalInfo": "doku_python_library.src.model.direct_debit.payment_jump_app_additional_info",
+    "UrlParam": "doku_python_library.src.model.direct_debit.url_param",
+    "PaymentJumpAppResponse": "doku_python_library.src.model.direct_debit.paymet_jump_app_response",
+    "PaymentJumpAppAdditionalInfoResponse": "doku_python_library.src.model.direct_debit.payment_jump_app_additional_info_response",
+    "CardRegistrationRequest": "doku_python_library.src.model.direct_debit.card_registration_request",
+    "CardRegistrationAdditionalInfo": "doku_python_library.src.model.direct_debit.card_registration_additional_info",
+    "CardRegistrationResponse": "doku_python_library.src.model.direct_debit.card_registration_response",
+    "RefundRequest": "doku_python_library.src.model.direct_debit.refund_request",
+    "RefundAdditionalInfo": "doku_python_library.src.model.direct_debit.refund_additional_info",
+    "RefundResponse": "doku_python_library.src.model.direct_debit.refund_response",
+    "CheckStatusAdditionalInfoRequest": "doku_python_library.src.model.direct_debit.check_status_additional_info_request",
+    "CheckStatusRequest": "doku_python_library.src.model.direct_debit.check_status_request",
+    "CheckStatusAdditionalInfoResponse": "doku_python_library.src.model.direct_debit.check_status_additional_info_response",
+    "CheckStatusResponse": "doku_python_library.src.model.direct_debit.check_status_response",
+    "RefundHistory": "doku_python_library.src.model.direct_debit.refund_history",
+    "CardUnbindingRequest": "doku_python_library.src.model.direct_debit.card_unbinding_request",
+    "CardUnbindingResponse": "doku_python_library.src.model.direct_debit.card_unbinding_response",
+    "BankCardData": "doku_python_library.src.model.direct_debit.bank_card_data"
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -1,6 +1,8 @@
 from doku_python_library.src.model.va.origin import Origin
 class AccountBindingAdditionalInfoRequest:
 
+    __slots__ = ("channel", "cust_id_merchant", "customer_name", "email", "id_card", "country", "address", "date_of_birth", "success_registration_url", "failed_registration_url", "device_model", "os_type", "channel_id")
+
     def __init__(self, channel: str, success_registration_url: str, failed_registration_url: str, 
                  cust_id_merchant: str = None, customer_name: str = None, email: str = None, id_card: str = None, 
                  country: str = None, address: str = None, date_of_birth: str = None, device_model: str = None,
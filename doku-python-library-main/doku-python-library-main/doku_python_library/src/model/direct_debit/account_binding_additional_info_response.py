@@ -1,6 +1,8 @@
 
 class AccountBindingAdditionalInfoResponse:
 
+    __slots__ = ("cust_id_merchant", "status", "auth_code")
+
     def __init__(self, custIdMerchant: str = None, status: str = None, authCode: str = None) -> None:
         self.cust_id_merchant = custIdMerchant
         self.status = status
@@ -4,6 +4,8 @@ from doku_python_library.src.commons.direct_debit_enum import DirectDebitEnum
 
 class AccountBindingRequest:
 
+    __slots__ = ("phone_no", "additional_info")
+
     def __init__(self, phone_no: str, additional_info: AccountBindingAdditionalInfoRequest) -> None:
         self.phone_no = phone_no
         self.additional_info = additional_info
@@ -2,6 +2,8 @@ from doku_python_library.src.model.direct_debit.account_binding_additional_info_
 
 class AccountBindingResponse:
 
+    __slots__ = ("response_code", "response_message", "reference_no", "redirect_url", "additional_info")
+
     def __init__(self, responseCode: str = None, responseMessage: str = None, 
                  referenceNo: str = None, redirectUrl: str = None, additionalInfo: AccountBindingAdditionalInfoResponse = None) -> None:
         self.response_code = responseCode
@@ -2,6 +2,8 @@ from doku_python_library.src.model.va.total_amount import TotalAmount
 
 class AccountInfo:
 
+    __slots__ = ("balance_type", "amount", "flat_amount", "hold_amount")
+
     def __init__(self, balance_type: str, amount: TotalAmount, flat_amount: TotalAmount, hold_amount: TotalAmount) -> None:
         self.balance_type = balance_type
         self.amount = amount
@@ -1,6 +1,8 @@
 from doku_python_library.src.model.va.origin import Origin
 class AccountUnbindingAdditionalInfoRequest:
 
+    __slots__ = ("channel",)
+
     def __init__(self, channel: str) -> None:
         self.channel = channel
     
@@ -1,6 +1,8 @@
 
 class AccountUnbindingResponse:
 
+    __slots__ = ("response_code", "response_message", "reference_no")
+
     def __init__(self, responseCode: str, responseMessage: str, referenceNo: str = None, additionalInfo = None) -> None:
         self.response_code = responseCode
         self.response_message = responseMessage
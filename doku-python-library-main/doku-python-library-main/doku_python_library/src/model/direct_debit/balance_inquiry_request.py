@@ -3,6 +3,8 @@ from doku_python_library.src.commons.direct_debit_enum import DirectDebitEnum
 
 class BalanceInquiryRequest:
 
+    __slots__ = ("additional_info",)
+
     def __init__(self, additional_info: BalanceInquiryAdditionalInfo) -> None:
         self.additional_info = additional_info
     
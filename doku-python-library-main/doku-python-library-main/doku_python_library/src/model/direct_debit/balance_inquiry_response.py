@@ -2,6 +2,8 @@ from doku_python_library.src.model.direct_debit.account_info import AccountInfo
 
 class BalanceInquiryResponse:
 
+    __slots__ = ("response_code", "response_message", "account_infos")
+
     def __init__(self, responseCode: str, responseMessage: str, accountInfos: list[AccountInfo] = None) -> None:
         self.response_code = responseCode
         self.response_message = responseMessage
@@ -1,4 +1,6 @@
 class BankCardData:
+
+    __slots__ = ("bankCardNo", "bankCardType", "identificationNo", "identificationType", "email", "expiryDate")
     
     def __init__(self, bank_card_no, bank_card_type, expiry_date, identification_no=None, identification_type=None, email=None):
         self.bankCardNo = bank_card_no
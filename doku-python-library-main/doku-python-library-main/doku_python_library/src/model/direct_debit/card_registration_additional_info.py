@@ -2,6 +2,8 @@ from doku_python_library.src.model.va.origin import Origin
 
 class CardRegistrationAdditionalInfo:
 
+    __slots__ = ("channel", "customer_name", "email", "id_card", "country", "address", "date_of_birth", "success_registration_url", "failed_registration_url")
+
     def __init__(self, channel: str, success_registration_url: str, failed_registration_url: str, 
                  customer_name: str = None, email: str = None, id_card: str = None, 
                  country: str = None, address: str = None, date_of_birth: str = None) -> None:
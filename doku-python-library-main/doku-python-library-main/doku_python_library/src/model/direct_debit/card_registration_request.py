@@ -5,6 +5,8 @@ from typing import Union
 
 class CardRegistrationRequest:
 
+    __slots__ = ("card_data", "cust_id_merchant", "additional_info", "phone_no")
+
     def __init__(self, card_data: Union[str, BankCardData], cust_id_merchant: str,
                 additionalInfo: CardRegistrationAdditionalInfo, phone_no: str) -> None:
         self.card_data = card_data
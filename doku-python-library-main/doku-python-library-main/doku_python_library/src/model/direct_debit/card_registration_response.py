@@ -3,6 +3,8 @@ from doku_python_library.src.model.direct_debit.account_binding_additional_info_
 
 class CardRegistrationResponse:
 
+    __slots__ = ("response_code", "response_message", "additional_info", "reference_no", "redirect_url")
+
     def __init__(self, responseCode: str, responseMessage: str, additionalInfo: AccountBindingAdditionalInfoResponse = None, 
                  referenceNo: str = None, redirectUrl: str = None) -> None:
         self.response_code = responseCode
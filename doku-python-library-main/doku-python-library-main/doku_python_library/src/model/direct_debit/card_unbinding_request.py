@@ -3,6 +3,8 @@ from doku_python_library.src.commons.direct_debit_enum import DirectDebitEnum
 
 class CardUnbindingRequest:
 
+    __slots__ = ("token", "additional_info")
+
     def __init__(self, token: str, additional_info: AccountUnbindingAdditionalInfoRequest = None) -> None:
         self.token = token
         self.additional_info = additional_info
@@ -1,6 +1,8 @@
 
 class CardUnbindingResponse:
 
+    __slots__ = ("response_code", "response_message", "reference_no", "redirect_url")
+
     def __init__(self, responseCode: str, responseMessage: str, referenceNo: str = None, redirectUrl: str = None) -> None:
         self.response_code = responseCode
         self.response_message = responseMessage
@@ -1,6 +1,8 @@
 from doku_python_library.src.model.va.origin import Origin
 class CheckStatusAdditionalInfoRequest:
 
+    __slots__ = ("device_id", "channel")
+
     def __init__(self, device_id: str = None, channel: str = None) -> None:
         self.device_id = device_id
         self.channel = channel
@@ -1,6 +1,8 @@
 
 class CheckStatusAdditionalInfoResponse:
 
+    __slots__ = ("device_id", "channel", "acquirer")
+
     def __init__(self, deviceId: str = None, channel: str = None, acquirer = None) -> None:
         self.device_id = deviceId
         self.channel = channel
@@ -4,6 +4,8 @@ from doku_python_library.src.commons.direct_debit_enum import DirectDebitEnum
 
 class CheckStatusRequest:
 
+    __slots__ = ("service_code", "original_partner_reference_no", "original_reference_no", "original_external_id", "transcation_date", "amount", "merchant_id", "sub_merchant_id", "external_store_id", "additional_info")
+
     def __init__(self, service_code: str, original_partner_reference_no: str = None,
                  original_reference_no: str = None, original_external_id: str = None,
                  transaction_date: str = None, amount: TotalAmount = None, merchant_id: str = None,
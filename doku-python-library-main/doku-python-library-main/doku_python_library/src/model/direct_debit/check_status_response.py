@@ -4,6 +4,8 @@ from doku_python_library.src.model.direct_debit.refund_history import RefundHist
 
 class CheckStatusResponse:
 
+    __slots__ = ("response_code", "response_message", "service_code", "latest_transaction_status", "additional_info", "original_reference_no", "original_partner_reference_no", "approval_code", "original_external_id", "transaction_status_desc", "original_response_code", "original_response_message", "session_id", "request_id", "refund_no", "partner_refund_no", "refund_amount", "refund_status", "refund_date", "reason", "trans_amount", "fee_amount", "paid_time", "refund_history")
+
     def __init__(self, responseCode: str, responseMessage: str, serviceCode: str = None, latestTransactionStatus: str = None,
                  additionalInfo: CheckStatusAdditionalInfoResponse = None, originalReferenceNo: str = None,
                  originalPartnerReferenceNo: str = None, approvalCode: str = None, originalExternalId: str = None,
@@ -1,5 +1,7 @@
 class LineItems:
 
+    __slots__ = ("name", "price", "quantity")
+
     def __init__(self, name: str, price: str, quantity: str) -> None:
         self.name = name
         self.price = price
@@ -2,6 +2,8 @@ from doku_python_library.src.model.va.total_amount import TotalAmount
 
 class PayOptionDetail:
 
+    __slots__ = ("pay_method", "trans_amount", "fee_amount")
+
     def __init__(self, pay_method: str, trans_amount: TotalAmount, fee_amount: TotalAmount) -> None:
         self.pay_method = pay_method
         self.trans_amount = trans_amount
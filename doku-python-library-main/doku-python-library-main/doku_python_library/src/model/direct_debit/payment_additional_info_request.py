@@ -2,6 +2,8 @@ from doku_python_library.src.model.direct_debit.line_items import LineItems
 from doku_python_library.src.model.va.origin import Origin
 class PaymentAdditionalInfoRequest:
 
+    __slots__ = ("channel", "remarks", "success_payment_url", "failed_payment_url", "line_items", "payment_type")
+
     def __init__(self, channel: str = None, remarks: str = None, success_payment_url: str = None,
                  failed_payment_url: str = None, line_items: list[LineItems] = None, payment_type: str = None) -> None:
         self.channel = channel
@@ -1,6 +1,8 @@
 from doku_python_library.src.model.va.origin import Origin
 class PaymentJumpAppAdditionalInfo:
 
+    __slots__ = ("channel", "order_title", "metadata", "support_deeplink_checkout_url")
+
     def __init__(self, channel: str, order_title: str = None, metadata: str = None, support_deeplink_checkout_url: bool = None) -> None:
         self.channel = channel
         self.order_title = order_title
@@ -1,4 +1,6 @@
 class PaymentJumpAppAdditionalInfoResponse:
+
+    __slots__ = ("web_redirect_url",)
     
     def __init__(self, webRedirectUrl: str = None):
         self.web_redirect_url = webRedirectUrl
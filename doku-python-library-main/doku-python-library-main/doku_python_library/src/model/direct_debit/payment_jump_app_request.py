@@ -5,6 +5,8 @@ from doku_python_library.src.commons.direct_debit_enum import DirectDebitEnum
 
 class PaymentJumpAppRequest:
 
+    __slots__ = ("partner_reference_no", "valid_up_to", "point_of_initiation", "url_param", "amount", "additional_info")
+
     def __init__(self, partner_reference_no: str, url_param: list[UrlParam], amount: TotalAmount, additional_info: PaymentJumpAppAdditionalInfo = None,
                  valid_up_to: str = None, point_of_initiation: str = None) -> None:
         self.partner_reference_no = partner_reference_no
@@ -6,6 +6,8 @@ import re
 
 class PaymentRequest:
 
+    __slots__ = ("partner_reference_no", "amount", "pay_option_detail", "additional_info", "charge_token", "fee_type")
+
     def __init__(self, partner_reference_no: str, amount: TotalAmount, 
                 additional_info: PaymentAdditionalInfoRequest, charge_token: str = None, fee_type: str = None, pay_option_detail: list[PayOptionDetail]= None) -> None:
         self.partner_reference_no = partner_reference_no
@@ -1,6 +1,8 @@
 
 class PaymentResponse:
 
+    __slots__ = ("response_code", "response_message", "web_redirect_url", "partner_reference_no", "reference_no")
+
     def __init__(self, responseCode: str, responseMessage: str, webRedirectUrl: str = None, partnerReferenceNo: str = None, referenceNo: str = None) -> None:
         self.response_code = responseCode
         self.response_message = responseMessage
@@ -2,6 +2,8 @@ from doku_python_library.src.model.direct_debit.payment_jump_app_additional_info
 
 class PaymentJumpAppResponse:
 
+    __slots__ = ("response_code", "response_message", "web_redirect_url", "partner_reference_no", "reference_no", "additional_info")
+
     def __init__(self, responseCode: str, responseMessage: str, webRedirectUrl: str = None, 
                  partnerReferenceNo: str = None, referenceNo: str = None, additionalInfo: PaymentJumpAppAdditionalInfoResponse = None) -> None:
         self.response_code = responseCode
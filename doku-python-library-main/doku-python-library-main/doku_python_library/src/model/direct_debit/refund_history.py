@@ -3,6 +3,8 @@ from doku_python_library.src.model.va.total_amount import TotalAmount
 
 class RefundHistory:
 
+    __slots__ = ("refund_no", "partner_reference_no", "refund_amount", "refund_date", "reason")
+
     def __init__(self, refundNo: str = None, partnerReferenceNo: str = None, refundAmount: TotalAmount = None,
                  refundDate: str = None, reason: str = None) -> None:
         self.refund_no = refundNo
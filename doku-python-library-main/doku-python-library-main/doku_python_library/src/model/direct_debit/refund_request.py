@@ -5,6 +5,8 @@ import re
 
 class RefundRequest:
 
+    __slots__ = ("original_partner_reference_no", "refund_amount", "partner_refund_no", "additional_info", "original_external_id", "reason")
+
     def __init__(self, original_partner_reference_no: str, refund_amount: TotalAmount, partner_refund_no: str,
                  additional_info: RefundAdditionalInfo, original_external_id: str = None, reason: str = None) -> None:
         self.original_partner_reference_no = original_partner_reference_no
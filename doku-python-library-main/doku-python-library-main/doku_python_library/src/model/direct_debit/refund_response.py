@@ -2,6 +2,8 @@ from doku_python_library.src.model.va.total_amount import TotalAmount
 
 class RefundResponse:
 
+    __slots__ = ("response_code", "response_message", "refund_amount", "original_partner_reference_no", "original_reference_no", "refund_no", "partner_refund_no", "refund_time")
+
     def __init__(self, responseCode: str, responseMessage: str, refundAmount: TotalAmount = None,
                  originalPartnerReferenceNo: str = None, originalReferenceNo: str = None,
                  refundNo: str = None, partnerRefundNo: str = None, refundTime: str = None) -> None:
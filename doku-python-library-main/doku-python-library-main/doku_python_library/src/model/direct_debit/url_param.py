@@ -1,5 +1,7 @@
 class UrlParam:
 
+    __slots__ = ("url", "type", "is_deep_link")
+
     def __init__(self, url: str, type: str, is_deep_link: str) -> None:
         self.url = url
         self.type = type
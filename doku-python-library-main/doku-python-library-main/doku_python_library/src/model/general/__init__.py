@@ -1 +1,8 @@
-from doku_python_library.src.model.general.request_header import *
\ No newline at end of file
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = {
+    "RequestHeader": "doku_python_library.src.model.general.request_header"
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -1,5 +1,7 @@
 class RequestHeader:
 
+    __slots__ = ("x_timestamp", "x_signature", "x_partner_id", "x_external_id", "channel_id", "authorization", "device_id", "ip_address", "token_b2b2c")
+
     def __init__(self, x_timestamp: str, x_signature: str, x_partner_id: str, x_external_id: str,
                   authorization: str, device_id: str = None, ip_address: str = None, channel_id: str="SDK", token_b2b2c: str = None):
         self.x_timestamp = x_timestamp
@@ -1,5 +1,12 @@
-from doku_python_library.src.model.inquiry.inquiry_request_additional_info import *
-from doku_python_library.src.model.inquiry.inquiry_request_body import *
-from doku_python_library.src.model.inquiry.inquiry_reason import *
-from doku_python_library.src.model.inquiry.inquiry_request_virtual_account_data import *
-from doku_python_library.src.model.inquiry.inquiry_response_body import *
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = {
+    "InquiryRequestAdditionalInfo": "doku_python_library.src.model.inquiry.inquiry_request_additional_info",
+    "InquiryRequestBody": "doku_python_library.src.model.inquiry.inquiry_request_body",
+    "InquiryReason": "doku_python_library.src.model.inquiry.inquiry_reason",
+    "InquiryRequestVirtualAccountData": "doku_python_library.src.model.inquiry.inquiry_request_virtual_account_data",
+    "InquiryResponseBody": "doku_python_library.src.model.inquiry.inquiry_response_body"
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
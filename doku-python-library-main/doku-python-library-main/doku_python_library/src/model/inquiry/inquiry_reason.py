@@ -1,5 +1,7 @@
 class InquiryReason:
 
+    __slots__ = ("english", "indonesia")
+
     def __init__(self, english: str, indonesia: str) -> None:
         self.english = english
         self.indonesia = indonesia
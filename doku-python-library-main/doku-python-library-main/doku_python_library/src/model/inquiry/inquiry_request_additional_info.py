@@ -2,6 +2,8 @@ from doku_python_library.src.model.va.virtual_account_config import VirtualAccou
 
 class InquiryRequestAdditionalInfo:
 
+    __slots__ = ("channel", "trx_id", "virtual_acc_config")
+
     def __init__(self, channel: str, trxId: str = None, virtualAccountConfig: VirtualAccountConfig = None) -> None:
         self.channel = channel
         self.trx_id = trxId
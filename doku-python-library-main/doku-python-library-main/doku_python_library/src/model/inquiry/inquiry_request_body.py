@@ -3,6 +3,8 @@ from doku_python_library.src.model.inquiry.inquiry_response_body import InquiryR
 
 class InquiryRequestBody:
 
+    __slots__ = ("partner_service_id", "customer_no", "virtual_acc_no", "channel_code", "trx_date_init", "language", "inquiry_request_id", "additional_info")
+
     def __init__(self, partner_service_id: str, customer_no: str, virtual_acc_no: str,
                  channel_code: str, trx_date_init: str, language: str, inquiry_request_id: str,
                  additional_info: InquiryRequestAdditionalInfo) -> None:
@@ -4,6 +4,8 @@ from doku_python_library.src.model.inquiry.inquiry_request_additional_info impor
 
 class InquiryRequestVirtualAccountData:
 
+    __slots__ = ("partner_service_id", "customer_no", "virtual_acc_no", "virtual_acc_name", "virtual_acc_email", "virtual_acc_phone", "total_amount", "virtual_acc_trx_type", "expired_date", "additional_info", "inquiry_status", "inquiry_reason", "inquiry_request_id", "trx_id")
+
     def __init__(self, partnerServiceId: str, customerNo: str, virtualAccountNo: str,
                  virtualAccountName: str, virtualAccountEmail: str,
                  totalAmount: TotalAmount, virtualAccountTrxType: str, expiredDate: str,
@@ -1,5 +1,7 @@
 from doku_python_library.src.model.inquiry.inquiry_request_virtual_account_data import InquiryRequestVirtualAccountData
 class InquiryResponseBody:
+
+    __slots__ = ("response_code", "response_message", "virtual_account_data")
     
     def __init__(self, responseCode: str, responseMessage: str, virtualAccountData: InquiryRequestVirtualAccountData = None) -> None:
         self.response_code = responseCode
@@ -1,11 +1,19 @@
-from doku_python_library.src.model.notification.notification_token import *
-from doku_python_library.src.model.notification.notification_token_header import *
-from doku_python_library.src.model.notification.notification_token_body import *
-from doku_python_library.src.model.notification.notification_payment_request import *
-from doku_python_library.src.model.notification.notification_payment_response import *
-from doku_python_library.src.model.notification.notification_payment_header_response import *
-from doku_python_library.src.model.notification.notification_payment_body_response import *
-from doku_python_library.src.model.notification.notification_virtual_account_data import *
-from doku_python_library.src.model.notification.notification_payment_direct_debit_request import *
-from doku_python_library.src.model.notification.notification_payment_direct_debit_additional_info import *
-from doku_python_library.src.model.notification.notification_payment_direct_debit_response import *
\ No newline at end of file
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = {
+    "NotificationToken": "doku_python_library.src.model.notification.notification_token",
+    "NotificationTokenHeader": "doku_python_library.src.model.notification.notification_token_header",
+    "NotificationTokenBody": "doku_python_library.src.model.notification.notification_token_body",
+    "PaymentNotificationAdditionalInfo": "doku_python_library.src.model.notification.notification_payment_request",
+    "PaymentNotificationRequest": "doku_python_library.src.model.notification.notification_payment_request",
+    "PaymentNotificationResponse": "doku_python_library.src.model.notification.notification_payment_response",
+    "PaymentNotificationResponseHeader": "doku_python_library.src.model.notification.notification_payment_header_response",
+    "PaymentNotificationResponseBody": "doku_python_library.src.model.notification.notification_payment_body_response",
+    "NotificationVirtualAccountData": "doku_python_library.src.model.notification.notification_virtual_account_data",
+    "NotificationPaymentDirectDebitRequest": "doku_python_library.src.model.notification.notification_payment_direct_debit_request",
+    "NotificationPaymentDirectDebitAdditionalInfo": "doku_python_library.src.model.notification.notification_payment_direct_debit_additional_info",
+    "NotificationPaymentDirectDebitResponse": "doku_python_library.src.model.notification.notification_payment_direct_debit_response"
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
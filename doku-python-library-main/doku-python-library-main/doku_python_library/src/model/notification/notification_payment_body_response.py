@@ -2,6 +2,8 @@ from doku_python_library.src.model.notification.notification_virtual_account_dat
 
 class PaymentNotificationResponseBody:
 
+    __slots__ = ("response_code", "response_message", "virtual_account_data")
+
     def __init__(self, responseCode: str, responseMessage: str, virtualAccountData: NotificationVirtualAccountData = None) -> None:
         self.response_code = responseCode
         self.response_message = responseMessage
@@ -11,5 +13,5 @@ class PaymentNotificationResponseBody:
         return {
             "responseCode": self.response_code,
             "responseMessage": self.response_message,
-            "virtualAccountData": self.virtual_account_data.json()
+            "virtualAccountData": self.virtual_account_data.json() if self.virtual_account_data is not None else None
         }
\ No newline at end of file
@@ -2,6 +2,8 @@ from doku_python_library.src.model.direct_debit.line_items import LineItems
 
 class NotificationPaymentDirectDebitAdditionalInfo:
 
+    __slots__ = ("channel_id", "acquirer_id", "cust_id_merchant", "account_type", "line_items")
+
     def __init__(self, channel_id: str = None, acquirer_id: str = None, cust_id_merchant: str = None,
                  account_type: str = None, line_items: list[LineItems] = None) -> None:
         self.channel_id = channel_id
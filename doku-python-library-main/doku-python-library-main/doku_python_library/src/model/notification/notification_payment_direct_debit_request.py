@@ -3,6 +3,8 @@ from doku_python_library.src.model.notification.notification_payment_direct_debi
 
 class NotificationPaymentDirectDebitRequest:
 
+    __slots__ = ("original_partner_reference_no", "original_reference_no", "original_external_id", "latest_transaction_status", "transaction_status_desc", "amount", "additional_info")
+
     def __init__(self, original_partner_reference_no: str, original_reference_no: str, original_external_id: str,
                  latest_transaction_status: str, transaction_status_desc: str, amount: TotalAmount, additional_info: NotificationPaymentDirectDebitAdditionalInfo) -> None:
         self.original_partner_reference_no = original_partner_reference_no
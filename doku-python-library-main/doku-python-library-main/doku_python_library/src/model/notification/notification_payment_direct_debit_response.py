@@ -1,6 +1,8 @@
 
 class NotificationPaymentDirectDebitResponse:
 
+    __slots__ = ("response_code", "response_message", "approval_code")
+
     def __init__(self, responseCode: str, responseMessage: str, approvalCode: str = None) -> None:
         self.response_code = responseCode
         self.response_message = responseMessage
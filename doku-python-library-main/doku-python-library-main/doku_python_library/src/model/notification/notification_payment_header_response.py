@@ -1,6 +1,8 @@
 
 class PaymentNotificationResponseHeader:
 
+    __slots__ = ("x_timestamp", "content_type")
+
     def __init__(self, xTimestamp: str) -> None:
         self.x_timestamp = xTimestamp
         self.content_type = "application/json"
\ No newline at end of file
@@ -3,6 +3,8 @@ from doku_python_library.src.model.va.additional_info import AdditionalInfo
 
 class PaymentNotificationAdditionalInfo:
 
+    __slots__ = ("sender_name", "source_account_no", "source_bank_code", "source_bank_name")
+
     def __init__(self, channel: str, sender_name: str, source_account_no: str, source_bank_code: str,
                  source_bank_name: str) -> None:
         self.sender_name = sender_name
@@ -12,6 +14,8 @@ class PaymentNotificationAdditionalInfo:
 
 class PaymentNotificationRequest:
 
+    __slots__ = ("partner_service_id", "customer_no", "virtual_acc_no", "virtual_acc_name", "trx_id", "payment_request_id", "paid_amount", "virtual_acc_email", "virtual_acc_phone", "additional_info", "virtual_acc_trx_type", "expired_date", "trx_date_time")
+
     def __init__(self, partnerServiceId: str = None, customerNo: str = None, virtualAccountNo: str = None,
                  virtualAccountName: str = None, trxId: str = None, paymentRequestId: str = None, trxDateTime: str = None,
                  paidAmount: TotalAmount = None, virtualAccountEmail: str = None, virtualAccountPhone: str = None, additionalInfo: AdditionalInfo = None, virtualAccountTrxType: str = None,
@@ -4,6 +4,8 @@ from doku_python_library.src.model.notification.notification_payment_body_respon
 
 class PaymentNotificationResponse:
 
+    __slots__ = ("header", "body")
+
     def __init__(self, header: PaymentNotificationResponseHeader, body: PaymentNotificationResponseBody) -> None:
         self.header = header
         self.body = body
\ No newline at end of file
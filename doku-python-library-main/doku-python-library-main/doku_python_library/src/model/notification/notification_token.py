@@ -3,6 +3,8 @@ from doku_python_library.src.model.notification.notification_token_body import N
 
 class NotificationToken:
 
+    __slots__ = ("header", "body")
+
     def __init__(self, header: NotificationTokenHeader, body: NotificationTokenBody) -> None:
         self.header = header
         self.body = body
\ No newline at end of file
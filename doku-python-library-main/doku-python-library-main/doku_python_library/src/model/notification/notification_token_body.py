@@ -1,5 +1,7 @@
 class NotificationTokenBody:
 
+    __slots__ = ("response_code", "response_message", "access_token", "token_type", "expires_in", "additionalInfo")
+
     def __init__(self, responseCode: str, responseMessage: str, accessToken: str, 
                  tokenType: str, expiresIn: int, additionalInfo: str) -> None:
         self.response_code = responseCode
@@ -1,5 +1,7 @@
 class NotificationTokenHeader:
 
+    __slots__ = ("client_id", "timestamp")
+
     def __init__(self, client_id: str, timestamp: str) -> None:
         self.client_id = client_id
         self.timestamp = timestamp
@@ -3,6 +3,8 @@ from doku_python_library.src.model.va.additional_info import AdditionalInfo
 
 class NotificationVirtualAccountData:
 
+    __slots__ = ("partner_service_id", "customer_no", "virtual_acc_no", "virtual_acc_name", "payment_request_id", "additional_info", "trx_date_time")
+
     def __init__(self, partnerServiceId: str, customerNo: str, virtualAccountNo: str, 
                  virtualAccountName: str, paymentRequestId: str, trxDateTime: str = None, additionalInfo: AdditionalInfo = None) -> None:
         self.partner_service_id = partnerServiceId
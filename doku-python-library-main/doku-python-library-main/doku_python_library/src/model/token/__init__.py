@@ -1,4 +1,11 @@
-from doku_python_library.src.model.token.token_b2b_request import *
-from doku_python_library.src.model.token.token_b2b_response import *
-from doku_python_library.src.model.token.token_b2b2c_request import *
-from doku_python_library.src.model.token.token_b2b2c_response import *
\ No newline at end of file
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = {
+    "TokenB2BRequest": "doku_python_library.src.model.token.token_b2b_request",
+    "TokenB2BResponse": "doku_python_library.src.model.token.token_b2b_response",
+    "TokenB2B2CRequest": "doku_python_library.src.model.token.token_b2b2c_request",
+    "TokenB2B2CResponse": "doku_python_library.src.model.token.token_b2b2c_response"
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -1,6 +1,8 @@
 
 class TokenB2B2CRequest:
 
+    __slots__ = ("grant_type", "auth_code")
+
     def __init__(self, grant_type: str, auth_code: str) -> None:
         self. grant_type = grant_type
         self.auth_code = auth_code
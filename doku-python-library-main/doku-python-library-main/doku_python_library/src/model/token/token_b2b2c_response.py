@@ -1,6 +1,8 @@
 
 class TokenB2B2CResponse:
 
+    __slots__ = ("response_code", "response_message", "access_token", "token_type", "access_token_expiry_time", "refresh_token", "refresh_token_expiry_time", "additional_info", "generated_timestamp")
+
     def __init__(self, responseCode: str, responseMessage: str, accessToken: str = None, tokenType: str = None,
                  accessTokenExpiryTime: str = None, refreshToken: str = None, refreshTokenExpiryTime: str = None,
                  additionalInfo: any = None) -> None:
@@ -1,5 +1,7 @@
 class TokenB2BRequest:
 
+    __slots__ = ("signature", "timestamp", "client_id", "grant_type", "additional_info")
+
     def __init__(self, signature: str, 
                  timestamp: str, 
                  client_id: str, 
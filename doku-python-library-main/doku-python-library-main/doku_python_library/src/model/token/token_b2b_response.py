@@ -1,4 +1,6 @@
 class TokenB2BResponse :
+
+    __slots__ = ("response_code", "response_message", "access_token", "token_type", "expires_in", "additional_info", "generated_timestamp")
     
     def __init__(self, 
                  responseCode: str = None, 
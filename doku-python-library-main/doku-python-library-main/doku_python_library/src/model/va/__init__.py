@@ -1,23 +1,30 @@
-from doku_python_library.src.model.va.additional_info_response import *
-from doku_python_library.src.model.va.additional_info import *
-from doku_python_library.src.model.va.create_va_request import *
-from doku_python_library.src.model.va.create_va_response import *
-from doku_python_library.src.model.va.origin import *
-from doku_python_library.src.model.va.total_amount import *
-from doku_python_library.src.model.va.virtual_account_data import *
-from doku_python_library.src.model.va.virtual_account_config import *
-from doku_python_library.src.model.va.update_va_request import *
-from doku_python_library.src.model.va.update_va_additional_info import *
-from doku_python_library.src.model.va.update_va_config import *
-from doku_python_library.src.model.va.update_va_response import *
-from doku_python_library.src.model.va.check_status_va_request import *
-from doku_python_library.src.model.va.check_status_additional_info_response import *
-from doku_python_library.src.model.va.check_status_payment_flag_response import *
-from doku_python_library.src.model.va.check_status_va_data import *
-from doku_python_library.src.model.va.check_status_va_response import *
-from doku_python_library.src.model.va.delete_va_request import *
-from doku_python_library.src.model.va.delete_va_additional_info import *
-from doku_python_library.src.model.va.delete_va_response import *
-from doku_python_library.src.model.va.delete_va_additional_info_response import *
-from doku_python_library.src.model.va.delete_va_virtual_acc_data import *
-from doku_python_library.src.model.va.bill_amount import *
\ No newline at end of file
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = {
+    "AdditionalInfoResponse": "doku_python_library.src.model.va.additional_info_response",
+    "AdditionalInfo": "doku_python_library.src.model.va.additional_info",
+    "CreateVARequest": "doku_python_library.src.model.va.create_va_request",
+    "CreateVAResponse": "doku_python_library.src.model.va.create_va_response",
+    "Origin": "doku_python_library.src.model.va.origin",
+    "TotalAmount": "doku_python_library.src.model.va.total_amount",
+    "VirtualAccountData": "doku_python_library.src.model.va.virtual_account_data",
+    "VirtualAccountConfig": "doku_python_library.src.model.va.virtual_account_config",
+    "UpdateVaRequest": "doku_python_library.src.model.va.update_va_request",
+    "UpdateVAAdditionalInfo": "doku_python_library.src.model.va.update_va_additional_info",
+    "UpdateVAConfig": "doku_python_library.src.model.va.update_va_config",
+    "UpdateVAResponse": "doku_python_library.src.model.va.update_va_response",
+    "CheckStatusRequest": "doku_python_library.src.model.va.check_status_va_request",
+    "CheckStatusAdditionalInfoResponse": "doku_python_library.src.model.va.check_status_additional_info_response",
+    "CheckStatusPaymentFlagResponse": "doku_python_library.src.model.va.check_status_payment_flag_response",
+    "CheckStatusVAData": "doku_python_library.src.model.va.check_status_va_data",
+    "CheckStatusVAResponse": "doku_python_library.src.model.va.check_status_va_response",
+    "DeleteVARequest": "doku_python_library.src.model.va.delete_va_request",
+    "DeleteVAAdditionalInfo": "doku_python_library.src.model.va.delete_va_additional_info",
+    "DeleteVAResponse": "doku_python_library.src.model.va.delete_va_response",
+    "DeleteVaResponseAdditionalInfo": "doku_python_library.src.model.va.delete_va_additional_info_response",
+    "DeleteVAResponseVirtualAccountData": "doku_python_library.src.model.va.delete_va_virtual_acc_data",
+    "BillAmount": "doku_python_library.src.model.va.bill_amount"
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -2,6 +2,8 @@ from doku_python_library.src.model.va.virtual_account_config import VirtualAccou
 
 class AdditionalInfo:
 
+    __slots__ = ("channel", "virtual_account_config")
+
     def __init__(self, channel: str, virtual_account_config: VirtualAccountConfig = None) -> None:
         self.channel = channel
         self.virtual_account_config = virtual_account_config
@@ -1,5 +1,7 @@
 class AdditionalInfoResponse:
 
+    __slots__ = ("channel", "how_to_pay_page", "how_to_pay_api")
+
     def __init__(self, channel: str, howToPayPage: str, howToPayApi: str) -> None:
         self.channel = channel
         self.how_to_pay_page = howToPayPage
@@ -2,5 +2,7 @@ from doku_python_library.src.model.va.total_amount import TotalAmount
 
 class BillAmount:
 
+    __slots__ = ("total_amount",)
+
     def __init__(self, billAmount: TotalAmount = None) -> None:
         self.total_amount = billAmount
\ No newline at end of file
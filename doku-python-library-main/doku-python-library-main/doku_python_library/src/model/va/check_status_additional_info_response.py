@@ -1,5 +1,7 @@
 class CheckStatusAdditionalInfoResponse:
 
+    __slots__ = ("acquirer",)
+
     def __init__(self, acquirer: str):
         self.acquirer = acquirer
     
@@ -1,5 +1,7 @@
 class CheckStatusPaymentFlagResponse:
 
+    __slots__ = ("english", "indonesia")
+
     def __init__(self, english: str, indonesia: str):
         self.english = english
         self.indonesia = indonesia
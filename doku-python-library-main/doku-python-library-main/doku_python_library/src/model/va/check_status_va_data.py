@@ -4,6 +4,8 @@ from doku_python_library.src.model.va.bill_amount import BillAmount
 
 class CheckStatusVAData:
 
+    __slots__ = ("partner_service_id", "customer_no", "virtual_acc_no", "paid_amount", "bill_amount", "payment_flag_reason", "inquiry_request_id", "payment_request_id", "virtual_acc_number")
+
     def __init__(self, partnerServiceId: str, customerNo: str, virtualAccountNo: str,
                  paidAmount: TotalAmount, billDetails: list[BillAmount] = None,
                  paymentFlagReason: CheckStatusPaymentFlagResponse = None, inquiryRequestId: str = None, paymentRequestId: str = None,
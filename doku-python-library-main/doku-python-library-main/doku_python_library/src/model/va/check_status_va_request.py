@@ -1,8 +1,37 @@
-import re
 from doku_python_library.src.model.va.check_status_va_response import CheckStatusVAResponse
+from doku_python_library.src.commons.request_validator import RequestValidator, FieldRule, Rule
 
 class CheckStatusRequest:
 
+    __slots__ = ("partner_service_id", "customer_no", "virtual_acc_no", "virtual_acc_name", "inquiry_request_id", "payment_request_id", "additional_info")
+
+    _validator = RequestValidator([
+        FieldRule("partner_service_id", [
+            Rule.not_null("partnerServiceId cannot be null. Please provide a partnerServiceId. Example: ' 888994'."),
+            Rule.length(8, "partnerServiceId must be exactly 8 characters long and equiped with left-padded spaces. Example: ' 888994'."),
+            Rule.string("partnerServiceId must be a string. Ensure that partnerServiceId is enclosed in quotes. Example: ' 888994'."),
+            Rule.pattern(r'^\s{0,7}\d{1,8}$', "partnerServiceId must consist of up to 8 digits of character. Remaining space in case of partner serivce id is less than 8 must be filled with spaces. Example: ' 888994' (2 spaces and 6 digits).")
+        ]),
+        FieldRule("customer_no", [
+            Rule.not_null("customerNo must be a string. Ensure that customerNo is enclosed in quotes. Example: '00000000000000000001'."),
+            Rule.max_length(20, "customerNo must be 20 characters or fewer. Ensure that customerNo is no longer than 20 characters. Example: '00000000000000000001'."),
+            Rule.pattern(r'^\d+$', "customerNo must consist of only digits. Ensure that customerNo contains only numbers. Example: '00000000000000000001'.")
+        ]),
+        FieldRule("virtual_acc_no", [
+            Rule.not_null("virtualAccountNo cannot be null. Please provide a virtualAccountNo. Example: ' 88899400000000000000000001'."),
+            Rule.ascii("virtualAccountNo must be a string. Ensure that virtualAccountNo is enclosed in quotes. Example: ' 88899400000000000000000001'."),
+            Rule.custom(lambda va_no, request: va_no == request.partner_service_id + request.customer_no, "virtualAccountNo must be the concatenation of partnerServiceId and customerNo. Example: ' 88899400000000000000000001' (where partnerServiceId is ' 888994' and customerNo is '00000000000000000001').")
+        ]),
+        FieldRule("inquiry_request_id", [
+            Rule.string("inquiryRequestId must be a string. Ensure that inquiryRequestId is enclosed in quotes. Example: ‘abcdef-123456-abcdef’"),
+            Rule.max_length(128, "inquiryRequestId must be 128 characters or fewer. Ensure that inquiryRequestId is no longer than 128 characters. Example: ‘abcdef-123456-abcdef’.")
+        ], optional=True),
+        FieldRule("payment_request_id", [
+            Rule.string("paymentRequestId must be a string. Ensure that paymentRequestId is enclosed in quotes. Example: ‘abcdef-123456-abcdef’."),
+            Rule.max_length(128, "paymentRequestId must be 128 characters or fewer. Ensure that paymentRequestId is no longer than 128 characters. Example: ‘abcdef-123456-abcdef’.")
+        ], optional=True)
+    ])
+
     def __init__(self, partner_service_id: str, customer_no: str, virtual_acc_no: str,
                  virtual_acc_name: str = None, inquiry_request_id: str = None, payment_request_id: str = None,
                  additional_info: any = None):
@@ -15,61 +44,12 @@ class CheckStatusRequest:
         self.additional_info = additional_info
 
     def validate_check_status_request(self) -> None:
-        self._validate_partner_service_id()
-        self._validate_customer_no()
-        if self.inquiry_request_id is not None:
-            self._validate_inquiry_request_id()
-        if self.payment_request_id is not None:
-            self._validate_payment_request_id()
-    
-    def _validate_partner_service_id(self) -> None:
-        pattern = r'^\s{0,7}\d{1,8}$' 
-        value: str = self.partner_service_id
-        if value is None:
-            raise Exception("partnerServiceId cannot be null. Please provide a partnerServiceId. Example: ' 888994'.")
-        elif len(value) != 8:
-            raise Exception("partnerServiceId must be exactly 8 characters long and equiped with left-padded spaces. Example: ' 888994'.")
-        elif not isinstance(value, str):
-            raise Exception("partnerServiceId must be a string. Ensure that partnerServiceId is enclosed in quotes. Example: ' 888994'.")
-        elif not re.match(pattern, value):
-            raise Exception("partnerServiceId must consist of up to 8 digits of character. Remaining space in case of partner serivce id is less than 8 must be filled with spaces. Example: ' 888994' (2 spaces and 6 digits).")
-        
-    def _validate_customer_no(self) -> None:
-        pattern = r'^\d+$'
-        value: str = self.customer_no
-        if value is None:
-            raise Exception("customerNo must be a string. Ensure that customerNo is enclosed in quotes. Example: '00000000000000000001'.")
-        elif len(value) > 20:
-            raise Exception("customerNo must be 20 characters or fewer. Ensure that customerNo is no longer than 20 characters. Example: '00000000000000000001'.")
-        elif not re.match(pattern, value):
-            raise Exception("customerNo must consist of only digits. Ensure that customerNo contains only numbers. Example: '00000000000000000001'.")
-        self._validate_virtual_acc_no()
-    
-    def _validate_virtual_acc_no(self) -> None:
-        va_no: str = self.virtual_acc_no
-        value: str = self.customer_no
-        if va_no is None:
-            raise Exception("virtualAccountNo cannot be null. Please provide a virtualAccountNo. Example: ' 88899400000000000000000001'.")
-        elif not va_no.isascii():
-            raise Exception("virtualAccountNo must be a string. Ensure that virtualAccountNo is enclosed in quotes. Example: ' 88899400000000000000000001'.")
-        elif va_no != (self.partner_service_id + value):
-            raise Exception("virtualAccountNo must be the concatenation of partnerServiceId and customerNo. Example: ' 88899400000000000000000001' (where partnerServiceId is ' 888994' and customerNo is '00000000000000000001').")
-        
-    def _validate_inquiry_request_id(self) -> None:
-        value: str = self.inquiry_request_id
-        if not isinstance(value, str):
-            raise Exception("inquiryRequestId must be a string. Ensure that inquiryRequestId is enclosed in quotes. Example: ‘abcdef-123456-abcdef’")
-        elif len(value) > 128:
-            raise Exception("inquiryRequestId must be 128 characters or fewer. Ensure that inquiryRequestId is no longer than 128 characters. Example: ‘abcdef-123456-abcdef’.")
-    
-    def _validate_payment_request_id(self) -> None:
-        value: str = self.payment_request_id
-        if not isinstance(value, str):
-            raise Exception("paymentRequestId must be a string. Ensure that paymentRequestId is enclosed in quotes. Example: ‘abcdef-123456-abcdef’.")
-        elif len(value) > 128:
-            raise Exception("paymentRequestId must be 128 characters or fewer. Ensure that paymentRequestId is no longer than 128 characters. Example: ‘abcdef-123456-abcdef’.")
-        
-    
+        CheckStatusRequest._validator.validate(self)
+
+    @staticmethod
+    def validate_many(requests) -> list:
+        return CheckStatusRequest._validator.validate_many(requests)
+
     def create_request_body(self) -> dict:
         request: dict = {
             "partnerServiceId": self.partner_service_id,
@@ -3,6 +3,8 @@ from doku_python_library.src.model.va.check_status_additional_info_response impo
 
 class CheckStatusVAResponse:
 
+    __slots__ = ("response_code", "response_message", "virtual_account_data", "additional_info")
+
     def __init__(self, responseCode: str, responseMessage: str, virtualAccountData: CheckStatusVAData = None, 
                  additionalInfo: CheckStatusAdditionalInfoResponse = None) -> None:
         self.response_code = responseCode
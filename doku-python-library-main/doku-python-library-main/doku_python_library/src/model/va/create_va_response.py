@@ -2,6 +2,8 @@ from doku_python_library.src.model.va.virtual_account_data import VirtualAccount
 
 class CreateVAResponse:
 
+    __slots__ = ("response_code", "response_message", "virtual_account_data")
+
     def __init__(self, 
                  responseCode: str, 
                  responseMessage: str, 
@@ -1,5 +1,7 @@
 class DeleteVAAdditionalInfo:
 
+    __slots__ = ("channel",)
+
     def __init__(self, channel: str) -> None:
         self.channel = channel
     
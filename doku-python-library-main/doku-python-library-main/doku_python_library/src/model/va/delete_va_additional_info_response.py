@@ -1,5 +1,7 @@
 class DeleteVaResponseAdditionalInfo:
 
+    __slots__ = ("channel", "virtual_account_config")
+
     def __init__(self, channel: str, virtualAccountConfig: str) -> None:
         self.channel = channel
         self.virtual_account_config = virtualAccountConfig
\ No newline at end of file
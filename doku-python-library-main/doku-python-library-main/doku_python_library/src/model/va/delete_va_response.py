@@ -2,6 +2,8 @@ from doku_python_library.src.model.va.delete_va_virtual_acc_data import DeleteVA
 
 class DeleteVAResponse:
 
+    __slots__ = ("response_code", "response_message", "virtual_acc_data")
+
     def __init__(self, responseCode: str, responseMessage: str, virtualAccountData: DeleteVAResponseVirtualAccountData = None) -> None:
         self.response_code = responseCode
         self.response_message = responseMessage
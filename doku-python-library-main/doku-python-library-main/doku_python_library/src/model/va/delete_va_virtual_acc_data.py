@@ -1,6 +1,8 @@
 from doku_python_library.src.model.va.delete_va_additional_info_response import DeleteVaResponseAdditionalInfo
 class DeleteVAResponseVirtualAccountData:
 
+    __slots__ = ("partner_service_id", "customer_no", "virtual_acc_no", "trx_id", "additional_info")
+
     def __init__(self, partnerServiceId: str, customerNo: str, virtualAccountNo: str, trxId: str, additionalInfo: DeleteVaResponseAdditionalInfo) -> None:
         self.partner_service_id = partnerServiceId
         self.customer_no: customerNo
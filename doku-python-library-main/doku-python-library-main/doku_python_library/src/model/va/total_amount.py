@@ -1,5 +1,7 @@
 class TotalAmount:
 
+    __slots__ = ("value", "currency")
+
     def __init__(self, value: str, currency: str = "IDR") -> None:
         self.value = value
         self.currency = currency
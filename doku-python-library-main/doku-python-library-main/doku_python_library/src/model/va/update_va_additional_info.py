@@ -2,6 +2,8 @@ from doku_python_library.src.model.va.update_va_config import UpdateVAConfig
 
 class UpdateVAAdditionalInfo:
 
+    __slots__ = ("channel", "virtual_account_config")
+
     def __init__(self, channel: str, virtualAccountConfig: UpdateVAConfig = None):
         self.channel = channel
         self.virtual_account_config = virtualAccountConfig
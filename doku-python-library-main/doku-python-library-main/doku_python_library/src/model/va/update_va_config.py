@@ -1,5 +1,7 @@
 class UpdateVAConfig:
 
+    __slots__ = ("status", "min_amount", "max_amount")
+
     def __init__(self, status: str = None, min_amount: str = None, max_amount: str = None):
         self.status = status
         self.min_amount = min_amount
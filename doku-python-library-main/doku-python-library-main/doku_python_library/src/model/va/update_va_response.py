@@ -2,6 +2,8 @@ from doku_python_library.src.model.va.create_va_request import CreateVARequest
 
 class UpdateVAResponse:
 
+    __slots__ = ("response_code", "response_message", "virtual_account_data")
+
     def __init__(self, responseCode: str, responseMessage: str, virtualAccountData: CreateVARequest=None):
         self.response_code = responseCode
         self.response_message = responseMessage
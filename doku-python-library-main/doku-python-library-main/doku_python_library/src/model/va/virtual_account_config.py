@@ -1,5 +1,7 @@
 class VirtualAccountConfig:
 
+    __slots__ = ("reusable_status", "min_amount", "max_amount")
+
     def __init__(self, reusable_status: bool = None, min_amount: str = None, max_amount: str = None):
         self.reusable_status = reusable_status
         self.min_amount = min_amount
@@ -4,6 +4,8 @@ from doku_python_library.src.model.va.additional_info_response import Additional
 
 class VirtualAccountData:
 
+    __slots__ = ("partner_service_id", "customer_no", "virtual_acc_no", "virtual_acc_name", "virtual_acc_email", "trx_id", "total_amount", "additional_info")
+
     def __init__(self, 
                  partnerServiceId: str, 
                  virtualAccountName: str,
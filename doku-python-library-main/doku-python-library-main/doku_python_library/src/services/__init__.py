@@ -1,4 +1,25 @@
-from doku_python_library.src.services.token_service import *
-from doku_python_library.src.services.va_service import *
-from doku_python_library.src.services.notification_service import *
-from doku_python_library.src.services.direct_debit_service import *
\ No newline at end of file
+from doku_python_library.src.lazy_loader import lazy_exports
+
+_exports: dict = {
+    "SignatureVerifier": "doku_python_library.src.services.signature_verifier",
+    "HmacSigner": "doku_python_library.src.services.hmac_signer",
+    "RsaSigner": "doku_python_library.src.services.rsa_signer",
+    "TokenService": "doku_python_library.src.services.token_service",
+    "TokenStore": "doku_python_library.src.services.token_store",
+    "InMemoryTokenStore": "doku_python_library.src.services.token_store",
+    "FileTokenStore": "doku_python_library.src.services.token_store",
+    "RedisTokenStore": "doku_python_library.src.services.token_store",
+    "TokenManager": "doku_python_library.src.services.token_manager",
+    "TokenRefresher": "doku_python_library.src.services.token_refresher",
+    "TokenB2B2CCache": "doku_python_library.src.services.token_b2b2c_cache",
+    "BulkExecutor": "doku_python_library.src.services.bulk_executor",
+    "VaReconciler": "doku_python_library.src.services.va_reconciler",
+    "VaService": "doku_python_library.src.services.va_service",
+    "NotificationService": "doku_python_library.src.services.notification_service",
+    "NotificationProcessor": "doku_python_library.src.services.notification_processor",
+    "NotificationAsgiApp": "doku_python_library.src.services.notification_asgi_app",
+    "DirectDebitService": "doku_python_library.src.services.direct_debit_service"
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import time
+
+class BulkExecutor:
+
+    @staticmethod
+    def stream(items, task, concurrency: int = 10, rate_limit: float = None, precheck = None,
+               thread_name_prefix: str = "doku-bulk"):
+        if concurrency < 1:
+            raise Exception("concurrency must be at least 1.")
+        if rate_limit is not None and rate_limit <= 0:
+            raise Exception("rate_limit must be greater than 0.")
+        interval: float = 0.0 if rate_limit is None else 1.0 / rate_limit
+        next_slot: float = time.monotonic()
+        items = iter(items)
+        exhausted: bool = False
+        pending: dict = {}
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=thread_name_prefix)
+        try:
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    if interval and time.monotonic() < next_slot:
+                        break
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if precheck is not None:
+                        result = precheck(item)
+                        if result is not None:
+                            yield item, result
+                            continue
+                    pending[executor.submit(task, item)] = item
+                    next_slot = max(next_slot, time.monotonic()) + interval
+                if exhausted and not pending:
+                    return
+                timeout: float = None
+                if interval and not exhausted and len(pending) < concurrency:
+                    timeout = max(next_slot - time.monotonic(), 0.0)
+                if not pending:
+                    time.sleep(timeout)
+                    continue
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -19,7 +19,9 @@ from doku_python_library.src.model.direct_debit.check_status_request import Chec
 from doku_python_library.src.model.direct_debit.check_status_response import CheckStatusResponse
 from doku_python_library.src.model.direct_debit.bank_card_data import BankCardData
 from doku_python_library.src.commons.config import Config
-from Crypto.Cipher import AES
+from doku_python_library.src.commons.http_client import HttpClient
+from doku_python_library.src.commons.instrumentation import Instrumentation
+from doku_python_library.src.commons.json_codec import JsonCodec
 import base64
 import json
 
@@ -28,56 +30,68 @@ import requests
 class DirectDebitService:
 
     @staticmethod
-    def do_account_binding_process(request_header: RequestHeader, request: AccountBindingRequest, is_production: bool) -> AccountBindingResponse:
+    def do_account_binding_process(request_header: RequestHeader, request: AccountBindingRequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> AccountBindingResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.DIRECT_DEBIT_ACCOUNT_BINDING_URL
             request_header.validate_account_binding_header(request.additional_info.channel)
             headers: dict = request_header.to_json()
-            response = requests.post(url=url, json=request.json(), headers=headers)
-            response_json = response.json()
-            account_binding_response: AccountBindingResponse = AccountBindingResponse(**response_json)
+            if body is None:
+                body = JsonCodec.dumps(request.json())
+            response = HttpClient.resolve(http_client).post(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                account_binding_response: AccountBindingResponse = AccountBindingResponse(**response_json)
             return account_binding_response
         except Exception as e:
             print("Failed Parse Response "+str(e))
             raise Exception(e)
     
     @staticmethod
-    def do_payment_process(request_header: RequestHeader, request: PaymentRequest, is_production: bool) -> PaymentResponse:
+    def do_payment_process(request_header: RequestHeader, request: PaymentRequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> PaymentResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.DIRECT_DEBIT_PAYMENT_URL
             request_header.validate_payment_header(request.additional_info.channel)
             headers: dict = request_header.to_json()
-            response = requests.post(url=url, json=request.create_request_body(), headers=headers)
-            response_json = response.json()
-            payment_response: PaymentResponse = PaymentResponse(**response_json)
+            if body is None:
+                body = JsonCodec.dumps(request.create_request_body())
+            response = HttpClient.resolve(http_client).post(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                payment_response: PaymentResponse = PaymentResponse(**response_json)
             return payment_response
         except Exception as e:
             print("Failed Parse Response "+ str(e))
             raise Exception(e)
     
     @staticmethod
-    def do_balance_inquiry(request_header: RequestHeader, request: BalanceInquiryRequest, is_production: bool) -> BalanceInquiryRequest:
+    def do_balance_inquiry(request_header: RequestHeader, request: BalanceInquiryRequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> BalanceInquiryRequest:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.DIRECT_DEBIT_BALANCE_INQUIRY_URL
             request_header.validate_balance_inquiry_header(channel=request.additional_info.channel)
             headers: dict = request_header.to_json()
-            response = requests.post(url=url, json=request.create_request_body(), headers=headers)
-            response_json = response.json()
-            balance_response: BalanceInquiryResponse = BalanceInquiryResponse(**response_json)
+            if body is None:
+                body = JsonCodec.dumps(request.create_request_body())
+            response = HttpClient.resolve(http_client).post(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                balance_response: BalanceInquiryResponse = BalanceInquiryResponse(**response_json)
             return balance_response
         except Exception as e:
             print("Failed Parse Response "+ str(e))
             raise Exception(e)
     
     @staticmethod
-    def do_account_unbinding_process(request_header: RequestHeader, request: AccountUnbindingRequest, is_production: bool) -> AccountUnbindingResponse:
+    def do_account_unbinding_process(request_header: RequestHeader, request: AccountUnbindingRequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> AccountUnbindingResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.DIRECT_DEBIT_ACCOUNT_UNBINDING_URL
             request_header.validate_account_unbinding_header(channel=request.additional_info.channel)
             headers: dict = request_header.to_json()
-            response = requests.post(url=url, json=request.create_request_body(), headers=headers)
-            response_json = response.json()
-            unbinding_response: AccountUnbindingResponse = AccountUnbindingResponse(**response_json)
+            if body is None:
+                body = JsonCodec.dumps(request.create_request_body())
+            response = HttpClient.resolve(http_client).post(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                unbinding_response: AccountUnbindingResponse = AccountUnbindingResponse(**response_json)
             return unbinding_response
         except Exception as e:
             print("Failed Parse Response "+ str(e))
@@ -85,66 +99,81 @@ class DirectDebitService:
 
     
     @staticmethod
-    def do_payment_jump_app_process(request_header: RequestHeader, request: PaymentJumpAppRequest, is_production: bool) -> PaymentJumpAppResponse:
+    def do_payment_jump_app_process(request_header: RequestHeader, request: PaymentJumpAppRequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> PaymentJumpAppResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.DIRECT_DEBIT_PAYMENT_URL
             headers: dict = request_header.to_json()
-            response = requests.post(url=url, json=request.create_request_body(), headers=headers)
-            response_json = response.json()
-            payment_response: PaymentJumpAppResponse = PaymentJumpAppResponse(**response_json)
+            if body is None:
+                body = JsonCodec.dumps(request.create_request_body())
+            response = HttpClient.resolve(http_client).post(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                payment_response: PaymentJumpAppResponse = PaymentJumpAppResponse(**response_json)
             return payment_response
         except Exception as e:
             print("Failed Parse Response "+ str(e))
             raise Exception(e)
     
     @staticmethod
-    def do_card_registration_process(request_header: RequestHeader, request: CardRegistrationRequest, is_production: bool) -> CardRegistrationResponse:
+    def do_card_registration_process(request_header: RequestHeader, request: CardRegistrationRequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> CardRegistrationResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.DIRECT_DEBIT_CARD_REGISTRATION
             headers: dict = request_header.to_json()
-            response = requests.post(url=url, json=request.create_request_body(), headers=headers)
-            response_json = response.json()
-            card_registration_response: CardRegistrationResponse = CardRegistrationResponse(**response_json)
+            if body is None:
+                body = JsonCodec.dumps(request.create_request_body())
+            response = HttpClient.resolve(http_client).post(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                card_registration_response: CardRegistrationResponse = CardRegistrationResponse(**response_json)
             return card_registration_response
         except Exception as e:
             print("Failed Parse Response "+ str(e))
             raise Exception(e)
     
     @staticmethod
-    def do_refund_process(request_header: RequestHeader, request: RefundRequest, is_production: bool) -> RefundResponse:
+    def do_refund_process(request_header: RequestHeader, request: RefundRequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> RefundResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.DIRECT_DEBIT_REFUND
             request_header.validate_refund_header(channel=request.additional_info.channel)
             headers: dict = request_header.to_json()
-            response = requests.post(url=url, json=request.create_request_body(), headers=headers)
-            response_json = response.json()
-            refund_response: RefundResponse = RefundResponse(**response_json)
+            if body is None:
+                body = JsonCodec.dumps(request.create_request_body())
+            response = HttpClient.resolve(http_client).post(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                refund_response: RefundResponse = RefundResponse(**response_json)
             return refund_response
         except Exception as e:
             print("Failed Parse Response "+ str(e))
             raise Exception(e)
     
     @staticmethod
-    def do_check_status(request_header: RequestHeader, request: CheckStatusRequest, is_production: bool) -> CheckStatusResponse:
+    def do_check_status(request_header: RequestHeader, request: CheckStatusRequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> CheckStatusResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.DIRECT_DEBIT_CHECK_STATUS
             headers: dict = request_header.to_json()
-            response = requests.post(url=url, json=request.create_request_body(), headers=headers)
-            response_json = response.json()
-            status_response: CheckStatusResponse = CheckStatusResponse(**response_json)
+            if body is None:
+                body = JsonCodec.dumps(request.create_request_body())
+            response = HttpClient.resolve(http_client).post(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                status_response: CheckStatusResponse = CheckStatusResponse(**response_json)
             return status_response
         except Exception as e:
             print("Failed Parse Response "+ str(e))
             raise Exception(e)
     
     @staticmethod
-    def do_card_unbinding_process(request_header: RequestHeader, request: CardUnbindingRequest, is_production: bool) -> CardUnbindingResponse:
+    def do_card_unbinding_process(request_header: RequestHeader, request: CardUnbindingRequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> CardUnbindingResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.DIRECT_DEBIT_CARD_UNBINDING_URL
             headers: dict = request_header.to_json()
-            response = requests.post(url=url, json=request.create_request_body(), headers=headers)
-            response_json = response.json()
-            unbinding_response: CardUnbindingResponse = CardUnbindingResponse(**response_json)
+            if body is None:
+                body = JsonCodec.dumps(request.create_request_body())
+            response = HttpClient.resolve(http_client).post(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                unbinding_response: CardUnbindingResponse = CardUnbindingResponse(**response_json)
             return unbinding_response
         except Exception as e:
             print("Failed Parse Response "+ str(e))
@@ -152,6 +181,7 @@ class DirectDebitService:
         
     @staticmethod
     def encrypt_card(bank_card_data: BankCardData, secret_key: str) -> str:
+        from Crypto.Cipher import AES
         try:
             bank_card_data_string = json.dumps(bank_card_data.json(), separators=(',', ':'))
             secret_key = DirectDebitService.get_secret_key(secret_key)
@@ -0,0 +1,43 @@
+import base64
+import hashlib
+import hmac
+import threading
+
+class HmacSigner:
+
+    __slots__ = ("http_method", "endpoint", "_hmac", "_prefix")
+
+    _signers: dict = {}
+    _signers_lock = threading.Lock()
+
+    def __init__(self, secret_key: str, http_method: str, endpoint: str) -> None:
+        self.http_method = http_method
+        self.endpoint = endpoint
+        self._hmac = hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha512)
+        self._prefix: bytes = "{method}:{url}:".format(method=http_method, url=endpoint).encode("utf-8")
+
+    @staticmethod
+    def for_endpoint(secret_key: str, http_method: str, endpoint: str) -> 'HmacSigner':
+        key: tuple = (secret_key, http_method, endpoint)
+        signer: HmacSigner = HmacSigner._signers.get(key)
+        if signer is None:
+            with HmacSigner._signers_lock:
+                signer = HmacSigner._signers.get(key)
+                if signer is None:
+                    signer = HmacSigner(secret_key, http_method, endpoint)
+                    HmacSigner._signers[key] = signer
+        return signer
+
+    @staticmethod
+    def invalidate(secret_key: str = None) -> None:
+        with HmacSigner._signers_lock:
+            if secret_key is None:
+                HmacSigner._signers.clear()
+            else:
+                for key in [key for key in HmacSigner._signers if key[0] == secret_key]:
+                    del HmacSigner._signers[key]
+
+    def sign(self, token_b2b: str, body: bytes, timestamp: str) -> str:
+        mac = self._hmac.copy()
+        mac.update(self._prefix + "{token}:{request_body}:{timestamp}".format(token=token_b2b, request_body=hashlib.sha256(body).hexdigest(), timestamp=timestamp).encode("utf-8"))
+        return base64.b64encode(mac.digest()).decode()
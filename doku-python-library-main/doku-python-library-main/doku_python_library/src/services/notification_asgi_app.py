@@ -0,0 +1,76 @@
+from concurrent.futures import Executor
+from doku_python_library.src.services.notification_processor import NotificationProcessor
+import asyncio
+
+_DISCONNECTED = object()
+
+class NotificationAsgiApp:
+
+    def __init__(self, processor: NotificationProcessor, token_path: str = "/authorization/v1/access-token/b2b",
+                 payment_path: str = "/v1.1/transfer-va/payment", direct_debit_path: str = "/v1.0/debit/notify",
+                 max_body_size: int = 1024 * 1024, executor: Executor = None) -> None:
+        self.processor = processor
+        self.executor = executor
+        self.max_body_size = max_body_size
+        self.routes: dict = {
+            token_path: lambda headers, body: processor.handle_token_request(headers),
+            payment_path: processor.handle_payment_notification,
+            direct_debit_path: processor.handle_direct_debit_notification
+        }
+
+    async def __call__(self, scope: dict, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message: dict = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+        handler = self.routes.get(scope["path"])
+        if handler is None:
+            await NotificationAsgiApp._respond(send, 404, {}, b'{"responseMessage":"Not Found"}')
+            return
+        if scope["method"] != "POST":
+            await NotificationAsgiApp._respond(send, 405, {}, b'{"responseMessage":"Method Not Allowed"}')
+            return
+        body: bytes = await self._read_body(receive)
+        if body is _DISCONNECTED:
+            return
+        if body is None:
+            await NotificationAsgiApp._respond(send, 413, {}, b'{"responseMessage":"Payload Too Large"}')
+            return
+        try:
+            status_code, headers, response_body = await asyncio.get_running_loop().run_in_executor(
+                self.executor, handler, scope["headers"], body
+            )
+        except Exception as e:
+            print("Failed Process Notification "+str(e))
+            status_code, headers, response_body = 500, {}, b'{"responseMessage":"Internal Server Error"}'
+        await NotificationAsgiApp._respond(send, status_code, headers, response_body)
+
+    async def _read_body(self, receive) -> bytes:
+        chunks: list = []
+        size: int = 0
+        while True:
+            message: dict = await receive()
+            if message["type"] == "http.disconnect":
+                return _DISCONNECTED
+            chunk: bytes = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    @staticmethod
+    async def _respond(send, status_code: int, headers: dict, body: bytes) -> None:
+        raw_headers: list = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("latin-1"))]
+        for name, value in headers.items():
+            if value is not None:
+                raw_headers.append((name.encode("latin-1"), str(value).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status_code, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from doku_python_library.src.commons.instrumentation import Instrumentation
+from doku_python_library.src.commons.json_codec import JsonCodec
+from doku_python_library.src.commons.header_adapter import HeaderAdapter
+from doku_python_library.src.model.notification.notification_token import NotificationToken
+from doku_python_library.src.model.notification.notification_payment_request import PaymentNotificationRequest
+from doku_python_library.src.model.notification.notification_payment_body_response import PaymentNotificationResponseBody
+from doku_python_library.src.model.notification.notification_payment_direct_debit_response import NotificationPaymentDirectDebitResponse
+from doku_python_library.src.services.token_service import TokenService
+import inspect
+import json
+import threading
+import time
+
+_PAYMENT_NOTIFICATION_FIELDS: frozenset = frozenset(inspect.signature(PaymentNotificationRequest.__init__).parameters) - {"self"}
+
+class NotificationProcessor:
+
+    def __init__(self, snap, token_cache_size: int = 1024) -> None:
+        self.snap = snap
+        self.token_cache_size = token_cache_size
+        self._valid_tokens: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_bearer_token(authorization: str) -> str:
+        if authorization is None:
+            return None
+        if authorization[:7].lower() == "bearer ":
+            return authorization[7:].strip()
+        return authorization.strip()
+
+    def is_signature_valid(self, headers) -> bool:
+        return TokenService.verify_notification_signature(headers=headers, client_id=self.snap.client_id, public_key=self.snap.public_key)
+
+    def is_token_valid(self, token: str) -> bool:
+        if not token:
+            return False
+        now: float = time.time()
+        with self._lock:
+            expires_at: float = self._valid_tokens.get(token)
+            if expires_at is not None:
+                if expires_at > now:
+                    return True
+                del self._valid_tokens[token]
+        decoded_token: dict = TokenService.validate_token_b2b(token=token, public_key=self.snap.merchant_public_key)
+        if decoded_token is None:
+            return False
+        expires_at = decoded_token.get("exp")
+        if isinstance(expires_at, (int, float)) and expires_at > now:
+            with self._lock:
+                self._valid_tokens[token] = expires_at
+                while len(self._valid_tokens) > self.token_cache_size:
+                    self._valid_tokens.popitem(last=False)
+        return True
+
+    @staticmethod
+    def parse_payment_notification(body: bytes) -> PaymentNotificationRequest:
+        payload = json.loads(body)
+        if not isinstance(payload, dict):
+            raise ValueError("notification body must be a JSON object")
+        return PaymentNotificationRequest(**{key: value for key, value in payload.items() if key in _PAYMENT_NOTIFICATION_FIELDS})
+
+    def process_token_request(self, headers) -> NotificationToken:
+        with Instrumentation.span("notification.token"):
+            return self.snap.generate_token_b2b(is_signature_valid=self.is_signature_valid(HeaderAdapter.normalize(headers)))
+
+    def process_payment_notification(self, headers, body: bytes) -> PaymentNotificationResponseBody:
+        with Instrumentation.span("notification.payment"):
+            headers = HeaderAdapter.normalize(headers)
+            is_token_valid: bool = self.is_token_valid(NotificationProcessor.get_bearer_token(headers.get("authorization")))
+            if not is_token_valid:
+                return PaymentNotificationResponseBody(
+                    responseCode="4012701",
+                    responseMessage="Invalid Token (B2B)"
+                )
+            request: PaymentNotificationRequest = NotificationProcessor.parse_payment_notification(body)
+            return self.snap.generate_notification_response(is_token_valid=is_token_valid, request=request)
+
+    def process_direct_debit_notification(self, headers, body: bytes = None) -> NotificationPaymentDirectDebitResponse:
+        with Instrumentation.span("notification.direct_debit"):
+            headers = HeaderAdapter.normalize(headers)
+            is_token_valid: bool = self.is_token_valid(NotificationProcessor.get_bearer_token(headers.get("authorization")))
+            return self.snap.generate_direct_debit_notification(is_token_b2b2c_valid=is_token_valid)
+
+    def handle_token_request(self, headers) -> tuple:
+        notification_token: NotificationToken = self.process_token_request(headers)
+        status_code: int = 200 if notification_token.body.response_code == "2007300" else 401
+        return status_code, notification_token.header.json(), JsonCodec.dumps(notification_token.body.json())
+
+    def handle_payment_notification(self, headers, body: bytes) -> tuple:
+        try:
+            response: PaymentNotificationResponseBody = self.process_payment_notification(headers, body)
+        except (ValueError, TypeError):
+            return 400, {}, JsonCodec.dumps({"responseCode": "4002500", "responseMessage": "Bad Request"})
+        if response is None:
+            return 500, {}, JsonCodec.dumps({"responseCode": "5002500", "responseMessage": "Internal Server Error"})
+        status_code: int = 200 if str(response.response_code).startswith("200") else 401
+        return status_code, {}, JsonCodec.dumps(response.json())
+
+    def handle_direct_debit_notification(self, headers, body: bytes) -> tuple:
+        response: NotificationPaymentDirectDebitResponse = self.process_direct_debit_notification(headers, body)
+        status_code: int = 200 if str(response.response_code).startswith("200") else 401
+        return status_code, {}, JsonCodec.dumps(response.json())
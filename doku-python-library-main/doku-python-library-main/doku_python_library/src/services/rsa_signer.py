@@ -0,0 +1,83 @@
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from doku_python_library.src.commons.instrumentation import Instrumentation
+from doku_python_library.src.services.token_service import TokenService
+import os
+
+class RsaSigner:
+
+    _worker_private_key = None
+
+    def __init__(self, private_key: str, max_workers: int = None, use_processes: bool = True, batch_size: int = 32) -> None:
+        if batch_size < 1:
+            raise Exception("batch_size must be at least 1.")
+        self.private_key = private_key
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.use_processes = use_processes
+        self.batch_size = batch_size
+        if use_processes:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=RsaSigner._init_worker,
+                initargs=(private_key,)
+            )
+        else:
+            TokenService.load_private_key(private_key)
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="doku-rsa")
+
+    @staticmethod
+    def _init_worker(private_key: str) -> None:
+        RsaSigner._worker_private_key = TokenService.load_private_key(private_key)
+
+    @staticmethod
+    def _sign_batch_in_worker(texts: list) -> list:
+        priv_key = RsaSigner._worker_private_key
+        return [TokenService.sign_with_key(priv_key, text) for text in texts]
+
+    def _sign_batch_in_thread(self, texts: list) -> list:
+        priv_key = TokenService.load_private_key(self.private_key)
+        return [TokenService.sign_with_key(priv_key, text) for text in texts]
+
+    def _submit_batch(self, texts: list) -> Future:
+        if self.use_processes:
+            return self.executor.submit(RsaSigner._sign_batch_in_worker, texts)
+        return self.executor.submit(self._sign_batch_in_thread, texts)
+
+    def submit(self, text: str) -> Future:
+        future: Future = Future()
+        batch: Future = self._submit_batch([text])
+
+        def done(batch_future: Future) -> None:
+            error = batch_future.exception()
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(batch_future.result()[0])
+        batch.add_done_callback(done)
+        return future
+
+    def sign(self, text: str) -> str:
+        with Instrumentation.span("signature.rsa"):
+            return self._submit_batch([text]).result()[0]
+
+    def sign_many(self, texts) -> list:
+        texts = list(texts)
+        if not texts:
+            return []
+        with Instrumentation.span("signature.rsa.batch", count=len(texts)):
+            batch_size: int = min(self.batch_size, max(1, -(-len(texts) // self.max_workers)))
+            futures: list = [self._submit_batch(texts[start:start + batch_size]) for start in range(0, len(texts), batch_size)]
+            signatures: list = []
+            for future in futures:
+                signatures.extend(future.result())
+            return signatures
+
+    def with_private_key(self, private_key: str) -> 'RsaSigner':
+        return RsaSigner(
+            private_key=private_key,
+            max_workers=self.max_workers,
+            use_processes=self.use_processes,
+            batch_size=self.batch_size
+        )
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,78 @@
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.backends import default_backend
+from cryptography.exceptions import InvalidSignature
+import base64
+import hashlib
+import threading
+
+class SignatureVerifier:
+
+    _verifiers: dict = {}
+    _verifiers_lock = threading.Lock()
+
+    def __init__(self, public_key: str) -> None:
+        self.fingerprint = SignatureVerifier.get_key_fingerprint(public_key)
+        self.public_key = SignatureVerifier.parse_public_key(public_key)
+
+    @staticmethod
+    def get_key_fingerprint(public_key: str) -> str:
+        return hashlib.sha256(public_key.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def parse_public_key(public_key: str):
+        try:
+            return serialization.load_pem_public_key(public_key.encode('utf-8'), backend=default_backend())
+        except ValueError:
+            string_public_key = public_key.replace("-----BEGIN PUBLIC KEY-----", "")
+            string_public_key = string_public_key.replace("-----END PUBLIC KEY-----", "")
+            string_public_key = string_public_key.replace("\n", "")
+
+            missing_padding = len(string_public_key) % 4
+            if missing_padding:
+                string_public_key += '=' * (4 - missing_padding)
+
+            return serialization.load_der_public_key(
+                base64.b64decode(string_public_key),
+                backend=default_backend()
+            )
+
+    @staticmethod
+    def for_key(public_key: str) -> 'SignatureVerifier':
+        fingerprint: str = SignatureVerifier.get_key_fingerprint(public_key)
+        verifier: SignatureVerifier = SignatureVerifier._verifiers.get(fingerprint)
+        if verifier is None:
+            with SignatureVerifier._verifiers_lock:
+                verifier = SignatureVerifier._verifiers.get(fingerprint)
+                if verifier is None:
+                    verifier = SignatureVerifier(public_key)
+                    SignatureVerifier._verifiers[fingerprint] = verifier
+        return verifier
+
+    @staticmethod
+    def invalidate(public_key: str = None) -> None:
+        with SignatureVerifier._verifiers_lock:
+            if public_key is None:
+                SignatureVerifier._verifiers.clear()
+            else:
+                SignatureVerifier._verifiers.pop(SignatureVerifier.get_key_fingerprint(public_key), None)
+
+    def verify_signature(self, string_to_sign: str, signature: str) -> None:
+        self.public_key.verify(
+            base64.b64decode(signature),
+            string_to_sign.encode("utf-8"),
+            padding.PKCS1v15(),
+            hashes.SHA256()
+        )
+
+    def is_valid(self, string_to_sign: str, signature: str) -> bool:
+        try:
+            self.verify_signature(string_to_sign=string_to_sign, signature=signature)
+            return True
+        except (InvalidSignature, ValueError, TypeError):
+            return False
+
+    def decode_token(self, token: str) -> dict:
+        import jwt
+        return jwt.decode(token, self.public_key, algorithms=["RS256"])
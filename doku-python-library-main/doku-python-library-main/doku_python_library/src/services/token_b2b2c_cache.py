@@ -0,0 +1,95 @@
+from collections import OrderedDict
+from doku_python_library.src.model.token.token_b2b2c_response import TokenB2B2CResponse
+from doku_python_library.src.services.token_service import TokenService
+from doku_python_library.src.commons.instrumentation import Instrumentation
+import threading
+import time
+
+class TokenB2B2CCache:
+
+    def __init__(self, max_size: int = 10000, fetch_lock_count: int = 64) -> None:
+        if max_size < 1:
+            raise Exception("max_size must be at least 1.")
+        self.max_size = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._fetch_locks: list = [threading.Lock() for _ in range(fetch_lock_count)]
+
+    def get(self, key: str) -> TokenB2B2CResponse:
+        with Instrumentation.span("token_b2b2c.lookup") as span:
+            token_b2b2c_response: TokenB2B2CResponse = self._get(key)
+            if span is not None:
+                span.set_attribute("hit", token_b2b2c_response is not None)
+            return token_b2b2c_response
+
+    def _get(self, key: str) -> TokenB2B2CResponse:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            token_b2b2c_response, token_deadline, token_lifetime = entry
+            if TokenService.is_deadline_passed(token_deadline):
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return token_b2b2c_response
+
+    def put(self, key: str, token_b2b2c_response: TokenB2B2CResponse, token_deadline: float) -> None:
+        with self._lock:
+            self._entries[key] = (token_b2b2c_response, token_deadline, max(token_deadline - time.monotonic(), 0.0))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_fetch(self, key: str, fetch) -> TokenB2B2CResponse:
+        token_b2b2c_response: TokenB2B2CResponse = self.get(key)
+        if token_b2b2c_response is not None:
+            return token_b2b2c_response
+        with self._fetch_locks[hash(key) % len(self._fetch_locks)]:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and not TokenService.is_deadline_passed(entry[1]):
+                    return entry[0]
+            return fetch()
+
+    def due_for_refresh(self, refresh_ratio: float) -> tuple:
+        now: float = time.monotonic()
+        due: list = []
+        next_due_in: float = None
+        with self._lock:
+            for key, (token_b2b2c_response, token_deadline, token_lifetime) in self._entries.items():
+                if token_deadline <= now:
+                    continue
+                due_in: float = token_deadline - token_lifetime * (1 - refresh_ratio) - now
+                if due_in <= 0:
+                    due.append(key)
+                elif next_due_in is None or due_in < next_due_in:
+                    next_due_in = due_in
+        return due, next_due_in
+
+    def invalidate(self, key: str = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxSize": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
@@ -0,0 +1,98 @@
+from doku_python_library.src.model.token.token_b2b_response import TokenB2BResponse
+from doku_python_library.src.services.token_service import TokenService
+from doku_python_library.src.services.token_store import TokenStore
+from doku_python_library.src.commons.instrumentation import Instrumentation
+import threading
+import time
+
+class TokenManager:
+
+    def __init__(self, fetch_token, token_store: TokenStore = None, store_key: str = None) -> None:
+        self.fetch_token = fetch_token
+        self.token_store = token_store
+        self.store_key = store_key
+        self.token_b2b: TokenB2BResponse = None
+        self.token: str = None
+        self.token_expires_in: int = None
+        self.token_generate_timestamp: str = None
+        self.token_deadline: float = None
+        self.refresh_count: int = 0
+        self._refresh_lock = threading.Lock()
+
+    def set_token(self, token_b2b_response: TokenB2BResponse, token_expires_in: float = None) -> None:
+        self.token_b2b = token_b2b_response
+        self.token_expires_in = token_b2b_response.expires_in
+        self.token_generate_timestamp = token_b2b_response.generated_timestamp
+        self.token_deadline = TokenService.get_token_deadline(
+            token_b2b_response.expires_in if token_expires_in is None else token_expires_in
+        )
+        self.token = token_b2b_response.access_token
+
+    def is_token_invalid(self) -> bool:
+        return TokenService.is_token_empty(self.token) or TokenService.is_deadline_passed(self.token_deadline)
+
+    def get_token(self) -> str:
+        with Instrumentation.span("token.check") as span:
+            hit: bool = not self.is_token_invalid()
+            if span is not None:
+                span.set_attribute("hit", hit)
+            if not hit:
+                with self._refresh_lock:
+                    if self.is_token_invalid():
+                        if self.token_store is None:
+                            self._refresh()
+                        elif not self._load_from_store():
+                            with self.token_store.lock(self.store_key):
+                                if not self._load_from_store():
+                                    self._refresh()
+        return self.token
+
+    def refresh(self) -> TokenB2BResponse:
+        with self._refresh_lock:
+            if self.token_store is None:
+                return self._refresh()
+            with self.token_store.lock(self.store_key):
+                return self._refresh()
+
+    def refresh_if_stale(self) -> TokenB2BResponse:
+        with self._refresh_lock:
+            if self.token_store is None:
+                return self._refresh()
+            stale_token: str = self.token
+            stale_deadline: float = self.token_deadline
+            with self.token_store.lock(self.store_key):
+                if self._load_from_store() and self.token != stale_token and (
+                        stale_deadline is None or self.token_deadline > stale_deadline):
+                    return self.token_b2b
+                return self._refresh()
+
+    def _refresh(self) -> TokenB2BResponse:
+        with Instrumentation.span("token.refresh", token_type="b2b"):
+            token_b2b_response: TokenB2BResponse = self.fetch_token()
+        self.refresh_count += 1
+        if token_b2b_response is not None and token_b2b_response.response_code == "2007300":
+            self.set_token(token_b2b_response)
+            if self.token_store is not None and not self.is_token_invalid():
+                self._save_to_store(token_b2b_response)
+        return token_b2b_response
+
+    def _load_from_store(self) -> bool:
+        value: dict = self.token_store.get(self.store_key)
+        if value is None:
+            return False
+        token_expires_in: float = value["expiresAt"] - time.time()
+        if token_expires_in <= 0:
+            return False
+        token_b2b_response: TokenB2BResponse = TokenB2BResponse(
+            **{name: field for name, field in value.items() if name not in ("expiresAt", "generatedTimestamp")}
+        )
+        token_b2b_response.generated_timestamp = value.get("generatedTimestamp")
+        self.set_token(token_b2b_response, token_expires_in=token_expires_in)
+        return True
+
+    def _save_to_store(self, token_b2b_response: TokenB2BResponse) -> None:
+        token_expires_in: float = self.token_deadline - time.monotonic()
+        value: dict = token_b2b_response.json()
+        value["generatedTimestamp"] = token_b2b_response.generated_timestamp
+        value["expiresAt"] = time.time() + token_expires_in
+        self.token_store.set(self.store_key, value, token_expires_in)
@@ -0,0 +1,124 @@
+import threading
+import time
+
+class _RefreshJob:
+
+    def __init__(self, name: str, refresh, expires_in: float, refresh_ratio: float) -> None:
+        self.name = name
+        self.refresh = refresh
+        self.refresh_count: int = 0
+        self.failure_count: int = 0
+        self.last_refresh_lag: float = None
+        self.max_refresh_lag: float = 0.0
+        self.last_refresh_duration: float = None
+        self.remaining_ttl_at_refresh: float = None
+        self.refresh_ratio = refresh_ratio
+        self.schedule(expires_in)
+
+    def schedule(self, expires_in: float) -> None:
+        now: float = time.monotonic()
+        self.expires_at = now + expires_in
+        self.due_at = now + expires_in * self.refresh_ratio
+
+    def json(self) -> dict:
+        return {
+            "refreshCount": self.refresh_count,
+            "failureCount": self.failure_count,
+            "lastRefreshLag": self.last_refresh_lag,
+            "maxRefreshLag": self.max_refresh_lag,
+            "lastRefreshDuration": self.last_refresh_duration,
+            "remainingTtlAtRefresh": self.remaining_ttl_at_refresh,
+            "nextRefreshIn": max(self.due_at - time.monotonic(), 0.0)
+        }
+
+class TokenRefresher:
+
+    def __init__(self, refresh_ratio: float = 0.8, retry_interval: float = 5.0) -> None:
+        if not 0 < refresh_ratio < 1:
+            raise Exception("refresh_ratio must be between 0 and 1.")
+        self.refresh_ratio = refresh_ratio
+        self.retry_interval = retry_interval
+        self._jobs: dict = {}
+        self._condition = threading.Condition()
+        self._stopped: bool = True
+        self._thread: threading.Thread = None
+
+    def register(self, name: str, refresh, expires_in: float, refresh_ratio: float = None) -> None:
+        if refresh_ratio is None:
+            refresh_ratio = self.refresh_ratio
+        elif not 0 < refresh_ratio <= 1:
+            raise Exception("refresh_ratio must be greater than 0 and at most 1.")
+        with self._condition:
+            job: _RefreshJob = self._jobs.get(name)
+            if job is None:
+                self._jobs[name] = _RefreshJob(name, refresh, expires_in, refresh_ratio)
+            else:
+                job.refresh = refresh
+                job.refresh_ratio = refresh_ratio
+                job.schedule(expires_in)
+            self._condition.notify()
+
+    def unregister(self, name: str) -> None:
+        with self._condition:
+            self._jobs.pop(name, None)
+            self._condition.notify()
+
+    def start(self) -> None:
+        with self._condition:
+            if not self._stopped:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="doku-token-refresher", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        return not self._stopped
+
+    def metrics(self) -> dict:
+        with self._condition:
+            return {name: job.json() for name, job in self._jobs.items()}
+
+    def _next_due_job(self) -> _RefreshJob:
+        if not self._jobs:
+            return None
+        return min(self._jobs.values(), key=lambda job: job.due_at)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    job: _RefreshJob = self._next_due_job()
+                    wait: float = None if job is None else job.due_at - time.monotonic()
+                    if wait is not None and wait <= 0:
+                        break
+                    self._condition.wait(wait)
+                if self._stopped:
+                    return
+            self._refresh_job(job)
+
+    def _refresh_job(self, job: _RefreshJob) -> None:
+        started_at: float = time.monotonic()
+        job.last_refresh_lag = started_at - job.due_at
+        job.max_refresh_lag = max(job.max_refresh_lag, job.last_refresh_lag)
+        job.remaining_ttl_at_refresh = job.expires_at - started_at
+        try:
+            expires_in = job.refresh()
+        except Exception as e:
+            print("Failed Refresh Token "+str(e))
+            expires_in = None
+        job.last_refresh_duration = time.monotonic() - started_at
+        with self._condition:
+            if expires_in is None:
+                job.failure_count += 1
+                job.due_at = time.monotonic() + self.retry_interval
+            else:
+                job.refresh_count += 1
+                job.schedule(expires_in)
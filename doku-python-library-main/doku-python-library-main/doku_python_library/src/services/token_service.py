@@ -8,21 +8,29 @@ import base64
 from doku_python_library.src.model.token.token_b2b_response import TokenB2BResponse
 from doku_python_library.src.model.token.token_b2b_request import TokenB2BRequest
 from doku_python_library.src.commons.config import Config
+from doku_python_library.src.commons.http_client import HttpClient
+from doku_python_library.src.commons.instrumentation import Instrumentation
+from doku_python_library.src.commons.json_codec import JsonCodec
+from doku_python_library.src.commons.header_adapter import HeaderAdapter
 from datetime import datetime
 import hmac, requests
 import hashlib
-import jwt
-from jwt.exceptions import InvalidTokenError
 import time
 from doku_python_library.src.model.notification.notification_token import NotificationToken
 from doku_python_library.src.model.notification.notification_token_header import NotificationTokenHeader
 from doku_python_library.src.model.notification.notification_token_body import NotificationTokenBody
 from doku_python_library.src.model.token.token_b2b2c_request import TokenB2B2CRequest
 from doku_python_library.src.model.token.token_b2b2c_response import TokenB2B2CResponse
+from doku_python_library.src.services.signature_verifier import SignatureVerifier
+from doku_python_library.src.services.hmac_signer import HmacSigner
 import json
+import threading
 
 class TokenService:
 
+    _private_key_cache: dict = {}
+    _private_key_cache_lock = threading.Lock()
+
     @staticmethod
     def get_timestamp() -> str:
         now = datetime.now()
@@ -31,12 +39,40 @@ class TokenService:
         date_string = utc_time_now.strftime('%Y-%m-%dT%H:%M:%SZ')
         return date_string
     
+    @staticmethod
+    def get_key_fingerprint(key: str) -> str:
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def load_private_key(private_key: str):
+        fingerprint: str = TokenService.get_key_fingerprint(private_key)
+        priv_key = TokenService._private_key_cache.get(fingerprint)
+        if priv_key is None:
+            with TokenService._private_key_cache_lock:
+                priv_key = TokenService._private_key_cache.get(fingerprint)
+                if priv_key is None:
+                    priv_key = serialization.load_pem_private_key(
+                        private_key.encode('utf-8'),
+                        password=None,
+                    )
+                    TokenService._private_key_cache[fingerprint] = priv_key
+        return priv_key
+
+    @staticmethod
+    def invalidate_private_key(private_key: str = None) -> None:
+        with TokenService._private_key_cache_lock:
+            if private_key is None:
+                TokenService._private_key_cache.clear()
+            else:
+                TokenService._private_key_cache.pop(TokenService.get_key_fingerprint(private_key), None)
+
     @staticmethod
     def create_signature(private_key: str, text: str) -> str:
-        priv_key = serialization.load_pem_private_key(
-            private_key.encode('utf-8'),
-            password=None,
-        )
+        with Instrumentation.span("signature.rsa"):
+            return TokenService.sign_with_key(TokenService.load_private_key(private_key), text)
+
+    @staticmethod
+    def sign_with_key(priv_key, text: str) -> str:
         signature = priv_key.sign(
             text.encode('utf-8'),
             padding=padding.PKCS1v15(),
@@ -48,15 +84,21 @@ class TokenService:
     @staticmethod
     def generate_symmetric_signature(http_method: str, endpoint: str, token_b2b: str, 
                                      request: dict, timestamp: str, secret_key: str):
-        request_body_minify = json.dumps(request, separators=(',', ':'))
-        hash_object = hashlib.sha256()
-        hash_object.update(request_body_minify.encode('utf-8'))
-        data_hex = hash_object.hexdigest()
-        data_hex_lower = data_hex.lower()
-        
-        string_to_sign = "{method}:{url}:{token}:{request_body}:{timestamp}".format(method=http_method, url=endpoint, token=token_b2b, request_body=data_hex_lower, timestamp=timestamp)
-        return base64.b64encode(hmac.new(secret_key.encode("utf-8"), msg=string_to_sign.encode("utf-8"), digestmod=hashlib.sha512).digest()).decode()      
-    
+        return TokenService.generate_body_signature(
+            http_method=http_method,
+            endpoint=endpoint,
+            token_b2b=token_b2b,
+            body=JsonCodec.dumps(request),
+            timestamp=timestamp,
+            secret_key=secret_key
+        )
+
+    @staticmethod
+    def generate_body_signature(http_method: str, endpoint: str, token_b2b: str,
+                                body: bytes, timestamp: str, secret_key: str) -> str:
+        with Instrumentation.span("signature.hmac", endpoint=endpoint):
+            return HmacSigner.for_endpoint(secret_key, http_method, endpoint).sign(token_b2b, body, timestamp)
+
     @staticmethod
     def create_token_b2b_request(signature: str, timestamp: str, client_id: str) -> TokenB2BRequest:
         token_b2b_request: TokenB2BRequest = TokenB2BRequest(
@@ -67,11 +109,12 @@ class TokenService:
         return token_b2b_request
 
     @staticmethod
-    def create_token_b2b(token_b2b_request: TokenB2BRequest, is_production: bool, headers: dict) -> TokenB2BResponse:
+    def create_token_b2b(token_b2b_request: TokenB2BRequest, is_production: bool, headers: dict, http_client: HttpClient = None) -> TokenB2BResponse:
         url: str = Config.get_base_url(is_production=is_production) + Config.ACCESS_TOKEN
-        response = requests.post(url=url, json=token_b2b_request.create_request_body(), headers=headers)
-        response_json = response.json()
-        token_response: TokenB2BResponse = TokenB2BResponse(**response_json)
+        response = HttpClient.resolve(http_client).post(url=url, json=token_b2b_request.create_request_body(), headers=headers)
+        with Instrumentation.span("response.parse"):
+            response_json = response.json()
+            token_response: TokenB2BResponse = TokenB2BResponse(**response_json)
         if(token_response.response_code == "2007300"):
             token_response.generated_timestamp = token_b2b_request.timestamp
             token_response.expires_in = token_response.expires_in - 10
@@ -81,17 +124,35 @@ class TokenService:
     def is_token_expired(token_expires_in: int, token_generated_timestamp: str) -> bool:
         generated_time = datetime.strptime(token_generated_timestamp, "%Y-%m-%dT%H:%M:%SZ")
         expired_date = generated_time + timedelta(seconds= token_expires_in if not isinstance(token_expires_in, str) else 890)
-        date_now = datetime.strptime(TokenService.get_timestamp(), "%Y-%m-%dT%H:%M:%SZ")
-        return expired_date > date_now
-    
+        return expired_date <= datetime.now(pytz.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def get_token_deadline(token_expires_in: int) -> float:
+        if token_expires_in is None:
+            return time.monotonic()
+        return time.monotonic() + (token_expires_in if not isinstance(token_expires_in, str) else 890)
+
+    @staticmethod
+    def is_deadline_passed(token_deadline: float) -> bool:
+        return token_deadline is None or time.monotonic() >= token_deadline
+
+    @staticmethod
+    def get_token_b2b2c_expires_in(access_token_expiry_time: str) -> int:
+        try:
+            expiry_time = datetime.fromisoformat(access_token_expiry_time.replace("Z", "+00:00"))
+            return int((expiry_time - datetime.now(pytz.utc)).total_seconds())
+        except Exception:
+            return 890
+
     @staticmethod
     def is_token_empty(token: str) -> bool:
         return token is None
     
     @staticmethod
     def validate_token_b2b(token: str, public_key: str) -> dict:
+        from jwt.exceptions import InvalidTokenError
         try:
-            decoded_token = jwt.decode(token, public_key, algorithms=["RS256"])
+            decoded_token = SignatureVerifier.for_key(public_key).decode_token(token)
             return decoded_token
         except InvalidTokenError as e:
             return None
@@ -104,7 +165,8 @@ class TokenService:
             "issuer": issuer,
             "clientId": client_id
         }
-        token = jwt.encode(payload= payload, key=private_key, algorithm='RS256')
+        import jwt
+        token = jwt.encode(payload= payload, key=TokenService.load_private_key(private_key), algorithm='RS256')
         return token.decode('utf-8') if not isinstance(token, str) else token
     
     @staticmethod
@@ -129,33 +191,44 @@ class TokenService:
     @staticmethod
     def compare_signatures(string_to_sign, signature, string_public_key):
         try:
-            string_public_key = string_public_key.replace("-----BEGIN PUBLIC KEY-----", "")
-            string_public_key = string_public_key.replace("-----END PUBLIC KEY-----", "")
-            string_public_key = string_public_key.replace("\n", "")
-            
-            missing_padding = len(string_public_key) % 4
-            if missing_padding:
-                string_public_key += '=' * (4 - missing_padding)
-            
-            decoded_public_key = base64.b64decode(string_public_key)
-            public_key = serialization.load_der_public_key(
-                decoded_public_key,
-                backend=default_backend()
-            )
-            decoded_signature = base64.b64decode(signature)
-            
-            public_key.verify(
-                decoded_signature,  
-                string_to_sign.encode("utf-8"),  
-                padding.PKCS1v15(),  
-                hashes.SHA256()  
+            SignatureVerifier.for_key(string_public_key).verify_signature(
+                string_to_sign=string_to_sign,
+                signature=signature
             )
-            
             return True
         except Exception as e:
             print(f"Error verifying signature: {str(e)}")
             return False
     
+    @staticmethod
+    def verify_notification_signature(headers, client_id: str, public_key: str) -> bool:
+        headers = HeaderAdapter.normalize(headers)
+        timestamp: str = headers.get("x-timestamp")
+        signature: str = headers.get("x-signature")
+        if not timestamp or not signature:
+            return False
+        return SignatureVerifier.for_key(public_key).is_valid(
+            string_to_sign="{client_id}|{timestamp}".format(client_id=client_id, timestamp=timestamp),
+            signature=signature
+        )
+
+    @staticmethod
+    def verify_notification_signatures(headers_list, client_id: str, public_key: str) -> list:
+        is_valid = SignatureVerifier.for_key(public_key).is_valid
+        prefix: str = "{client_id}|".format(client_id=client_id)
+        normalize = HeaderAdapter.normalize
+        verified: dict = {}
+        results: list = []
+        for headers in headers_list:
+            headers = normalize(headers)
+            key: tuple = (headers.get("x-timestamp"), headers.get("x-signature"))
+            result: bool = verified.get(key)
+            if result is None:
+                result = bool(key[0] and key[1]) and is_valid(prefix + key[0], key[1])
+                verified[key] = result
+            results.append(result)
+        return results
+
     @staticmethod
     def generate_invalid_signature(timestamp: str) -> NotificationToken:
         header: NotificationTokenHeader = NotificationTokenHeader(
@@ -179,7 +252,7 @@ class TokenService:
         )
 
     @staticmethod
-    def create_token_b2b2c(request: TokenB2B2CRequest, timestamp: str, signature: str, client_id: str, is_production: bool) -> TokenB2B2CResponse:
+    def create_token_b2b2c(request: TokenB2B2CRequest, timestamp: str, signature: str, client_id: str, is_production: bool, http_client: HttpClient = None) -> TokenB2B2CResponse:
         url: str = Config.get_base_url(is_production=is_production) + Config.ACCESS_TOKEN_B2B2C
         headers: dict = {
             "content-type": "application/json",
@@ -187,9 +260,10 @@ class TokenService:
             "X-TIMESTAMP": timestamp,
             "X-CLIENT-KEY": client_id
         }
-        response = requests.post(url=url, json=request.create_request_body(), headers=headers)
-        response_json = response.json()
-        token_response: TokenB2B2CResponse = TokenB2B2CResponse(**response_json)
+        response = HttpClient.resolve(http_client).post(url=url, json=request.create_request_body(), headers=headers)
+        with Instrumentation.span("response.parse"):
+            response_json = response.json()
+            token_response: TokenB2B2CResponse = TokenB2B2CResponse(**response_json)
         if token_response.response_code.startswith("200"):
             token_response.generated_timestamp = timestamp
             token_response.access_token_expiry_time = token_response.access_token_expiry_time
@@ -0,0 +1,155 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import json
+import os
+import threading
+import time
+import uuid
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+class TokenStore(ABC):
+
+    @abstractmethod
+    def get(self, key: str) -> dict:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: dict, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def lock(self, key: str):
+        pass
+
+class InMemoryTokenStore(TokenStore):
+
+    def __init__(self) -> None:
+        self._values: dict = {}
+        self._values_lock = threading.Lock()
+        self._locks: dict = {}
+
+    def get(self, key: str) -> dict:
+        with self._values_lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._values[key]
+                return None
+            return dict(value)
+
+    def set(self, key: str, value: dict, ttl: float) -> None:
+        with self._values_lock:
+            self._values[key] = (dict(value), time.time() + ttl)
+
+    def delete(self, key: str) -> None:
+        with self._values_lock:
+            self._values.pop(key, None)
+
+    @contextmanager
+    def lock(self, key: str):
+        with self._values_lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            yield
+
+class FileTokenStore(TokenStore):
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key.replace(":", "_") + suffix)
+
+    def get(self, key: str) -> dict:
+        try:
+            with open(self._path(key, ".json"), "r") as f:
+                entry: dict = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("expiresAt", 0) <= time.time():
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: dict, ttl: float) -> None:
+        path: str = self._path(key, ".json")
+        tmp_path: str = "{path}.{pid}.tmp".format(path=path, pid=os.getpid())
+        with open(tmp_path, "w") as f:
+            json.dump({"value": value, "expiresAt": time.time() + ttl}, f)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key, ".json"))
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def lock(self, key: str):
+        with open(self._path(key, ".lock"), "a+") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+class RedisTokenStore(TokenStore):
+
+    _RELEASE_LOCK_SCRIPT = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
+
+    def __init__(self, client, prefix: str = "", lock_ttl: float = 30, lock_timeout: float = 30, poll_interval: float = 0.05) -> None:
+        self.client = client
+        self.prefix = prefix
+        self.lock_ttl = lock_ttl
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+
+    def get(self, key: str) -> dict:
+        value = self.client.get(self.prefix + key)
+        if value is None:
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: dict, ttl: float) -> None:
+        self.client.set(self.prefix + key, json.dumps(value), px=max(int(ttl * 1000), 1))
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    @contextmanager
+    def lock(self, key: str):
+        lock_key: str = self.prefix + key + ":lock"
+        lock_token: str = uuid.uuid4().hex
+        deadline: float = time.monotonic() + self.lock_timeout
+        while not self.client.set(lock_key, lock_token, nx=True, px=int(self.lock_ttl * 1000)):
+            if time.monotonic() >= deadline:
+                raise Exception("Timed out waiting for token lock " + lock_key)
+            time.sleep(self.poll_interval)
+        try:
+            yield
+        finally:
+            try:
+                self.client.eval(RedisTokenStore._RELEASE_LOCK_SCRIPT, 1, lock_key, lock_token)
+            except Exception:
+                current = self.client.get(lock_key)
+                if current is not None and (current.decode() if isinstance(current, bytes) else current) == lock_token:
+                    self.client.delete(lock_key)
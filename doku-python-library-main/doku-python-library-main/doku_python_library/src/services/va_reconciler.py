@@ -0,0 +1,116 @@
+from doku_python_library.src.model.va.check_status_va_request import CheckStatusRequest
+from doku_python_library.src.model.va.check_status_va_response import CheckStatusVAResponse
+from doku_python_library.src.services.bulk_executor import BulkExecutor
+import csv
+import json
+import os
+
+class VaReconciler:
+
+    def __init__(self, snap, concurrency: int = 10, rate_limit: float = None, checkpoint_path: str = None,
+                 checkpoint_interval: int = 1000) -> None:
+        self.snap = snap
+        self.concurrency = concurrency
+        self.rate_limit = rate_limit
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+
+    @staticmethod
+    def read_rows(input_path: str, input_format: str = None):
+        if input_format is None:
+            input_format = "csv" if input_path.lower().endswith(".csv") else "jsonl"
+        with open(input_path, "r", newline="" if input_format == "csv" else None) as f:
+            if input_format == "csv":
+                for row in csv.DictReader(f):
+                    yield row
+            elif input_format == "jsonl":
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                raise Exception("input_format must be either 'csv' or 'jsonl'.")
+
+    @staticmethod
+    def to_check_status_request(row: dict) -> CheckStatusRequest:
+        return CheckStatusRequest(
+            partner_service_id=row.get("partnerServiceId"),
+            customer_no=row.get("customerNo"),
+            virtual_acc_no=row.get("virtualAccountNo"),
+            virtual_acc_name=row.get("virtualAccountName") or None,
+            inquiry_request_id=row.get("inquiryRequestId") or None,
+            payment_request_id=row.get("paymentRequestId") or None
+        )
+
+    def load_checkpoint(self) -> dict:
+        if self.checkpoint_path is None:
+            return None
+        try:
+            with open(self.checkpoint_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save_checkpoint(self, completed: int, done: set, output_offset: int) -> None:
+        tmp_path: str = "{path}.{pid}.tmp".format(path=self.checkpoint_path, pid=os.getpid())
+        with open(tmp_path, "w") as f:
+            json.dump({"completed": completed, "done": sorted(done), "outputOffset": output_offset}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _check_status(self, item: tuple) -> CheckStatusVAResponse:
+        index, check_status_request = item
+        return self.snap.check_status_va(check_status_request)
+
+    def run(self, input_path: str, output_path: str, input_format: str = None) -> dict:
+        checkpoint: dict = self.load_checkpoint() or {}
+        completed: int = checkpoint.get("completed", 0)
+        done: set = set(checkpoint.get("done", []))
+        skipped: int = completed + len(done)
+        processed: int = 0
+        failed: int = 0
+        if os.path.exists(output_path):
+            os.truncate(output_path, checkpoint.get("outputOffset", 0))
+
+        def pending_items():
+            for index, row in enumerate(VaReconciler.read_rows(input_path, input_format)):
+                if index >= completed and index not in done:
+                    yield index, VaReconciler.to_check_status_request(row)
+
+        with open(output_path, "ab") as output:
+            results = BulkExecutor.stream(
+                items=pending_items(),
+                task=self._check_status,
+                concurrency=self.concurrency,
+                rate_limit=self.rate_limit,
+                thread_name_prefix="doku-reconcile"
+            )
+            for (index, check_status_request), check_status_response in results:
+                if check_status_response is None:
+                    check_status_response = CheckStatusVAResponse(
+                        responseCode="5002600",
+                        responseMessage="Empty response"
+                    )
+                record: dict = {
+                    "index": index,
+                    "partnerServiceId": check_status_request.partner_service_id,
+                    "customerNo": check_status_request.customer_no,
+                    "virtualAccountNo": check_status_request.virtual_acc_no
+                }
+                record.update(check_status_response.json())
+                output.write(json.dumps(record, default=str).encode("utf-8") + b"\n")
+                processed += 1
+                if not str(check_status_response.response_code).startswith("2"):
+                    failed += 1
+                done.add(index)
+                while completed in done:
+                    done.remove(completed)
+                    completed += 1
+                if self.checkpoint_path is not None and processed % self.checkpoint_interval == 0:
+                    output.flush()
+                    self.save_checkpoint(completed, done, output.tell())
+        if self.checkpoint_path is not None and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        return {
+            "processed": processed,
+            "skipped": skipped,
+            "failed": failed
+        }
@@ -1,8 +1,11 @@
 from doku_python_library.src.model.va.create_va_request import CreateVARequest
 from doku_python_library.src.model.va.create_va_response import CreateVAResponse
 from doku_python_library.src.services.token_service import TokenService
-import requests, uuid, json, xmltodict
+import requests, uuid, json
 from doku_python_library.src.commons.config import Config
+from doku_python_library.src.commons.http_client import HttpClient
+from doku_python_library.src.commons.instrumentation import Instrumentation
+from doku_python_library.src.commons.json_codec import JsonCodec
 from doku_python_library.src.model.general.request_header import RequestHeader
 from doku_python_library.src.model.va.update_va_request import UpdateVaRequest
 from doku_python_library.src.model.va.update_va_response import UpdateVAResponse
@@ -38,57 +41,69 @@ class VaService:
         return header
 
     @staticmethod
-    def creat_va(create_va_request: CreateVARequest, request_header: RequestHeader, is_production: bool) -> CreateVAResponse:
+    def creat_va(create_va_request: CreateVARequest, request_header: RequestHeader, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> CreateVAResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.CREATE_VA
 
             headers: RequestHeader = request_header.to_json()
 
-            response = requests.post(url=url, json=create_va_request.create_request_body(), headers=headers)
-            response_json = response.json()
-            va_response: CreateVAResponse = CreateVAResponse(**response_json) 
+            if body is None:
+                body = JsonCodec.dumps(create_va_request.create_request_body())
+            response = HttpClient.resolve(http_client).post(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                va_response: CreateVAResponse = CreateVAResponse(**response_json) 
             return va_response
         except Exception as e:
             print("Failed Parse Response "+str(e))
     
     @staticmethod
-    def do_update_va(request_header: RequestHeader, update_va_request: UpdateVaRequest, is_production: bool) -> UpdateVAResponse:
+    def do_update_va(request_header: RequestHeader, update_va_request: UpdateVaRequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> UpdateVAResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.UPDATE_VA
 
             headers: RequestHeader = request_header.to_json()
 
-            response = requests.put(url=url, json=update_va_request.create_request_body(), headers=headers)
-            response_json = response.json()
-            va_response: UpdateVAResponse = UpdateVAResponse(**response_json) 
+            if body is None:
+                body = JsonCodec.dumps(update_va_request.create_request_body())
+            response = HttpClient.resolve(http_client).put(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                va_response: UpdateVAResponse = UpdateVAResponse(**response_json) 
             return va_response
         except Exception as e:
             print("Failed Parse Response "+str(e))
     
     @staticmethod
-    def do_check_status_va(request_header: RequestHeader, check_status_request: CheckStatusRequest, is_production: bool) -> CheckStatusVAResponse:
+    def do_check_status_va(request_header: RequestHeader, check_status_request: CheckStatusRequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> CheckStatusVAResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.CHECK_STATUS_VA
 
             headers: RequestHeader = request_header.to_json()
 
-            response = requests.post(url=url, json=check_status_request.create_request_body(), headers=headers)
-            response_json = response.json()
-            va_response: CheckStatusVAResponse = CheckStatusVAResponse(**response_json) 
+            if body is None:
+                body = JsonCodec.dumps(check_status_request.create_request_body())
+            response = HttpClient.resolve(http_client).post(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                va_response: CheckStatusVAResponse = CheckStatusVAResponse(**response_json) 
             return va_response
         except Exception as e:
             print("Failed Parse Response "+str(e))
 
     @staticmethod
-    def do_delete_payment_code(request_header: RequestHeader, delete_va_request: DeleteVARequest, is_production: bool) -> DeleteVAResponse:
+    def do_delete_payment_code(request_header: RequestHeader, delete_va_request: DeleteVARequest, is_production: bool, http_client: HttpClient = None, body: bytes = None) -> DeleteVAResponse:
         try:
             url: str = Config.get_base_url(is_production=is_production) + Config.DELETE_VA
 
             headers: RequestHeader = request_header.to_json()
 
-            response = requests.delete(url=url, json=delete_va_request.create_request_body(), headers=headers)
-            response_json = response.json()
-            delete_va_response: DeleteVAResponse = DeleteVAResponse(**response_json) 
+            if body is None:
+                body = JsonCodec.dumps(delete_va_request.create_request_body())
+            response = HttpClient.resolve(http_client).delete(url=url, data=body, headers=headers)
+            with Instrumentation.span("response.parse"):
+                response_json = response.json()
+                delete_va_response: DeleteVAResponse = DeleteVAResponse(**response_json) 
             return delete_va_response
         except Exception as e:
             print("Failed Parse Response "+str(e))
@@ -137,6 +152,7 @@ class VaService:
     
     @staticmethod
     def direct_inquiry_response_mapping(v1_data: str) -> InquiryResponseBody:
+        import xmltodict
         dict_response = xmltodict.parse(v1_data)
         remove_key = dict_response["INQUIRY_RESPONSE"]
         v1_rc = remove_key["RESPONSECODE"]
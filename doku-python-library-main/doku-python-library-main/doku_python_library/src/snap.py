@@ -1,5 +1,15 @@
 from doku_python_library.src.commons.config import *
+from doku_python_library.src.commons.http_client import HttpClient
+from doku_python_library.src.commons.instrumentation import Instrumentation
 from doku_python_library.src.controller.token_controller import TokenController
+from doku_python_library.src.services.token_manager import TokenManager
+from doku_python_library.src.services.token_store import TokenStore
+from doku_python_library.src.services.token_refresher import TokenRefresher
+from doku_python_library.src.services.token_b2b2c_cache import TokenB2B2CCache
+from doku_python_library.src.services.token_service import TokenService
+from doku_python_library.src.services.rsa_signer import RsaSigner
+from doku_python_library.src.services.bulk_executor import BulkExecutor
+from doku_python_library.src.services.va_reconciler import VaReconciler
 from doku_python_library.src.model.token.token_b2b_response import TokenB2BResponse
 from doku_python_library.src.controller.va_controller import VaController
 from doku_python_library.src.model.va.create_va_request import CreateVARequest
@@ -36,87 +46,156 @@ from doku_python_library.src.model.direct_debit.check_status_response import Che
 from doku_python_library.src.model.direct_debit.card_unbinding_request import CardUnbindingRequest
 from doku_python_library.src.model.direct_debit.card_unbinding_response import CardUnbindingResponse
 from doku_python_library.src.model.notification.notification_payment_direct_debit_response import *
+import time
 
 class DokuSNAP :
 
     def __init__(self, private_key: str, client_id: str, is_production: bool, public_key: str, issuer: str, secret_key: str, 
-                 merchant_public_key: str) -> None:
+                 merchant_public_key: str, http_client: HttpClient = None, token_b2b2c_cache_size: int = 10000,
+                 token_store: TokenStore = None, lazy_token: bool = False, rsa_signer: RsaSigner = None) -> None:
         self.private_key = private_key
         self.client_id = client_id
         self.is_production = is_production
         self.public_key = public_key
         self.issuer = issuer
-        self.get_token()
-        self.token_b2b: TokenB2BResponse
-        self.token: str
-        self.token_expires_in: int
-        self.token_generate_timestamp: str
+        self.http_client = http_client if http_client is not None else HttpClient()
+        self.token_manager: TokenManager = TokenManager(
+            fetch_token=self._fetch_token_b2b,
+            token_store=token_store,
+            store_key="doku:token_b2b:{client_id}:{env}".format(client_id=client_id, env="prod" if is_production else "dev")
+        )
+        if not lazy_token:
+            self.token_manager.get_token()
         self.secret_key = secret_key
-        self.token_b2b2c: str
-        self.token_b2b2c_generate_timestamp: str
-        self.token_b2b2c_expires_in: int
+        self.token_b2b2c: str = None
+        self.token_b2b2c_generate_timestamp: str = None
+        self.token_b2b2c_expires_in: str = None
+        self.token_b2b2c_deadline: float = None
+        self.token_b2b2c_auth_code: str = None
+        self.token_b2b2c_cache: TokenB2B2CCache = TokenB2B2CCache(max_size=token_b2b2c_cache_size)
         self.merchant_public_key = merchant_public_key
+        self.token_refresher: TokenRefresher = None
+        self.rsa_signer = rsa_signer
 
         
     def get_token(self) -> TokenB2BResponse:
+        return self.token_manager.refresh()
+
+    def warm_up(self) -> TokenB2BResponse:
+        self.token_manager.get_token()
+        return self.token_b2b
+
+    def _fetch_token_b2b(self) -> TokenB2BResponse:
         try:
-            token_b2b_response: TokenB2BResponse = TokenController.get_token_b2b(
-            private_key=self.private_key, 
-            client_id=self.client_id, 
-            is_production=self.is_production
-            )
-            if token_b2b_response is not None:
-                self._set_token_b2b(token_b2b_response)
-            return token_b2b_response
+            return TokenController.get_token_b2b(
+                private_key=self.private_key,
+                client_id=self.client_id,
+                is_production=self.is_production,
+                http_client=self.http_client
+            )
         except Exception as e:
             return TokenB2BResponse(
                 responseCode="5007300",
                 responseMessage=str(e)
             )
-    
+
+    @property
+    def token_b2b(self) -> TokenB2BResponse:
+        return self.token_manager.token_b2b
+
+    @property
+    def token(self) -> str:
+        return self.token_manager.token
+
+    @property
+    def token_expires_in(self) -> int:
+        return self.token_manager.token_expires_in
+
+    @property
+    def token_generate_timestamp(self) -> str:
+        return self.token_manager.token_generate_timestamp
+
+    def rotate_private_key(self, private_key: str) -> TokenB2BResponse:
+        TokenController.invalidate_private_key(private_key=self.private_key)
+        self.private_key = private_key
+        if self.rsa_signer is not None:
+            retired_signer: RsaSigner = self.rsa_signer
+            self.rsa_signer = retired_signer.with_private_key(private_key)
+            retired_signer.close()
+        return self.get_token()
+
     def _set_token_b2b(self, token_b2b_response: TokenB2BResponse) -> None:
-        self.token_b2b = token_b2b_response
-        self.token = token_b2b_response.access_token
-        self.token_expires_in = token_b2b_response.expires_in
-        self.token_generate_timestamp = token_b2b_response.generated_timestamp
+        self.token_manager.set_token(token_b2b_response)
 
+    @Instrumentation.traced("snap.create_va")
     def create_va(self, create_va_request: CreateVARequest) -> CreateVAResponse:
+        resp = self._check_create_va_request(create_va_request)
+        if resp is not None:
+            return resp
+        return self._send_create_va(create_va_request)
+
+    def create_va_bulk(self, create_va_requests, concurrency: int = 10, rate_limit: float = None):
+        self.token_manager.get_token()
+        return BulkExecutor.stream(
+            items=create_va_requests,
+            task=self._send_create_va,
+            concurrency=concurrency,
+            rate_limit=rate_limit,
+            precheck=self._check_create_va_request,
+            thread_name_prefix="doku-create-va"
+        )
+
+    def _check_create_va_request(self, create_va_request: CreateVARequest) -> CreateVAResponse:
         try:
             resp = create_va_request.check_simulator(is_production=self.is_production)
             if resp is not None:
                 return resp
             create_va_request.validate_va_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(self.token, self.token_expires_in, self.token_generate_timestamp)
-            if is_token_invalid:
-                self.get_token()
-            return VaController.create_va(
+            return None
+        except Exception as e:
+            return CreateVAResponse(
+                responseCode="5002700",
+                responseMessage=str(e)
+            )
+
+    def _send_create_va(self, create_va_request: CreateVARequest) -> CreateVAResponse:
+        try:
+            self.token_manager.get_token()
+            create_va_response: CreateVAResponse = VaController.create_va(
                 is_production= self.is_production,
                 client_id= self.client_id,
                 token_b2b= self.token,
                 create_va_request= create_va_request,
-                secret_key= self.secret_key
-            )
+                secret_key= self.secret_key,
+                http_client=self.http_client
+            )
+            if create_va_response is None:
+                return CreateVAResponse(
+                    responseCode="5002700",
+                    responseMessage="Empty response"
+                )
+            return create_va_response
         except Exception as e:
             return CreateVAResponse(
                 responseCode="5002700",
                 responseMessage=str(e)
             )
-    
+
+    @Instrumentation.traced("snap.update_va")
     def update_va(self, update_request: UpdateVaRequest) -> UpdateVAResponse:
         try:
             resp = update_request.check_simulator(is_production=self.is_production)
             if resp is not None:
                 return resp
             update_request.validate_update_va_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(self.token, self.token_expires_in, self.token_generate_timestamp)
-            if is_token_invalid:
-                self.get_token()
+            self.token_manager.get_token()
             return VaController.do_update_va(
                 update_va_request= update_request,
                 secret_key= self.secret_key,
                 client_id= self.client_id,
                 token_b2b= self.token,
-                is_production= self.is_production
+                is_production= self.is_production,
+                http_client=self.http_client
             )
         except Exception as e:
             return UpdateVAResponse(
@@ -125,21 +204,21 @@ class DokuSNAP :
             )
             
     
+    @Instrumentation.traced("snap.check_status_va")
     def check_status_va(self, check_status_request: va_status) -> CheckStatusVAResponse:
         try:
             resp = check_status_request.check_simulator(is_production=self.is_production)
             if resp is not None:
                 return resp
             check_status_request.validate_check_status_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(self.token, self.token_expires_in, self.token_generate_timestamp)
-            if is_token_invalid:
-                self.get_token()
+            self.token_manager.get_token()
             return VaController.do_check_status_va(
                 check_status_request= check_status_request,
                 secret_key= self.secret_key,
                 client_id= self.client_id,
                 token_b2b= self.token,
-                is_production= self.is_production
+                is_production= self.is_production,
+                http_client=self.http_client
             )
         except Exception as e:
             return CheckStatusVAResponse(
@@ -147,21 +226,30 @@ class DokuSNAP :
                 responseMessage=str(e)
             )
     
+    def reconcile_va_status(self, input_path: str, output_path: str, concurrency: int = 10, rate_limit: float = None,
+                            checkpoint_path: str = None, input_format: str = None) -> dict:
+        return VaReconciler(
+            snap=self,
+            concurrency=concurrency,
+            rate_limit=rate_limit,
+            checkpoint_path=checkpoint_path
+        ).run(input_path=input_path, output_path=output_path, input_format=input_format)
+
+    @Instrumentation.traced("snap.delete_payment_code")
     def delete_payment_code(self, delete_va_request: DeleteVARequest) -> DeleteVAResponse:
         try:
             resp = delete_va_request.check_simulator(is_production=self.is_production)
             if resp is not None:
                 return resp
             delete_va_request.validate_delete_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(self.token, self.token_expires_in, self.token_generate_timestamp)
-            if is_token_invalid:
-                self.get_token()
+            self.token_manager.get_token()
             return VaController.do_delete_payment_code(
                 delete_va_request= delete_va_request,
                 secret_key= self.secret_key,
                 client_id= self.client_id,
                 token_b2b= self.token,
-                is_production= self.is_production
+                is_production= self.is_production,
+                http_client=self.http_client
             )
         except Exception as e:
             return DeleteVAResponse(
@@ -169,16 +257,29 @@ class DokuSNAP :
                 responseMessage=str(e)
             )
         
-    def validate_signature(self) -> bool:
-        return TokenController.validate_signature(
-            client_id= self.client_id,
+    def validate_signature(self, headers = None) -> bool:
+        if headers is None:
+            return TokenController.validate_signature(
+                client_id= self.client_id,
+                public_key=self.public_key
+            )
+        return TokenController.validate_signature_headers(
+            headers=headers,
+            client_id=self.client_id,
+            public_key=self.public_key
+        )
+
+    def verify_many(self, headers_list) -> list:
+        return TokenController.verify_many(
+            headers_list=headers_list,
+            client_id=self.client_id,
             public_key=self.public_key
         )
     
     def generate_token_b2b(self, is_signature_valid: bool) -> NotificationToken:
         if is_signature_valid:
             return TokenController.generate_token_b2b(
-                expire_in= self.token_expires_in,
+                expire_in= Config.NOTIFICATION_TOKEN_EXPIRES_IN,
                 issuer= self.issuer,
                 private_key= self.private_key,
                 client_id=  self.client_id
@@ -188,8 +289,8 @@ class DokuSNAP :
     def validate_token_b2b(self, request_token: str) -> bool:
         return TokenController.validate_token_b2b(token= request_token, public_key= self.merchant_public_key)
     
-    def validate_signature_and_generate_token(self) -> NotificationToken:
-        is_signature_valid: bool = self.validate_signature()
+    def validate_signature_and_generate_token(self, headers = None) -> NotificationToken:
+        is_signature_valid: bool = self.validate_signature(headers=headers)
         return self.generate_token_b2b(is_signature_valid= is_signature_valid)
     
     def generate_notification_response(self, is_token_valid: bool, request: PaymentNotificationRequest) -> PaymentNotificationResponseBody:
@@ -207,27 +308,24 @@ class DokuSNAP :
         return self.generate_notification_response(is_token_valid=is_token_valid, request=request)
 
     def generate_request_header(self) -> RequestHeader:
-        is_token_invalid: bool = TokenController.is_token_invalid(
-            token=self.token,
-            token_expires_in=self.token_expires_in,
-            token_generated_timestamp=self.token_generate_timestamp
-        )
-
-        if is_token_invalid:
-            token_b2b_response = TokenController.get_token_b2b(
-                private_key=self.private_key,
-                client_id=self.client_id,
-                is_production=self.is_production
-            )
-            if token_b2b_response is not None:
-                    self._set_token_b2b(token_b2b_response)
-            
+        self.token_manager.get_token()
         request_header: RequestHeader = TokenController.do_generate_request_header(
             private_key=self.private_key,
             client_id=self.client_id,
-            token_b2b=self.token
+            token_b2b=self.token,
+            rsa_signer=self.rsa_signer
         )
         return request_header
+
+    def generate_request_headers(self, count: int) -> list:
+        self.token_manager.get_token()
+        return TokenController.do_generate_request_headers(
+            private_key=self.private_key,
+            client_id=self.client_id,
+            token_b2b=self.token,
+            count=count,
+            rsa_signer=self.rsa_signer
+        )
     
     def direct_inquiry_request_mapping(self, header: dict, snap_format: dict) -> dict:
         return VaController.direct_inquiry_request_mapping(
@@ -238,18 +336,12 @@ class DokuSNAP :
     def direct_inquiry_response_mapping(self, v1_data: str) -> dict:
         return VaController.direct_inquiry_response_mapping(v1_data=v1_data)
     
+    @Instrumentation.traced("snap.do_account_binding")
     def do_account_binding(self, request: AccountBindingRequest, device_id: str = None, ip_address: str = None) -> AccountBindingResponse:
         try:
             request.validate_request()
 
-            is_token_invalid: bool = TokenController.is_token_invalid(
-                token=self.token,
-                token_expires_in=self.token_expires_in,
-                token_generated_timestamp=self.token_generate_timestamp
-            )
-
-            if is_token_invalid:
-                self.get_token()
+            self.token_manager.get_token()
             
             return DirectDebitController.do_account_binding(
                 request=request,
@@ -258,7 +350,8 @@ class DokuSNAP :
                 device_id=device_id,
                 ip_address=ip_address,
                 token_b2b=self.token,
-                is_production=self.is_production
+                is_production=self.is_production,
+                http_client=self.http_client
             )
         except Exception as e:
             return AccountBindingResponse(
@@ -266,16 +359,25 @@ class DokuSNAP :
                 responseMessage=str(e)
             )
     
-    def get_token_b2b2c(self, auth_code: str) -> TokenB2B2CResponse:
-        try:
-            token_b2b2c_response: TokenB2B2CResponse = TokenController.get_token_b2b2c(
+    @Instrumentation.traced("snap.get_token_b2b2c")
+    def _fetch_token_b2b2c(self, auth_code: str) -> TokenB2B2CResponse:
+        with Instrumentation.span("token.refresh", token_type="b2b2c"):
+            return TokenController.get_token_b2b2c(
                 auth_code=auth_code,
                 private_key=self.private_key,
                 client_id=self.client_id,
-                is_production=self.is_production
+                is_production=self.is_production,
+                http_client=self.http_client
             )
+
+    def get_token_b2b2c(self, auth_code: str) -> TokenB2B2CResponse:
+        try:
+            token_b2b2c_response: TokenB2B2CResponse = self._fetch_token_b2b2c(auth_code)
             if token_b2b2c_response.response_code == "2007400":
-                self._set_token_b2b2c(token_b2b2c_response=token_b2b2c_response)
+                self._set_token_b2b2c(token_b2b2c_response=token_b2b2c_response, auth_code=auth_code)
+                self.token_b2b2c_auth_code = auth_code
+                if self.token_refresher is not None:
+                    self._register_token_b2b2c_refresh()
             return token_b2b2c_response
         except Exception as e:
             return TokenB2B2CResponse(
@@ -283,28 +385,103 @@ class DokuSNAP :
                 responseMessage=str(e)
             )
     
-    def _set_token_b2b2c(self, token_b2b2c_response: TokenB2B2CResponse) -> None:
+    def get_customer_token_b2b2c(self, auth_code: str) -> str:
+        token_b2b2c_response: TokenB2B2CResponse = self.token_b2b2c_cache.get_or_fetch(
+            auth_code,
+            lambda: self.get_token_b2b2c(auth_code=auth_code)
+        )
+        return token_b2b2c_response.access_token
+
+    def _set_token_b2b2c(self, token_b2b2c_response: TokenB2B2CResponse, auth_code: str = None) -> None:
         self.token_b2b2c = token_b2b2c_response.access_token
         self.token_b2b2c_expires_in = token_b2b2c_response.access_token_expiry_time
         self.token_b2b2c_generate_timestamp = token_b2b2c_response.generated_timestamp
+        self.token_b2b2c_deadline = TokenService.get_token_deadline(
+            TokenService.get_token_b2b2c_expires_in(token_b2b2c_response.access_token_expiry_time)
+        )
+        if auth_code is not None:
+            self.token_b2b2c_cache.put(auth_code, token_b2b2c_response, self.token_b2b2c_deadline)
+
+    def is_token_b2b2c_invalid(self) -> bool:
+        return TokenService.is_token_empty(self.token_b2b2c) or TokenService.is_deadline_passed(self.token_b2b2c_deadline)
     
+    def start_token_refresher(self, refresh_ratio: float = 0.8, retry_interval: float = 5.0) -> TokenRefresher:
+        if self.token_refresher is None:
+            self.token_refresher = TokenRefresher(refresh_ratio=refresh_ratio, retry_interval=retry_interval)
+        if not self.token_manager.is_token_invalid():
+            self.token_refresher.register("b2b", self._refresh_token_b2b, self.token_manager.token_deadline - time.monotonic())
+        else:
+            self.token_refresher.register("b2b", self._refresh_token_b2b, 0)
+        self._register_token_b2b2c_refresh()
+        self.token_refresher.start()
+        return self.token_refresher
+
+    def stop_token_refresher(self) -> None:
+        if self.token_refresher is not None:
+            self.token_refresher.stop()
+            self.token_refresher = None
+
+    def _refresh_token_b2b(self) -> int:
+        token_b2b_response: TokenB2BResponse = self.token_manager.refresh_if_stale()
+        if token_b2b_response is None or token_b2b_response.response_code != "2007300":
+            return None
+        return self.token_manager.token_deadline - time.monotonic()
+
+    def _refresh_token_b2b2c(self, auth_code: str) -> bool:
+        try:
+            token_b2b2c_response: TokenB2B2CResponse = self._fetch_token_b2b2c(auth_code)
+        except Exception as e:
+            print("Failed Refresh Token B2B2C "+str(e))
+            return False
+        if token_b2b2c_response.response_code != "2007400":
+            return False
+        if auth_code == self.token_b2b2c_auth_code:
+            self._set_token_b2b2c(token_b2b2c_response=token_b2b2c_response, auth_code=auth_code)
+        else:
+            self.token_b2b2c_cache.put(auth_code, token_b2b2c_response, TokenService.get_token_deadline(
+                TokenService.get_token_b2b2c_expires_in(token_b2b2c_response.access_token_expiry_time)
+            ))
+        return True
+
+    def _refresh_tokens_b2b2c(self) -> float:
+        token_refresher: TokenRefresher = self.token_refresher
+        if token_refresher is None:
+            return None
+        auth_codes, next_due_in = self.token_b2b2c_cache.due_for_refresh(token_refresher.refresh_ratio)
+        refreshed: list = [self._refresh_token_b2b2c(auth_code) for auth_code in auth_codes]
+        if not all(refreshed):
+            return None
+        auth_codes, next_due_in = self.token_b2b2c_cache.due_for_refresh(token_refresher.refresh_ratio)
+        if auth_codes:
+            return 0
+        return next_due_in if next_due_in is not None else token_refresher.retry_interval
+
+    def _register_token_b2b2c_refresh(self) -> None:
+        auth_codes, next_due_in = self.token_b2b2c_cache.due_for_refresh(self.token_refresher.refresh_ratio)
+        if not auth_codes and next_due_in is None:
+            return
+        self.token_refresher.register(
+            "b2b2c",
+            self._refresh_tokens_b2b2c,
+            0 if auth_codes else next_due_in,
+            refresh_ratio=1.0
+        )
+
+    @Instrumentation.traced("snap.do_payment")
     def do_payment(self, request: PaymentRequest, ip_address: str, auth_code: str) -> PaymentResponse:
         try:
             request.validate_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(self.token, self.token_expires_in, self.token_generate_timestamp)
-            if is_token_invalid:
-                self.get_token()
-            is_token_b2b2c_invalid: bool = TokenController.is_token_invalid(self.token_b2b2c, self.token_b2b2c_expires_in, self.token_b2b2c_generate_timestamp)
-            if is_token_b2b2c_invalid:
-                self.get_token_b2b2c(auth_code=auth_code)
+            self.token_manager.get_token()
+            token_b2b2c: str = self.get_customer_token_b2b2c(auth_code=auth_code)
             return DirectDebitController.do_payment_process(
                 request=request,
                 secret_key=self.secret_key,
                 client_id=self.client_id,
                 ip_address=ip_address,
                 token_b2b=self.token,
-                token_b2b2c=self.token_b2b2c,
-                is_production=self.is_production
+                token_b2b2c=token_b2b2c,
+                is_production=self.is_production,
+                http_client=self.http_client
             )
         except Exception as e:
             return PaymentResponse(
@@ -312,23 +489,21 @@ class DokuSNAP :
                 responseMessage=str(e)
             )
     
+    @Instrumentation.traced("snap.do_balance_inquiry")
     def do_balance_inquiry(self, request: BalanceInquiryRequest, ip_address: str, auth_code: str) -> BalanceInquiryResponse:
         try:
             request.validate_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(self.token, self.token_expires_in, self.token_generate_timestamp)
-            if is_token_invalid:
-                self.get_token()
-            is_token_b2b2c_invalid: bool = TokenController.is_token_invalid(self.token_b2b2c, self.token_b2b2c_expires_in, self.token_b2b2c_generate_timestamp)
-            if is_token_b2b2c_invalid:
-                self.get_token_b2b2c(auth_code=auth_code)
+            self.token_manager.get_token()
+            token_b2b2c: str = self.get_customer_token_b2b2c(auth_code=auth_code)
             return DirectDebitController.do_balance_inquiry(
                 request=request,
                 ip_address=ip_address,
                 token=self.token,
-                token_b2b2c=self.token_b2b2c,
+                token_b2b2c=token_b2b2c,
                 secret_key=self.secret_key,
                 client_id=self.client_id,
-                is_production=self.is_production
+                is_production=self.is_production,
+                http_client=self.http_client
             )
         except Exception as e:
             return BalanceInquiryResponse(
@@ -336,24 +511,19 @@ class DokuSNAP :
                 responseMessage=str(e)
             )
     
+    @Instrumentation.traced("snap.do_account_unbinding")
     def do_account_unbinding(self, request: AccountUnbindingRequest, ip_address: str) -> AccountUnbindingResponse:
         try:
             request.validate_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(
-                token=self.token,
-                token_expires_in=self.token_expires_in,
-                token_generated_timestamp=self.token_generate_timestamp
-            )
-
-            if is_token_invalid:
-                self.get_token()
+            self.token_manager.get_token()
             return DirectDebitController.do_account_unbinding(
                 request=request,
                 secret_key=self.secret_key,
                 client_id=self.client_id,
                 ip_address=ip_address,
                 token=self.token,
-                is_production=self.is_production
+                is_production=self.is_production,
+                http_client=self.http_client
             )
         except Exception as e:
             return AccountUnbindingResponse(
@@ -361,17 +531,11 @@ class DokuSNAP :
                 responseMessage=str(e)
             )
     
+    @Instrumentation.traced("snap.do_payment_jump_app")
     def do_payment_jump_app(self, request: PaymentJumpAppRequest, device_id: str, ip_address: str) -> PaymentJumpAppResponse:
         try:
             request.validate_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(
-                token=self.token,
-                token_expires_in=self.token_expires_in,
-                token_generated_timestamp=self.token_generate_timestamp
-            )
-
-            if is_token_invalid:
-                self.get_token()
+            self.token_manager.get_token()
             return DirectDebitController.do_payment_jump_app(
                 request=request,
                 client_id=self.client_id,
@@ -379,7 +543,8 @@ class DokuSNAP :
                 secret_key=self.secret_key,
                 device_id=device_id,
                 ip_address=ip_address,
-                is_production=self.is_production
+                is_production=self.is_production,
+                http_client=self.http_client
             )
         except Exception as e:
             return PaymentJumpAppResponse(
@@ -387,24 +552,19 @@ class DokuSNAP :
                 responseMessage=str(e)
             )
         
+    @Instrumentation.traced("snap.do_card_registration")
     def do_card_registration(self, request: CardRegistrationRequest, channel_id: str) -> CardRegistrationResponse:
         try:
             request.validate_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(
-                token=self.token,
-                token_expires_in=self.token_expires_in,
-                token_generated_timestamp=self.token_generate_timestamp
-            )
-
-            if is_token_invalid:
-                self.get_token()
+            self.token_manager.get_token()
             return DirectDebitController.do_card_registration(
                 request=request,
                 secret_key=self.secret_key,
                 client_id=self.client_id,
                 channel_id=channel_id,
                 token_b2b=self.token,
-                is_production=self.is_production
+                is_production=self.is_production,
+                http_client=self.http_client
             )
         except Exception as e:
             return CardRegistrationResponse(
@@ -412,24 +572,19 @@ class DokuSNAP :
                 responseMessage=str(e)
             )
     
+    @Instrumentation.traced("snap.do_card_unbinding")
     def do_card_unbinding(self, request: CardUnbindingRequest, ip_address: str) -> CardUnbindingResponse:
         try:
             request.validate_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(
-                token=self.token,
-                token_expires_in=self.token_expires_in,
-                token_generated_timestamp=self.token_generate_timestamp
-            )
-
-            if is_token_invalid:
-                self.get_token()
+            self.token_manager.get_token()
             return DirectDebitController.do_card_unbinding(
                 request=request,
                 secret_key=self.secret_key,
                 client_id=self.client_id,
                 ip_address=ip_address,
                 token=self.token,
-                is_production=self.is_production
+                is_production=self.is_production,
+                http_client=self.http_client
             )
         except Exception as e:
             return CardUnbindingResponse(
@@ -437,24 +592,22 @@ class DokuSNAP :
                 responseMessage=str(e)
             )
     
+    @Instrumentation.traced("snap.do_refund")
     def do_refund(self, request: RefundRequest, ip_address: str, auth_code: str, device_id: str) -> RefundResponse:
         try:
             request.validate_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(self.token, self.token_expires_in, self.token_generate_timestamp)
-            if is_token_invalid:
-                self.get_token()
-            is_token_b2b2c_invalid: bool = TokenController.is_token_invalid(self.token_b2b2c, self.token_b2b2c_expires_in, self.token_b2b2c_generate_timestamp)
-            if is_token_b2b2c_invalid:
-                self.get_token_b2b2c(auth_code=auth_code)
+            self.token_manager.get_token()
+            token_b2b2c: str = self.get_customer_token_b2b2c(auth_code=auth_code)
             return DirectDebitController.do_refund(
                 request=request,
                 secret_key=self.secret_key,
                 client_id=self.client_id,
                 ip_address=ip_address,
                 token_b2b=self.token,
-                token_b2b2c=self.token_b2b2c,
+                token_b2b2c=token_b2b2c,
                 is_production=self.is_production,
-                device_id=device_id
+                device_id=device_id,
+                http_client=self.http_client
             )
         except Exception as e:
             return RefundResponse(
@@ -462,23 +615,18 @@ class DokuSNAP :
                 responseMessage=str(e)
             )
         
+    @Instrumentation.traced("snap.do_check_status")
     def do_check_status(self, request: CheckStatusRequest) -> CheckStatusResponse:
         try:
             request.validate_request()
-            is_token_invalid: bool = TokenController.is_token_invalid(
-                token=self.token,
-                token_expires_in=self.token_expires_in,
-                token_generated_timestamp=self.token_generate_timestamp
-            )
-
-            if is_token_invalid:
-                self.get_token()
+            self.token_manager.get_token()
             return DirectDebitController.do_check_status(
                 request=request,
                 secret_key=self.secret_key,
                 client_id=self.client_id,
                 token_b2b=self.token,
-                is_production=self.is_production
+                is_production=self.is_production,
+                http_client=self.http_client
             )
         except Exception as e:
             return CheckStatusResponse(
@@ -495,6 +643,10 @@ class DokuSNAP :
             return NotificationController.generate_direct_debit_notification_response()
         return NotificationController.generate_direct_debit_invalid_token_response()
     
+    def close(self) -> None:
+        self.stop_token_refresher()
+        self.http_client.close()
+
     @staticmethod
     def encrypt_card(input_str: str, secret_key: str) -> str:
         return DirectDebitController.encrypt_card(input_str, secret_key)
\ No newline at end of file
@@ -0,0 +1,116 @@
+import json
+import time
+
+import pytest
+
+from doku_python_library.src.commons.circuit_breaker import CircuitBreaker, CircuitOpenError
+from doku_python_library.src.commons.config import Config
+
+ENDPOINT = Config.CREATE_VA
+
+
+def trip(breaker: CircuitBreaker, endpoint: str = ENDPOINT, status_code: int = 503) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.allow(endpoint)
+        breaker.record(endpoint, status_code)
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    for _ in range(2):
+        breaker.allow(ENDPOINT)
+        breaker.record(ENDPOINT, 500)
+    assert breaker.get_state(ENDPOINT) == CircuitBreaker.CLOSED
+
+    breaker.allow(ENDPOINT)
+    breaker.record(ENDPOINT, None)
+    assert breaker.get_state(ENDPOINT) == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.allow(ENDPOINT)
+    assert breaker.metrics()[ENDPOINT]["rejectedCount"] == 1
+    assert breaker.metrics()[ENDPOINT]["openCount"] == 1
+
+
+def test_success_resets_the_failure_streak():
+    breaker = CircuitBreaker(failure_threshold=3)
+
+    for status_code in (500, 500, 200, 500, 500, 404):
+        breaker.allow(ENDPOINT)
+        breaker.record(ENDPOINT, status_code)
+
+    assert breaker.get_state(ENDPOINT) == CircuitBreaker.CLOSED
+    assert breaker.metrics()[ENDPOINT]["failureCount"] == 4
+
+
+def test_half_open_probe_success_closes_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    trip(breaker)
+    time.sleep(0.06)
+
+    breaker.allow(ENDPOINT)
+    assert breaker.get_state(ENDPOINT) == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow(ENDPOINT)
+
+    breaker.record(ENDPOINT, 200)
+    assert breaker.get_state(ENDPOINT) == CircuitBreaker.CLOSED
+    breaker.allow(ENDPOINT)
+
+
+def test_half_open_probe_failure_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    trip(breaker)
+    time.sleep(0.06)
+
+    breaker.allow(ENDPOINT)
+    breaker.record(ENDPOINT, 502)
+
+    assert breaker.get_state(ENDPOINT) == CircuitBreaker.OPEN
+    assert breaker.metrics()[ENDPOINT]["openCount"] == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.allow(ENDPOINT)
+
+
+def test_success_threshold_needs_several_probes():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05, success_threshold=2)
+    trip(breaker)
+    time.sleep(0.06)
+
+    breaker.allow(ENDPOINT)
+    breaker.record(ENDPOINT, 200)
+    assert breaker.get_state(ENDPOINT) == CircuitBreaker.HALF_OPEN
+
+    breaker.allow(ENDPOINT)
+    breaker.record(ENDPOINT, 200)
+    assert breaker.get_state(ENDPOINT) == CircuitBreaker.CLOSED
+
+
+def test_circuits_are_tracked_per_endpoint():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    trip(breaker)
+
+    breaker.allow(Config.CHECK_STATUS_VA)
+    assert breaker.get_state(Config.CHECK_STATUS_VA) == CircuitBreaker.CLOSED
+
+    breaker.reset(ENDPOINT)
+    assert breaker.get_state(ENDPOINT) == CircuitBreaker.CLOSED
+
+
+@pytest.mark.parametrize("endpoint, response_code", [
+    (Config.CREATE_VA, "5032700"),
+    (Config.ACCESS_TOKEN, "5037300"),
+    (Config.DIRECT_DEBIT_PAYMENT_URL, "5035400"),
+    ("/unknown", "5030000")
+])
+def test_open_circuit_response_uses_the_service_code(endpoint, response_code):
+    response = CircuitBreaker.open_circuit_response("http://localhost" + endpoint, endpoint)
+
+    assert response.status_code == 503
+    assert json.loads(response.text)["responseCode"] == response_code
+
+
+def test_rejects_invalid_thresholds():
+    with pytest.raises(Exception):
+        CircuitBreaker(failure_threshold=0)
@@ -0,0 +1,102 @@
+import datetime
+import json
+import random
+import string
+import sys
+
+import pytest
+
+from doku_python_library.src.commons.json_codec import JsonCodec
+
+ALPHABET = string.printable + "éü中 \x00\x1f\"\\/€😀"
+
+
+@pytest.fixture(autouse=True)
+def reset_backend():
+    yield
+    JsonCodec.set_backend("json")
+
+
+def stdlib_dumps(value) -> bytes:
+    return json.dumps(value, separators=(',', ':'), allow_nan=False).encode("utf-8")
+
+
+def random_value(rnd: random.Random, depth: int = 0):
+    kind: int = rnd.randrange(9 if depth < 4 else 6)
+    if kind == 0:
+        return None
+    if kind == 1:
+        return rnd.random() < 0.5
+    if kind == 2:
+        return rnd.randrange(-10 ** 20, 10 ** 20) if rnd.random() < 0.1 else rnd.randrange(-10 ** 6, 10 ** 6)
+    if kind == 3:
+        return rnd.choice([0.1, 1e16, 1e-7, -2.5, 123456789.123, 1.0, 5e-324, rnd.uniform(-1e6, 1e6), float(rnd.randrange(10 ** 17))])
+    if kind in (4, 5):
+        return "".join(rnd.choice(ALPHABET) for _ in range(rnd.randrange(12)))
+    if kind == 6:
+        return [random_value(rnd, depth + 1) for _ in range(rnd.randrange(5))]
+    return {"".join(rnd.choice(ALPHABET) for _ in range(rnd.randrange(6))): random_value(rnd, depth + 1) for _ in range(rnd.randrange(5))}
+
+
+def test_json_backend_matches_stdlib():
+    rnd = random.Random(1)
+    for _ in range(2000):
+        value = random_value(rnd)
+        assert JsonCodec.dumps(value) == stdlib_dumps(value)
+
+
+def test_orjson_backend_is_byte_identical_to_json():
+    pytest.importorskip("orjson")
+    rnd = random.Random(1)
+    values: list = [random_value(rnd) for _ in range(20000)]
+
+    JsonCodec.set_backend("json")
+    expected: list = [JsonCodec.dumps(value) for value in values]
+    JsonCodec.set_backend("orjson")
+    actual: list = [JsonCodec.dumps(value) for value in values]
+
+    assert JsonCodec.get_backend() == "orjson"
+    assert actual == expected
+
+
+class Code(str):
+    pass
+
+
+@pytest.mark.parametrize("value", [
+    {"amount": Code("10000.00")},
+    {"nested": [{"n": None, "b": True}]},
+    {"big": 10 ** 20, "small": 1e-7, "large": 1e16},
+    {"name": "Tokó ☕"}
+], ids=["str-subclass", "null", "numbers", "non-ascii"])
+def test_orjson_backend_falls_back_where_output_differs(value):
+    pytest.importorskip("orjson")
+    JsonCodec.set_backend("orjson")
+
+    assert JsonCodec.dumps(value) == stdlib_dumps(value)
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_unserialisable_values_raise_on_both_backends(backend):
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    JsonCodec.set_backend(backend)
+
+    with pytest.raises(TypeError):
+        JsonCodec.dumps({"at": datetime.datetime(2024, 1, 1)})
+    with pytest.raises(ValueError):
+        JsonCodec.dumps({"amount": float("nan")})
+
+
+def test_missing_orjson(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+
+    with pytest.raises(Exception, match="orjson package"):
+        JsonCodec.set_backend("orjson")
+    JsonCodec.set_backend("auto")
+    assert JsonCodec.get_backend() == "json"
+
+
+def test_rejects_unknown_backend():
+    with pytest.raises(Exception, match="backend must be"):
+        JsonCodec.set_backend("ujson")
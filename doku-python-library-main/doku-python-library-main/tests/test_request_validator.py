@@ -0,0 +1,68 @@
+import json
+import os
+
+import pytest
+
+from doku_python_library.src.model.va.create_va_request import CreateVARequest
+from doku_python_library.src.model.va.update_va_request import UpdateVaRequest
+from tests.validation_cases import COUNT, SEED, CaseGenerator, generate_outcomes
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "va_validation_outcomes.json")
+CRASH_PREFIXES = ("AttributeError: ", "TypeError: ")
+
+
+@pytest.fixture(scope="module")
+def expected_outcomes() -> list:
+    with open(FIXTURE_PATH, "r", encoding="utf-8") as f:
+        fixture: dict = json.load(f)
+    assert fixture["seed"] == SEED and fixture["count"] == COUNT
+    outcomes: list = [None] * fixture["count"]
+    for message, indices in fixture["outcomes"].items():
+        for index in indices:
+            outcomes[index] = message
+    return outcomes
+
+
+@pytest.fixture(scope="module")
+def actual_outcomes() -> list:
+    return generate_outcomes()
+
+
+def test_messages_match_the_previous_validators(expected_outcomes, actual_outcomes):
+    mismatches: list = [
+        (index, expected, actual)
+        for index, (expected, actual) in enumerate(zip(expected_outcomes, actual_outcomes))
+        if not expected.startswith(CRASH_PREFIXES) and expected != actual
+    ]
+
+    assert mismatches == []
+    assert sum(outcome == "OK" for outcome in actual_outcomes) > COUNT // 4
+
+
+def test_former_crashes_now_raise_validation_messages(expected_outcomes, actual_outcomes):
+    crashes: list = [index for index, expected in enumerate(expected_outcomes) if expected.startswith(CRASH_PREFIXES)]
+
+    assert crashes
+    for index in crashes:
+        assert actual_outcomes[index] != "OK"
+        assert not actual_outcomes[index].startswith(CRASH_PREFIXES)
+
+
+@pytest.mark.parametrize("request_class, kind, method", [
+    (CreateVARequest, 0, "validate_va_request"),
+    (UpdateVaRequest, 1, "validate_update_va_request")
+])
+def test_validate_many_reports_the_same_first_failure(request_class, kind, method):
+    generator = CaseGenerator()
+    requests: list = [generator.request(index) for index in range(COUNT)][kind::4]
+
+    errors: list = request_class.validate_many(requests)
+
+    assert len(errors) == len(requests)
+    for request, request_errors in zip(requests, errors):
+        try:
+            getattr(request, method)()
+        except Exception as e:
+            assert request_errors[0] == str(e)
+        else:
+            assert request_errors == []
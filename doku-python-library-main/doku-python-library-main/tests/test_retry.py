@@ -0,0 +1,164 @@
+import http.client
+
+import pytest
+import requests
+import urllib3
+
+from doku_python_library.src.commons.config import Config
+from doku_python_library.src.commons.retry import RetryEngine, RetryPolicy
+
+
+def make_response(status_code: int, headers: dict = None) -> requests.Response:
+    response: requests.Response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b"{}"
+    response._content_consumed = True
+    return response
+
+
+def connection_refused() -> requests.exceptions.ConnectionError:
+    reason = urllib3.exceptions.NewConnectionError(None, "Failed to establish a new connection: [Errno 111] Connection refused")
+    return requests.exceptions.ConnectionError(urllib3.exceptions.MaxRetryError(None, "/", reason))
+
+
+def connection_dropped() -> requests.exceptions.ConnectionError:
+    reason = http.client.RemoteDisconnected("Remote end closed connection without response")
+    return requests.exceptions.ConnectionError(urllib3.exceptions.ProtocolError("Connection aborted.", reason))
+
+
+class Sender:
+
+    def __init__(self, outcomes: list) -> None:
+        self.outcomes = list(outcomes)
+        self.calls: int = 0
+
+    def __call__(self) -> requests.Response:
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    delays: list = []
+    monkeypatch.setattr("doku_python_library.src.commons.retry.time.sleep", delays.append)
+    return delays
+
+
+@pytest.mark.parametrize("retry_after, expected", [
+    ("1.5", 1.5),
+    ("0", 0.0),
+    ("-3", 0.0),
+    ("120", 2.0)
+])
+def test_retry_after_is_honoured_and_capped(retry_after, expected):
+    policy = RetryPolicy(max_delay=2.0)
+
+    assert policy.get_delay(0, make_response(429, {"Retry-After": retry_after})) == expected
+
+
+def test_invalid_retry_after_falls_back_to_backoff():
+    policy = RetryPolicy(base_delay=0.1, max_delay=2.0)
+
+    for attempt in range(6):
+        delay = policy.get_delay(attempt, make_response(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}))
+        assert 0.0 <= delay <= min(2.0, 0.1 * (2 ** attempt))
+
+
+def test_retry_after_can_be_ignored():
+    policy = RetryPolicy(base_delay=0.01, respect_retry_after=False)
+
+    assert policy.get_delay(0, make_response(429, {"Retry-After": "30"})) <= 0.01
+
+
+def test_execute_sleeps_for_retry_after(no_sleep):
+    engine = RetryEngine()
+    send = Sender([make_response(429, {"Retry-After": "0.75"}), make_response(200)])
+
+    response = engine.execute(Config.CHECK_STATUS_VA, send)
+
+    assert response.status_code == 200
+    assert send.calls == 2
+    assert no_sleep == [0.75]
+    assert engine.metrics() == {Config.CHECK_STATUS_VA: {"retries": 1, "exhausted": 0}}
+
+
+@pytest.mark.parametrize("error, read_retries, write_retries", [
+    (connection_refused(), True, True),
+    (requests.exceptions.ConnectTimeout(), True, True),
+    (connection_dropped(), True, False),
+    (requests.exceptions.ReadTimeout(), True, False),
+    (requests.exceptions.InvalidURL(), False, False),
+    (ValueError("boom"), False, False)
+], ids=["refused", "connect-timeout", "dropped", "read-timeout", "invalid-url", "value-error"])
+def test_which_exceptions_are_retried(error, read_retries, write_retries):
+    assert RetryPolicy.read().should_retry_exception(error) is read_retries
+    assert RetryPolicy.write().should_retry_exception(error) is write_retries
+
+
+@pytest.mark.parametrize("status_code, read_retries, write_retries", [
+    (429, True, True),
+    (500, True, False),
+    (502, True, False),
+    (503, True, True),
+    (504, True, False),
+    (400, False, False),
+    (200, False, False)
+])
+def test_which_status_codes_are_retried(status_code, read_retries, write_retries):
+    response = make_response(status_code)
+
+    assert RetryPolicy.read().should_retry_response(response) is read_retries
+    assert RetryPolicy.write().should_retry_response(response) is write_retries
+
+
+def test_write_endpoint_does_not_resend_after_a_dropped_response(no_sleep):
+    engine = RetryEngine()
+    send = Sender([connection_dropped(), make_response(200)])
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        engine.execute(Config.CREATE_VA, send)
+
+    assert send.calls == 1
+    assert engine.metrics() == {}
+
+
+def test_write_endpoint_retries_a_refused_connection(no_sleep):
+    engine = RetryEngine()
+    send = Sender([connection_refused(), make_response(200)])
+
+    assert engine.execute(Config.CREATE_VA, send).status_code == 200
+    assert send.calls == 2
+
+
+def test_exhausted_retries_return_the_last_response(no_sleep):
+    engine = RetryEngine()
+    send = Sender([make_response(503) for _ in range(4)])
+
+    response = engine.execute(Config.CHECK_STATUS_VA, send)
+
+    assert response.status_code == 503
+    assert send.calls == RetryPolicy.read().max_attempts
+    assert engine.metrics() == {Config.CHECK_STATUS_VA: {"retries": 3, "exhausted": 1}}
+
+
+def test_exhausted_retries_raise_the_last_exception(no_sleep):
+    engine = RetryEngine()
+    send = Sender([requests.exceptions.ReadTimeout() for _ in range(4)])
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        engine.execute(Config.ACCESS_TOKEN, send)
+
+    assert send.calls == 4
+    assert engine.metrics()[Config.ACCESS_TOKEN]["exhausted"] == 1
+
+
+def test_disabled_engine_sends_once(no_sleep):
+    send = Sender([make_response(503)])
+
+    assert RetryEngine.disabled().execute(Config.CHECK_STATUS_VA, send).status_code == 503
+    assert send.calls == 1
+    assert no_sleep == []
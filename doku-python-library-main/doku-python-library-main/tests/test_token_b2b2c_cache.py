@@ -0,0 +1,140 @@
+import threading
+import time
+
+import pytest
+
+from doku_python_library.src.model.token.token_b2b2c_response import TokenB2B2CResponse
+from doku_python_library.src.services.token_b2b2c_cache import TokenB2B2CCache
+
+
+def make_token(access_token: str) -> TokenB2B2CResponse:
+    return TokenB2B2CResponse(
+        responseCode="2007400",
+        responseMessage="Successful",
+        accessToken=access_token,
+        tokenType="Bearer"
+    )
+
+
+def deadline_in(seconds: float) -> float:
+    return time.monotonic() + seconds
+
+
+def test_hit_and_miss():
+    cache = TokenB2B2CCache(max_size=4)
+    token = make_token("a")
+    cache.put("auth-a", token, deadline_in(60))
+
+    assert cache.get("auth-a") is token
+    assert cache.get("auth-b") is None
+    assert cache.stats() == {"size": 1, "maxSize": 4, "hits": 1, "misses": 1, "evictions": 0, "expirations": 0}
+
+
+def test_evicts_least_recently_used():
+    cache = TokenB2B2CCache(max_size=2)
+    cache.put("a", make_token("a"), deadline_in(60))
+    cache.put("b", make_token("b"), deadline_in(60))
+    cache.get("a")
+
+    cache.put("c", make_token("c"), deadline_in(60))
+
+    assert cache.get("b") is None
+    assert cache.get("a").access_token == "a"
+    assert cache.get("c").access_token == "c"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
+
+
+def test_put_refreshes_recency_of_existing_key():
+    cache = TokenB2B2CCache(max_size=2)
+    cache.put("a", make_token("a"), deadline_in(60))
+    cache.put("b", make_token("b"), deadline_in(60))
+    cache.put("a", make_token("a2"), deadline_in(60))
+
+    cache.put("c", make_token("c"), deadline_in(60))
+
+    assert cache.get("a").access_token == "a2"
+    assert cache.get("b") is None
+
+
+def test_expired_entry_is_dropped_on_read():
+    cache = TokenB2B2CCache(max_size=4)
+    cache.put("a", make_token("a"), deadline_in(0.05))
+    time.sleep(0.06)
+
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_get_or_fetch_is_single_flight_per_key():
+    cache = TokenB2B2CCache(max_size=4)
+    calls: list = []
+    barrier = threading.Barrier(16)
+    results: list = []
+
+    def fetch() -> TokenB2B2CResponse:
+        calls.append(1)
+        time.sleep(0.05)
+        token = make_token("fetched")
+        cache.put("auth", token, deadline_in(60))
+        return token
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(cache.get_or_fetch("auth", fetch).access_token)
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["fetched"] * 16
+
+
+def test_get_or_fetch_refetches_after_expiry():
+    cache = TokenB2B2CCache(max_size=4)
+    cache.put("auth", make_token("old"), deadline_in(0.05))
+    time.sleep(0.06)
+
+    assert cache.get_or_fetch("auth", lambda: make_token("new")).access_token == "new"
+
+
+def test_due_for_refresh_uses_each_entry_lifetime():
+    cache = TokenB2B2CCache(max_size=8)
+    cache.put("short", make_token("short"), deadline_in(0.2))
+    cache.put("long", make_token("long"), deadline_in(60))
+    cache.put("expired", make_token("expired"), deadline_in(-1))
+
+    due, next_due_in = cache.due_for_refresh(0.5)
+    assert due == []
+    assert 0.0 < next_due_in <= 0.1
+
+    time.sleep(0.12)
+    due, next_due_in = cache.due_for_refresh(0.5)
+    assert due == ["short"]
+    assert 29.0 < next_due_in <= 30.0
+
+
+def test_due_for_refresh_on_empty_cache():
+    assert TokenB2B2CCache().due_for_refresh(0.8) == ([], None)
+
+
+def test_invalidate():
+    cache = TokenB2B2CCache(max_size=4)
+    cache.put("a", make_token("a"), deadline_in(60))
+    cache.put("b", make_token("b"), deadline_in(60))
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+
+    cache.invalidate()
+    assert cache.stats()["size"] == 0
+
+
+def test_rejects_empty_cache():
+    with pytest.raises(Exception):
+        TokenB2B2CCache(max_size=0)
@@ -0,0 +1,136 @@
+import itertools
+import threading
+import time
+
+import pytest
+
+from doku_python_library.src.model.token.token_b2b_response import TokenB2BResponse
+from doku_python_library.src.services.token_manager import TokenManager
+from doku_python_library.src.services.token_store import FileTokenStore, InMemoryTokenStore, TokenStore
+
+
+class CountingFetcher:
+
+    def __init__(self, delay: float = 0.0, expires_in: int = 900) -> None:
+        self.delay = delay
+        self.expires_in = expires_in
+        self.calls: int = 0
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def __call__(self) -> TokenB2BResponse:
+        with self._lock:
+            self.calls += 1
+            index: int = next(self._counter)
+        if self.delay:
+            time.sleep(self.delay)
+        return TokenB2BResponse(
+            responseCode="2007300",
+            responseMessage="Successful",
+            accessToken="token-{index}".format(index=index),
+            tokenType="Bearer",
+            expiresIn=self.expires_in
+        )
+
+
+def run_threads(count: int, target) -> list:
+    barrier = threading.Barrier(count)
+    results: list = [None] * count
+    errors: list = []
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        try:
+            results[index] = target()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    return results
+
+
+def test_single_flight_under_concurrent_callers():
+    fetcher = CountingFetcher(delay=0.05)
+    manager = TokenManager(fetcher)
+
+    tokens = run_threads(64, manager.get_token)
+
+    assert fetcher.calls == 1
+    assert set(tokens) == {"token-0"}
+
+
+def test_one_fetch_per_expiry_window():
+    fetcher = CountingFetcher(delay=0.01, expires_in=1)
+    manager = TokenManager(fetcher)
+
+    for window in range(3):
+        tokens = run_threads(32, manager.get_token)
+        assert set(tokens) == {"token-{window}".format(window=window)}
+        time.sleep(1.05)
+
+    assert fetcher.calls == 3
+
+
+@pytest.mark.parametrize("store_factory", [
+    lambda tmp_path: InMemoryTokenStore(),
+    lambda tmp_path: FileTokenStore(str(tmp_path))
+], ids=["memory", "file"])
+def test_single_flight_across_managers_sharing_a_store(tmp_path, store_factory):
+    store = store_factory(tmp_path)
+    fetcher = CountingFetcher(delay=0.05)
+    managers = [TokenManager(fetcher, token_store=store, store_key="doku:token_b2b:test") for _ in range(8)]
+
+    tokens = run_threads(len(managers) * 4, lambda: managers[threading.get_ident() % len(managers)].get_token())
+
+    assert fetcher.calls == 1
+    assert set(tokens) == {"token-0"}
+    assert {manager.get_token() for manager in managers} == {"token-0"}
+
+
+def test_loading_from_the_store_does_not_mutate_the_shared_record():
+    store = InMemoryTokenStore()
+    fetcher = CountingFetcher()
+    managers = [TokenManager(fetcher, token_store=store, store_key="k") for _ in range(3)]
+
+    assert [manager.get_token() for manager in managers] == ["token-0"] * 3
+    assert fetcher.calls == 1
+    assert {"expiresAt", "generatedTimestamp"} <= set(store.get("k"))
+
+
+def test_refresh_if_stale_fetches_once_per_window_across_managers():
+    store = InMemoryTokenStore()
+    fetcher = CountingFetcher()
+    managers = [TokenManager(fetcher, token_store=store, store_key="k") for _ in range(4)]
+    for manager in managers:
+        manager.get_token()
+
+    for manager in managers:
+        manager.refresh_if_stale()
+
+    assert fetcher.calls == 2
+    assert {manager.token for manager in managers} == {"token-1"}
+
+
+def test_failed_refresh_keeps_the_current_token():
+    responses = [
+        TokenB2BResponse(responseCode="2007300", responseMessage="Successful", accessToken="good", tokenType="Bearer", expiresIn=900),
+        TokenB2BResponse(responseCode="5007300", responseMessage="Internal Server Error")
+    ]
+    manager = TokenManager(lambda: responses.pop(0))
+    manager.get_token()
+
+    response = manager.refresh()
+
+    assert response.response_code == "5007300"
+    assert manager.token == "good"
+    assert not manager.is_token_invalid()
+
+
+def test_token_store_is_abstract():
+    with pytest.raises(TypeError):
+        TokenStore()
@@ -0,0 +1,118 @@
+import csv
+import json
+import os
+import threading
+
+import pytest
+
+from doku_python_library.src.model.va.check_status_va_request import CheckStatusRequest
+from doku_python_library.src.model.va.check_status_va_response import CheckStatusVAResponse
+from doku_python_library.src.services.va_reconciler import VaReconciler
+
+ROWS = 60
+
+
+class StubSnap:
+
+    def __init__(self, fail_on: str = None) -> None:
+        self.fail_on = fail_on
+        self.calls: list = []
+        self._lock = threading.Lock()
+
+    def check_status_va(self, check_status_request: CheckStatusRequest) -> CheckStatusVAResponse:
+        with self._lock:
+            self.calls.append(check_status_request.virtual_acc_no)
+        if check_status_request.virtual_acc_no == self.fail_on:
+            raise Exception("connection reset")
+        if check_status_request.customer_no.endswith("7"):
+            return CheckStatusVAResponse(responseCode="4042612", responseMessage="Bill not found")
+        return CheckStatusVAResponse(responseCode="2002600", responseMessage="Successful")
+
+
+def virtual_account_no(index: int) -> str:
+    return "    1899{index:06d}".format(index=index)
+
+
+def write_rows(path: str, input_format: str) -> None:
+    rows: list = [
+        {
+            "partnerServiceId": "    1899",
+            "customerNo": "{index:06d}".format(index=index),
+            "virtualAccountNo": virtual_account_no(index)
+        }
+        for index in range(ROWS)
+    ]
+    with open(path, "w", newline="") as f:
+        if input_format == "csv":
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+
+
+def read_output(path: str) -> list:
+    with open(path, "r") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("input_format", ["csv", "jsonl"])
+def test_run_writes_one_record_per_row(tmp_path, input_format):
+    input_path = str(tmp_path / ("accounts." + input_format))
+    output_path = str(tmp_path / "out.jsonl")
+    write_rows(input_path, input_format)
+
+    result = VaReconciler(StubSnap(), concurrency=4).run(input_path, output_path)
+
+    records = read_output(output_path)
+    assert result == {"processed": ROWS, "skipped": 0, "failed": 6}
+    assert sorted(record["index"] for record in records) == list(range(ROWS))
+    assert records[0]["virtualAccountNo"] == virtual_account_no(records[0]["index"])
+
+
+def test_resume_from_checkpoint_after_a_crash(tmp_path):
+    input_path = str(tmp_path / "accounts.jsonl")
+    output_path = str(tmp_path / "out.jsonl")
+    checkpoint_path = str(tmp_path / "reconcile.checkpoint")
+    write_rows(input_path, "jsonl")
+
+    crashing = StubSnap(fail_on=virtual_account_no(37))
+    with pytest.raises(Exception, match="connection reset"):
+        VaReconciler(crashing, concurrency=4, checkpoint_path=checkpoint_path, checkpoint_interval=5).run(input_path, output_path)
+
+    with open(checkpoint_path, "r") as f:
+        checkpoint: dict = json.load(f)
+    assert 0 < checkpoint["completed"] <= 37
+    assert checkpoint["outputOffset"] <= os.path.getsize(output_path)
+
+    resumed = StubSnap()
+    result = VaReconciler(resumed, concurrency=4, checkpoint_path=checkpoint_path, checkpoint_interval=5).run(input_path, output_path)
+
+    records = read_output(output_path)
+    assert sorted(record["index"] for record in records) == list(range(ROWS))
+    assert result["skipped"] == checkpoint["completed"] + len(checkpoint["done"])
+    assert result["processed"] + result["skipped"] == ROWS
+    assert len(resumed.calls) == result["processed"]
+    assert virtual_account_no(0) not in resumed.calls
+    assert not os.path.exists(checkpoint_path)
+
+
+def test_rerun_without_checkpoint_overwrites_output(tmp_path):
+    input_path = str(tmp_path / "accounts.csv")
+    output_path = str(tmp_path / "out.jsonl")
+    write_rows(input_path, "csv")
+    with open(output_path, "w") as f:
+        f.write("stale\n")
+
+    VaReconciler(StubSnap(), concurrency=2).run(input_path, output_path)
+
+    assert len(read_output(output_path)) == ROWS
+
+
+def test_rejects_unknown_input_format(tmp_path):
+    input_path = str(tmp_path / "accounts.txt")
+    write_rows(input_path, "jsonl")
+
+    with pytest.raises(Exception, match="input_format"):
+        list(VaReconciler.read_rows(input_path, "xml"))
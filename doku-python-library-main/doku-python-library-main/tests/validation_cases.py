@@ -0,0 +1,141 @@
+import json
+import random
+import sys
+
+from doku_python_library.src.model.va.additional_info import AdditionalInfo
+from doku_python_library.src.model.va.check_status_va_request import CheckStatusRequest
+from doku_python_library.src.model.va.create_va_request import CreateVARequest
+from doku_python_library.src.model.va.delete_va_additional_info import DeleteVAAdditionalInfo
+from doku_python_library.src.model.va.delete_va_request import DeleteVARequest
+from doku_python_library.src.model.va.total_amount import TotalAmount
+from doku_python_library.src.model.va.update_va_additional_info import UpdateVAAdditionalInfo
+from doku_python_library.src.model.va.update_va_config import UpdateVAConfig
+from doku_python_library.src.model.va.update_va_request import UpdateVaRequest
+from doku_python_library.src.model.va.virtual_account_config import VirtualAccountConfig
+
+SEED = 7
+COUNT = 8000
+METHODS = ["validate_va_request", "validate_update_va_request", "validate_check_status_request", "validate_delete_request"]
+
+
+class CaseGenerator:
+
+    def __init__(self, seed: int = SEED) -> None:
+        self.rnd = random.Random(seed)
+
+    def pick(self, *values):
+        return self.rnd.choice(values)
+
+    def valid_or(self, valid, *invalid):
+        return valid if self.rnd.random() < 0.85 else self.pick(*invalid)
+
+    def partner_service_id(self) -> str:
+        return self.valid_or("  888994", " 888994", "888994", "12345678", "  88a994", None, "ééé88899", 888994)
+
+    def customer_no(self) -> str:
+        return self.valid_or("00000000000000000001", "1", "123456789012345678901", "12a", None, 1)
+
+    def name(self) -> str:
+        return self.valid_or("Toru Yamashita", "", "x" * 256, "Tōru", "a#b", None, 5)
+
+    def email(self) -> str:
+        return self.valid_or("toru@example.com", None, "bad", "", "é@x.com", "x" * 250 + "@x.com", 5)
+
+    def phone(self) -> str:
+        return self.valid_or("628123456789", None, "123", "1" * 31, "é23456789", 628123456789)
+
+    def trx_id(self) -> str:
+        return self.valid_or("23219829713", "", "x" * 65, None, "é", 23219829713)
+
+    def value(self) -> str:
+        return self.valid_or("10000.00", "1.0", "1" * 20, "100.0a", None, "100")
+
+    def currency(self) -> str:
+        return self.valid_or("IDR", "USD", "ID", None)
+
+    def channel(self) -> str:
+        return self.valid_or("VIRTUAL_ACCOUNT_BCA", "", "X" * 31, "NOPE", None)
+
+    def trx_type(self) -> str:
+        return self.valid_or("C", "X", "CC", None, "é")
+
+    def expired_date(self) -> str:
+        return self.valid_or("2023-01-01T10:55:00+07:00", "2023-01-01", "tomorrow", None)
+
+    def amount(self) -> str:
+        return self.valid_or(None, "10000.00", "100.00", "1.0", "1" * 20)
+
+    def virtual_account_no(self, partner_service_id: str, customer_no: str) -> str:
+        return self.valid_or(str(partner_service_id or "") + str(customer_no or ""), "x", None, "é", 1)
+
+    def request_id(self) -> str:
+        return self.valid_or(None, "abc", "x" * 129, 5)
+
+    def request(self, index: int):
+        kind: int = index % 4
+        partner_service_id, customer_no = self.partner_service_id(), self.customer_no()
+        if kind == 0:
+            return CreateVARequest(
+                partner_service_id=partner_service_id,
+                customer_no=customer_no,
+                virtual_account_no=self.virtual_account_no(partner_service_id, customer_no),
+                virtual_acc_name=self.name(),
+                virtual_acc_email=self.email(),
+                virtual_acc_phone=self.phone(),
+                trx_id=self.trx_id(),
+                total_amount=TotalAmount(self.value(), self.currency()),
+                virtual_acc_trx_type=self.trx_type(),
+                expired_date=self.expired_date(),
+                additional_info=AdditionalInfo(self.channel(), VirtualAccountConfig(self.pick(True, False, "true"), self.amount(), self.amount()))
+            )
+        if kind == 1:
+            return UpdateVaRequest(
+                partnerServiceId=partner_service_id,
+                customerNo=customer_no,
+                virtualAccountNo=self.virtual_account_no(partner_service_id, customer_no),
+                virtualAccountName=self.name(),
+                virtualAccountEmail=self.email(),
+                virtualAccountPhone=self.phone(),
+                trxId=self.trx_id(),
+                totalAmount=TotalAmount(self.value(), self.currency()),
+                virtualAccountTrxType=self.trx_type(),
+                expiredDate=self.expired_date(),
+                additionalInfo=UpdateVAAdditionalInfo(self.channel(), self.pick(None, UpdateVAConfig(
+                    self.valid_or("ACTIVE", "INACTIVE", "", "X" * 21, None, "FOO"), self.amount(), self.amount())))
+            )
+        if kind == 2:
+            return CheckStatusRequest(
+                partner_service_id=partner_service_id,
+                customer_no=customer_no,
+                virtual_acc_no=self.virtual_account_no(partner_service_id, customer_no),
+                inquiry_request_id=self.request_id(),
+                payment_request_id=self.request_id()
+            )
+        return DeleteVARequest(
+            partner_service_id=partner_service_id,
+            customer_no=customer_no,
+            virtual_acc_no=self.virtual_account_no(partner_service_id, customer_no),
+            trx_id=self.trx_id(),
+            additional_info=DeleteVAAdditionalInfo(self.channel())
+        )
+
+
+def outcome(request, method: str) -> str:
+    try:
+        getattr(request, method)()
+    except Exception as e:
+        return str(e) if type(e) is Exception else type(e).__name__ + ": " + str(e)
+    return "OK"
+
+
+def generate_outcomes(count: int = COUNT, seed: int = SEED) -> list:
+    generator = CaseGenerator(seed)
+    return [outcome(generator.request(index), METHODS[index % 4]) for index in range(count)]
+
+
+if __name__ == "__main__":
+    outcomes: dict = {}
+    for index, message in enumerate(generate_outcomes()):
+        outcomes.setdefault(message, []).append(index)
+    with open(sys.argv[1], "w") as f:
+        json.dump({"seed": SEED, "count": COUNT, "outcomes": outcomes}, f, ensure_ascii=False)